@@ -199,6 +199,29 @@ if os.getenv('CLOUDINARY_CLOUD_NAME'):
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 SITE_ID = 1
 
+# Cache for API responses, quote results and sitemaps. Entries are keyed on
+# the version counters in the database (content/versions.py), which every
+# worker shares, so a per-process LocMemCache never serves stale data; a
+# shared backend (e.g. Redis) only saves the work of filling each worker.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('DJANGO_CACHE_LOCATION', ''),
+    }
+}
+
+# Compiled ZIP coverage bitmap shared by workers via mmap (see
+# content/coverage_bitmap.py). Built by `manage.py build_coverage_bitmap`;
+# set to an empty string to disable.
+COVERAGE_BITMAP_PATH = os.getenv('COVERAGE_BITMAP_PATH', str(BASE_DIR / 'var' / 'coverage.bitmap'))
+
+# Quote impression/click logs (see content/quote_events.py), aggregated by
+# `manage.py aggregate_quote_events`; set to an empty string to disable.
+QUOTE_EVENTS_DIR = os.getenv('QUOTE_EVENTS_DIR', str(BASE_DIR / 'var' / 'quote-events'))
+
+# Public (Next.js) site whose page URLs sitemap.xml lists (see content/sitemaps.py)
+SITE_URL = os.getenv('SITE_URL', os.getenv('NEXT_PUBLIC_SITE_URL', 'http://localhost:3000')).rstrip('/')
+
 # CKEditor uploader configuration
 CKEDITOR_UPLOAD_PATH = 'uploads/'
 CKEDITOR_IMAGE_BACKEND = 'pillow'
@@ -20,13 +20,17 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.urls import include, re_path
 from django.views.static import serve
+from content import views as content_views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('ckeditor/', include('ckeditor_uploader.urls')),
     path('ckeditor5/', include('django_ckeditor_5.urls')),
     path('editorjs/', include('django_editorjs_fields.urls')),
+    path('api/v2/', include('content.urls_v2')),
     path('api/', include('content.urls')),
+    path('sitemap.xml', content_views.sitemap_index, name='sitemap_index'),
+    re_path(r'^sitemap-(?P<section>[a-z]+)-(?P<chunk>[0-9]+)\.xml$', content_views.sitemap_chunk, name='sitemap_chunk'),
     # Force serve media files in production (Render)
     re_path(r'^media/(?P<path>.*)$', serve, {
         'document_root': settings.MEDIA_ROOT,
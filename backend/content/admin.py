@@ -3,7 +3,7 @@ from django.db import models
 from django.utils.html import format_html
 from django import forms
 from adminsortable2.admin import SortableInlineAdminMixin, SortableAdminBase
-from .models import MainPage, Category, Blog, SiteConfig, HomePage, HomePageSection, VideoPlacement, ContactMessage, Page, PageSection, InsuranceCompany, InsuranceCoverage, PressLogo, TeamMember, PressItem
+from .models import MainPage, Category, Blog, SiteConfig, HomePage, HomePageSection, VideoPlacement, ContactMessage, Page, PageSection, InsuranceCompany, InsuranceCoverage, QuoteStatDaily, PressLogo, TeamMember, PressItem
 import re
 
 
@@ -571,7 +571,7 @@ class InsuranceCoverageInline(admin.TabularInline):
 
 @admin.register(InsuranceCompany)
 class InsuranceCompanyAdmin(admin.ModelAdmin):
-    list_display = ('name', 'active_states_count', 'published', 'updated_at')
+    list_display = ('name', 'active_states_count', 'covered_zips_count', 'published', 'updated_at')
     list_filter = ('published', 'updated_at', 'coverages__state_code')
     search_fields = ('name', 'short_description', 'headline')
     inlines = [InsuranceCoverageInline]
@@ -587,9 +587,20 @@ class InsuranceCompanyAdmin(admin.ModelAdmin):
         }),
     )
 
+    list_select_related = ('coverage_summary',)
+
     def active_states_count(self, obj):
-        return obj.coverages.count()
+        # Read from the materialized summary (see CompanyCoverageSummary)
+        summary = getattr(obj, 'coverage_summary', None)
+        return summary.states_count if summary else 0
     active_states_count.short_description = "Active States"
+    active_states_count.admin_order_field = 'coverage_summary__states_count'
+
+    def covered_zips_count(self, obj):
+        summary = getattr(obj, 'coverage_summary', None)
+        return summary.zip_count if summary else 0
+    covered_zips_count.short_description = "ZIPs"
+    covered_zips_count.admin_order_field = 'coverage_summary__zip_count'
 
 @admin.register(InsuranceCoverage)
 class InsuranceCoverageAdmin(admin.ModelAdmin):
@@ -603,6 +614,18 @@ class InsuranceCoverageAdmin(admin.ModelAdmin):
         return text[:50] + '...' if len(text) > 50 else text
     zip_codes_preview.short_description = "Zip Codes"
 
+@admin.register(QuoteStatDaily)
+class QuoteStatDailyAdmin(admin.ModelAdmin):
+    list_display = ('date', 'company', 'zip3', 'impressions', 'clicks')
+    list_filter = ('date', 'company')
+    search_fields = ('company__name', 'zip3')
+    date_hierarchy = 'date'
+    list_select_related = ('company',)
+
+    def has_add_permission(self, request):
+        # Rows come from `manage.py aggregate_quote_events`
+        return False
+
 @admin.register(PressLogo)
 class PressLogoAdmin(SortableAdminBase, admin.ModelAdmin):
     list_display = ('name', 'order', 'published')
@@ -0,0 +1,305 @@
+"""/api/v2/: the content API with a lean schema.
+
+Same resources as v1 (views.py), which stays as it is for existing clients:
+
+- every field appears once (v1 blog_detail sent the article HTML as both
+  ``content`` and ``content_html``);
+- HTML bodies are only sent by detail endpoints, lists carry what a card
+  shows;
+- relations are left out unless asked for with ``?include=a,b``.
+
+Blogs and categories-as-blogs are both "articles", told apart by ``kind``
+('blog' or 'guide') instead of v1's ``cat-<id>`` ids.
+"""
+from django.core.files.storage import default_storage
+from django.core.paginator import Paginator
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+
+from . import feed, search as fulltext
+from .models import (
+    ArticleFeedEntry, ArticleSlug, Blog, Category, MainPage, Page, PageSection, PressItem, RelatedArticle, TeamMember,
+)
+from .response_cache import cached_response
+from .serializers import SectionSerializer
+from .slugs import resolve as resolve_slug
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+RELATED_LIMIT = 3
+KIND_NAMES = {ArticleFeedEntry.KIND_BLOG: 'blog', ArticleFeedEntry.KIND_CATEGORY: 'guide'}
+
+ARTICLE_INCLUDES = ('related',)
+PAGE_INCLUDES = ('sections', 'team_members', 'press_items')
+TEAM_MEMBER_INCLUDES = ('page',)
+
+
+def _url_builder(request):
+    def get_absolute_url(relative_url):
+        if not relative_url:
+            return None
+        if relative_url.startswith('http'):
+            return relative_url
+        return request.build_absolute_uri(relative_url)
+    return get_absolute_url
+
+
+def _includes(request, allowed):
+    """The ?include= names that ``allowed`` knows, as a set."""
+    names = {name.strip() for name in request.GET.get('include', '').split(',')}
+    return names & set(allowed)
+
+
+def _file_url(field, get_absolute_url):
+    return get_absolute_url(field.url) if field else None
+
+
+def _person(name, image, description, get_absolute_url):
+    if not name:
+        return None
+    return {'name': name, 'image': _file_url(image, get_absolute_url), 'description': description}
+
+
+def _meta(obj):
+    return {
+        'title': obj.meta_title,
+        'description': obj.meta_description,
+        'keywords': getattr(obj, 'meta_keywords', ''),
+    }
+
+
+def article_card(entry, get_absolute_url):
+    """List/related card of an ArticleFeedEntry."""
+    return {
+        'kind': KIND_NAMES[entry.kind],
+        'id': entry.object_id,
+        'slug': entry.slug,
+        'title': entry.title,
+        'summary': entry.summary,
+        'image': get_absolute_url(default_storage.url(entry.image)) if entry.image else None,
+        'label': entry.category_name if entry.kind == ArticleFeedEntry.KIND_BLOG else (entry.label or 'Guide'),
+        'created_at': entry.created_at.isoformat() if entry.created_at else None,
+    }
+
+
+def _related(kind, object_id, parent_page_slug, get_absolute_url):
+    """Precomputed similar articles, else the newest from the same page."""
+    links = RelatedArticle.objects.filter(
+        source__kind=kind, source__object_id=object_id,
+    ).select_related('target').order_by('rank')[:RELATED_LIMIT]
+    entries = [link.target for link in links]
+    if not entries and parent_page_slug:
+        entries = ArticleFeedEntry.objects.filter(parent_page_slug=parent_page_slug).exclude(
+            kind=kind, object_id=object_id,
+        ).order_by(*feed.ORDERING)[:RELATED_LIMIT]
+    return [article_card(entry, get_absolute_url) for entry in entries]
+
+
+def _blog_article(blog, get_absolute_url):
+    return {
+        'kind': 'blog',
+        'id': blog.id,
+        'slug': blog.slug,
+        'title': blog.title,
+        'summary': blog.summary,
+        'html': blog.content_rendered or blog.content or '',
+        'toc': blog.content_toc if blog.content_rendered else None,
+        'word_count': blog.word_count,
+        'reading_time': blog.reading_time,
+        'image': _file_url(blog.hero_image, get_absolute_url),
+        'category': {'slug': blog.category.slug, 'name': blog.category.name} if blog.category else None,
+        'parent_page': blog.parent_page.slug if blog.parent_page else None,
+        'author': _person(blog.author_name, blog.author_image, blog.author_description, get_absolute_url),
+        'reviewer': _person(blog.reviewer_name, blog.reviewer_image, blog.reviewer_description, get_absolute_url),
+        'created_at': blog.created_at.isoformat() if blog.created_at else None,
+        'updated_at': blog.updated_at.isoformat() if blog.updated_at else None,
+        'meta': _meta(blog),
+    }
+
+
+def _guide_article(category, get_absolute_url):
+    return {
+        'kind': 'guide',
+        'id': category.id,
+        'slug': category.slug,
+        'title': category.blog_title or category.name,
+        'summary': category.blog_summary or '',
+        'html': category.blog_content_rendered or category.blog_content or '',
+        'toc': category.blog_content_toc if category.blog_content_rendered else None,
+        'word_count': category.blog_word_count,
+        'reading_time': category.blog_reading_time,
+        'image': None,
+        'category': {'slug': category.slug, 'name': category.name},
+        'parent_page': category.parent_page.slug if category.parent_page else None,
+        'author': _person(
+            category.blog_author_name, category.blog_author_image, category.blog_author_description, get_absolute_url,
+        ),
+        'reviewer': _person(
+            category.blog_reviewer_name, category.blog_reviewer_image, category.blog_reviewer_description,
+            get_absolute_url,
+        ),
+        'created_at': None,
+        'updated_at': None,
+        'meta': _meta(category),
+    }
+
+
+def team_member_card(member, get_absolute_url):
+    """What a team grid shows; the bio is only on the team member endpoint."""
+    return {
+        'id': member.id,
+        'slug': member.slug,
+        'name': member.name,
+        'role': member.role,
+        'image': _file_url(member.image, get_absolute_url),
+        'linkedin_url': member.linkedin_url,
+        'twitter_url': member.twitter_url,
+        'facebook_url': member.facebook_url,
+        'email': member.email,
+    }
+
+
+@never_cache
+@cached_response(ArticleFeedEntry, Blog, Category, MainPage)
+def articles(request):
+    """Article cards, newest first after the category guides (same order as v1 blogs_list).
+
+    ?page, ?page_size (at most MAX_PAGE_SIZE), ?category, ?parent_page and
+    ?search, which orders by relevance when the full-text index is there.
+    """
+    try:
+        try:
+            page_size = max(1, min(int(request.GET.get('page_size', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE))
+        except ValueError:
+            return JsonResponse({'error': 'page_size must be an integer'}, status=400)
+
+        entries = ArticleFeedEntry.objects.all()
+        category_slug = request.GET.get('category', '')
+        if category_slug:
+            entries = entries.filter(kind=ArticleFeedEntry.KIND_BLOG, category_slug=category_slug)
+        parent_page_slug = request.GET.get('parent_page', '')
+        if parent_page_slug:
+            entries = entries.filter(parent_page_slug=parent_page_slug)
+
+        ordered = entries.order_by(*feed.ORDERING)
+        search = request.GET.get('search', '')
+        if search:
+            # Best matches first with the full-text index, else a substring filter
+            ranked = fulltext.ranked(entries, search)
+            ordered = ranked if ranked is not None else ordered.filter(search_text__icontains=search)
+
+        get_absolute_url = _url_builder(request)
+        paginator = Paginator(ordered, page_size)
+        # A non-numeric ?page gives the first page, one past the end the last
+        page_obj = paginator.get_page(request.GET.get('page'))
+        return JsonResponse({
+            'results': [article_card(entry, get_absolute_url) for entry in page_obj],
+            'page': {
+                'number': page_obj.number,
+                'size': page_size,
+                'count': paginator.count,
+                'pages': paginator.num_pages,
+            },
+        })
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@never_cache
+@cached_response(ArticleSlug, Blog, Category, MainPage, ArticleFeedEntry, RelatedArticle)
+def article_detail(request, slug):
+    """One article with its HTML; ?include=related adds related article cards."""
+    try:
+        get_absolute_url = _url_builder(request)
+        route = resolve_slug(slug)
+        blog = route.blog if route else None
+        category = route.category if route else None
+        if blog is not None and blog.published:
+            article = _blog_article(blog, get_absolute_url)
+            kind, object_id = ArticleFeedEntry.KIND_BLOG, blog.id
+        elif category is not None and category.blog_published:
+            article = _guide_article(category, get_absolute_url)
+            kind, object_id = ArticleFeedEntry.KIND_CATEGORY, category.id
+        else:
+            return JsonResponse({'error': 'Article not found'}, status=404)
+
+        data = {'article': article}
+        if 'related' in _includes(request, ARTICLE_INCLUDES):
+            data['related'] = _related(kind, object_id, article['parent_page'], get_absolute_url)
+        return JsonResponse(data)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@never_cache
+@cached_response(Page, PageSection, TeamMember, PressItem)
+def page_detail(request, slug):
+    """A Page with its HTML; ?include=sections,team_members,press_items adds those.
+
+    Sections take the ?fields= / ?exclude= sparse fieldsets of serializers.py.
+    """
+    try:
+        page = Page.objects.filter(slug=slug, published=True).first()
+        if page is None:
+            return JsonResponse({'error': 'Page not found'}, status=404)
+
+        get_absolute_url = _url_builder(request)
+        data = {
+            'page': {
+                'id': page.id,
+                'slug': page.slug,
+                'title': page.title,
+                'page_type': page.page_type,
+                'html': page.content,
+                'html_bottom': page.content_bottom,
+                'image': _file_url(page.hero_image, get_absolute_url),
+                'meta': _meta(page),
+            },
+        }
+        includes = _includes(request, PAGE_INCLUDES)
+        if 'sections' in includes:
+            serializer = SectionSerializer.from_request(request, get_absolute_url)
+            data['sections'] = serializer.serialize_many(
+                serializer.only(PageSection.objects.filter(page=page).order_by('order'))
+            )
+        if 'team_members' in includes:
+            data['team_members'] = [
+                team_member_card(member, get_absolute_url)
+                for member in page.team_members.filter(published=True).order_by('order')
+            ]
+        if 'press_items' in includes:
+            data['press_items'] = [{
+                'id': item.id,
+                'title': item.title,
+                'link': item.link,
+                'logo': _file_url(item.logo, get_absolute_url),
+                'date': item.date,
+            } for item in page.press_items.filter(published=True).order_by('order', '-date')]
+        return JsonResponse(data)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@never_cache
+@cached_response(TeamMember, Page)
+def team_member_detail(request, slug):
+    """A team member with their bio; ?include=page adds the page they are listed on."""
+    try:
+        member = TeamMember.objects.select_related('page').filter(slug=slug, published=True).first()
+        if member is None:
+            return JsonResponse({'error': 'Team member not found'}, status=404)
+
+        get_absolute_url = _url_builder(request)
+        data = {
+            'team_member': {
+                **team_member_card(member, get_absolute_url),
+                'department': member.department,
+                'description': member.description,
+                'meta': _meta(member),
+            },
+        }
+        if 'page' in _includes(request, TEAM_MEMBER_INCLUDES):
+            data['page'] = {'slug': member.page.slug, 'title': member.page.title} if member.page else None
+        return JsonResponse(data)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
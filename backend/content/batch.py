@@ -0,0 +1,141 @@
+"""/api/batch/: run several read-only /api/ GETs in one round trip.
+
+Each path is resolved against content.urls (content.urls_v2 for /api/v2/)
+and its view is called in process with a GET request cloned from the batch
+request (same host, scheme and headers), so the middleware stack, the proxy
+hop and the HTTP round trip are paid once for the whole batch. Views keep
+their own decorators, so @cached_response entries are shared with direct
+requests. Conditional headers are not copied: a 304 inside a batch would
+arrive with an empty body.
+
+With ``parallel`` the views run on a small thread pool; each worker closes
+its database connections when it finishes.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import json
+from urllib.parse import unquote
+
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.http import Http404
+from django.urls import Resolver404, resolve
+
+PREFIX = '/api/'
+# (route prefix under /api, urlconf), most specific first
+URLCONFS = (('/v2/', 'content.urls_v2'), ('/', 'content.urls'))
+MAX_PATHS = 20
+MAX_WORKERS = 4
+# URL names that are not safe or useful to replay: the batch view itself,
+# writes, and the click tracker (which redirects)
+NOT_BATCHABLE = frozenset({'batch', 'contact_submit', 'quotes_bulk', 'quote_click'})
+# Request headers (WSGI keys) left out of sub-requests, which always want the full body
+DROPPED_HEADERS = frozenset({
+    'CONTENT_TYPE', 'CONTENT_LENGTH',
+    'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_IF_MATCH', 'HTTP_IF_UNMODIFIED_SINCE',
+    'HTTP_IF_RANGE', 'HTTP_RANGE',
+})
+
+
+class BatchError(ValueError):
+    """The batch itself is malformed (reported as a 400)."""
+
+
+def normalize_paths(paths):
+    """De-duplicated ``paths`` in request order; raises BatchError."""
+    if not isinstance(paths, (list, tuple)):
+        raise BatchError('paths must be a list')
+    unique = list(dict.fromkeys(str(p).strip() for p in paths if str(p).strip()))
+    if not unique:
+        raise BatchError('No paths given')
+    if len(unique) > MAX_PATHS:
+        raise BatchError(f'At most {MAX_PATHS} paths per batch')
+    for path in unique:
+        if not path.startswith(PREFIX) or '://' in path or '\\' in path:
+            raise BatchError(f'Not an {PREFIX} path: {path}')
+    return unique
+
+
+def _resolve(route):
+    for prefix, urlconf in URLCONFS:
+        if route.startswith(prefix):
+            return resolve('/' + route[len(prefix):], urlconf=urlconf)
+    raise Resolver404({'path': route})
+
+
+def _match(route):
+    """(route, ResolverMatch) for a route under /api such as ``/page/about/``."""
+    try:
+        return route, _resolve(route)
+    except Resolver404:
+        if route.endswith('/'):
+            raise
+        # The frontend often drops the trailing slash (APPEND_SLASH would redirect)
+        return route + '/', _resolve(route + '/')
+
+
+def _sub_request(request, path, query):
+    """A fresh, unconditional GET request for ``path`` carrying the batch request's headers."""
+    environ = {
+        key: value for key, value in request.META.items()
+        if not key.startswith('wsgi.') and key not in DROPPED_HEADERS
+    }
+    environ.update({
+        'REQUEST_METHOD': 'GET',
+        # WSGI carries the UTF-8 path bytes as a latin-1 string
+        'PATH_INFO': path.encode('utf-8').decode('iso-8859-1'),
+        'SCRIPT_NAME': '',
+        'QUERY_STRING': query,
+        'wsgi.input': BytesIO(b''),
+        'wsgi.url_scheme': request.scheme,
+    })
+    return WSGIRequest(environ)
+
+
+def _body(response):
+    content = b''.join(response.streaming_content) if response.streaming else response.content
+    if response.get('Content-Type', '').startswith('application/json'):
+        try:
+            return json.loads(content or b'null')
+        except ValueError:
+            pass
+    return content.decode(response.charset or 'utf-8', errors='replace')
+
+
+def run_one(request, path):
+    """``{'status', 'body'}`` for one batched ``path``."""
+    route, _, query = path.partition('?')
+    try:
+        route, match = _match('/' + unquote(route[len(PREFIX):]))
+    except Resolver404:
+        return {'status': 404, 'body': {'error': 'Not found'}}
+    if match.url_name in NOT_BATCHABLE:
+        return {'status': 400, 'body': {'error': 'Not available in a batch'}}
+
+    # Keep the full /api/ path: absolute URLs and response cache keys use it
+    sub = _sub_request(request, PREFIX.rstrip('/') + route, query)
+    sub.resolver_match = match
+    try:
+        response = match.func(sub, *match.args, **match.kwargs)
+    except Http404 as e:
+        return {'status': 404, 'body': {'error': str(e) or 'Not found'}}
+    except Exception as e:
+        return {'status': 500, 'body': {'error': str(e)}}
+    return {'status': response.status_code, 'body': _body(response)}
+
+
+def _run_in_thread(request, path):
+    try:
+        return run_one(request, path)
+    finally:
+        connections.close_all()
+
+
+def run(request, paths, parallel=False):
+    """Map each of ``paths`` (from normalize_paths) to its ``{'status', 'body'}``."""
+    if parallel and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(paths))) as pool:
+            results = list(pool.map(lambda path: _run_in_thread(request, path), paths))
+    else:
+        results = [run_one(request, path) for path in paths]
+    return dict(zip(paths, results))
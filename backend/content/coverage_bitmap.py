@@ -0,0 +1,268 @@
+"""Memory-mapped ZIP coverage bitmap shared by all worker processes.
+
+File layout (little endian):
+
+    header   MAGIC (4s) | format (H) | reserved (H) | built at, ms (Q) | coverage version (Q)
+             | company count (I) | reserved (I)
+    ids      company_count x uint64 company IDs
+    bitmaps  company_count x BITMAP_BYTES, bit ``z`` set when the company covers ZIP ``z``
+
+The file is written by ``manage.py build_coverage_bitmap`` and rewritten
+atomically once per transaction that changes coverage (see signals.py); if a
+rewrite fails the file is removed so readers fall back to the in-process
+index. Readers map it read-only and re-map when the file is replaced, so every
+gunicorn worker shares one page-cache copy and a ZIP check is a bit test.
+
+The header carries the coverage version (see versions.py) read before the
+snapshot was loaded. The file is per host while the version is shared, so a
+reader only uses the bitmap when its version is the current one; otherwise it
+falls back to the in-process index and rewrites the file in the background.
+
+Writers hold an exclusive lock on ``<path>.lock`` while they load, write and
+rename, so a slow writer can never replace a newer file with an older
+snapshot, and a writer that finds the file already at its version skips the
+rewrite.
+"""
+from contextlib import contextmanager
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writers are not serialized
+    fcntl = None
+
+from .coverage_index import VERSION_TAG, _load_companies
+from .models import ZIP_MAX
+from .versions import get_version
+
+MAGIC = b'ZCBM'
+FORMAT = 2
+HEADER = struct.Struct('<4sHHQQII')
+BITMAP_BYTES = (ZIP_MAX + 1 + 7) // 8
+
+
+def bitmap_path():
+    return getattr(settings, 'COVERAGE_BITMAP_PATH', '') or ''
+
+
+def _set_bits(buf, start, end):
+    """Set bits start..end (inclusive) in ``buf``."""
+    first_byte, last_byte = start >> 3, end >> 3
+    if first_byte == last_byte:
+        for z in range(start, end + 1):
+            buf[z >> 3] |= 1 << (z & 7)
+        return
+    for z in range(start, (first_byte + 1) << 3):
+        buf[z >> 3] |= 1 << (z & 7)
+    if last_byte - first_byte > 1:
+        buf[first_byte + 1:last_byte] = b'\xff' * (last_byte - first_byte - 1)
+    for z in range(last_byte << 3, end + 1):
+        buf[z >> 3] |= 1 << (z & 7)
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+@contextmanager
+def _write_lock(path):
+    if fcntl is None:
+        yield
+        return
+    with open(path + '.lock', 'a') as fh:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _file_version(path):
+    """Coverage version of the file at ``path``, or 0 when there is no usable file."""
+    try:
+        with open(path, 'rb') as fh:
+            magic, fmt, _, _, version, _, _ = HEADER.unpack(fh.read(HEADER.size))
+    except (OSError, struct.error):
+        return 0
+    return version if magic == MAGIC and fmt == FORMAT else 0
+
+
+def write_bitmap(path=None, min_version=None):
+    """Compile all published coverage into ``path`` atomically.
+
+    With ``min_version`` nothing is written when the current file is already
+    at that coverage version or later. Returns the number of companies
+    written, or None when skipped.
+    """
+    path = path or bitmap_path()
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with _write_lock(path):
+        if min_version is not None and _file_version(path) >= min_version:
+            return None
+        return _write_locked(path, directory)
+
+
+def _write_locked(path, directory):
+    built_at = _now_ms()
+    # Read before the snapshot: the data is at least this new, so a change
+    # racing the load leaves the file looking stale rather than current
+    version = get_version(VERSION_TAG)
+    companies = _load_companies()
+    company_ids = sorted(companies)
+    full = b'\xff' * BITMAP_BYTES
+
+    fd, tmp_path = tempfile.mkstemp(prefix='.coverage-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(HEADER.pack(MAGIC, FORMAT, 0, built_at, version, len(company_ids), 0))
+            fh.write(struct.pack(f'<{len(company_ids)}Q', *company_ids))
+            for company_id in company_ids:
+                entry = companies[company_id]
+                if entry.matches_everywhere:
+                    fh.write(full)
+                    continue
+                buf = bytearray(BITMAP_BYTES)
+                for start, end in entry.all_intervals():
+                    _set_bits(buf, max(start, 0), min(end, ZIP_MAX))
+                fh.write(buf)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(company_ids)
+
+
+class CoverageBitmap:
+    def __init__(self, path):
+        with open(path, 'rb') as fh:
+            stat = os.fstat(fh.fileno())
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        magic, fmt, _, built_at, version, count, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or fmt != FORMAT:
+            self._mm.close()
+            raise ValueError('Unrecognized coverage bitmap file')
+        self.built_at = built_at
+        self.version = version
+        self.company_ids = struct.unpack_from(f'<{count}Q', self._mm, HEADER.size)
+        self._base = HEADER.size + 8 * count
+        if len(self._mm) < self._base + count * BITMAP_BYTES:
+            self._mm.close()
+            raise ValueError('Truncated coverage bitmap file')
+
+    def lookup(self, zip_code):
+        """Return the set of published company IDs covering ``zip_code``."""
+        try:
+            z = int(str(zip_code).strip()[:5])
+        except Exception:
+            return frozenset()
+        if not 0 <= z <= ZIP_MAX:
+            return frozenset()
+        mm, mask = self._mm, 1 << (z & 7)
+        offset = self._base + (z >> 3)
+        return frozenset(
+            company_id for i, company_id in enumerate(self.company_ids)
+            if mm[offset + i * BITMAP_BYTES] & mask
+        )
+
+
+_bitmap = None
+_bitmap_lock = threading.Lock()
+_refresh_thread = None
+
+
+def _refresh(path, version):
+    try:
+        write_bitmap(path, min_version=version)
+    except Exception:
+        pass
+    finally:
+        connection.close()
+
+
+def _refresh_in_background(path, version):
+    """Rewrite a stale bitmap off the request path; one rewrite per process at a time."""
+    global _refresh_thread
+    with _bitmap_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        _refresh_thread = threading.Thread(
+            target=_refresh, args=(path, version), name='coverage-bitmap-refresh', daemon=True,
+        )
+        _refresh_thread.start()
+
+
+def _map(path):
+    global _bitmap
+    stat = os.stat(path)
+    identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    bitmap = _bitmap
+    if bitmap is None or bitmap.identity != identity:
+        with _bitmap_lock:
+            bitmap = _bitmap
+            if bitmap is None or bitmap.identity != identity:
+                # The old mapping is left to the garbage collector so
+                # concurrent readers never see a closed map.
+                bitmap = CoverageBitmap(path)
+                _bitmap = bitmap
+    return bitmap
+
+
+def get_coverage_bitmap(version=None):
+    """Return the mapped bitmap, or None when it is disabled, missing or stale.
+
+    ``version`` is the current coverage version when the caller already has
+    it. A file stamped with any other version is refreshed in the background
+    and the caller falls back to the index meanwhile.
+    """
+    path = bitmap_path()
+    if not path:
+        return None
+    try:
+        if version is None:
+            version = get_version(VERSION_TAG)
+        if not os.path.exists(path):
+            return None
+        try:
+            bitmap = _map(path)
+        except (OSError, ValueError, struct.error):
+            bitmap = None
+        if bitmap is None or bitmap.version != version:
+            _refresh_in_background(path, version)
+            return None
+        return bitmap
+    except Exception:
+        return None
+
+
+def coverage_changed():
+    """Rewrite the bitmap after a committed coverage change, if the bitmap is in use.
+
+    Skipped when another writer's snapshot already includes the change.
+    """
+    path = bitmap_path()
+    if path and os.path.exists(path):
+        try:
+            write_bitmap(path, min_version=get_version(VERSION_TAG))
+        except Exception:
+            # Never leave a stale bitmap behind; readers fall back to the index
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,271 @@
+"""Compiled in-memory index answering "which companies cover ZIP X".
+
+Coverage rules are grouped per company and state and merged into sorted,
+non-overlapping intervals. For lookups the intervals of every company are
+compiled into elementary segments (sorted boundaries plus the set of companies
+covering each segment), so a ZIP resolves with one bisect instead of
+re-parsing every InsuranceCoverage row on each request.
+
+Semantics mirror InsuranceCoverage.matches_zip and views.quotes:
+- a state-wide rule matches any ZIP;
+- a published company without any coverage rows is treated as national.
+"""
+import bisect
+import threading
+
+from .versions import get_version, bump_version
+
+VERSION_TAG = 'coverage'
+
+
+def merge_intervals(intervals):
+    """Merge overlapping or adjacent inclusive (start, end) pairs."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class CompanyCoverage:
+    """Compiled coverage rules of one published company."""
+    __slots__ = ('has_rules', 'states', 'statewide', 'ranges')
+
+    def __init__(self):
+        self.has_rules = False
+        self.states = set()      # every state with at least one rule
+        self.statewide = set()   # states with covers_entire_state
+        self.ranges = {}         # state -> merged [(start, end), ...]
+
+    @property
+    def matches_everywhere(self):
+        return not self.has_rules or bool(self.statewide)
+
+    def all_intervals(self):
+        return merge_intervals(i for ranges in self.ranges.values() for i in ranges)
+
+
+def _load_companies(company_ids=None):
+    from .models import InsuranceCompany, InsuranceCoverage, parse_zip_intervals
+
+    companies_qs = InsuranceCompany.objects.filter(published=True)
+    coverages_qs = InsuranceCoverage.objects.filter(company__published=True)
+    if company_ids is not None:
+        companies_qs = companies_qs.filter(id__in=company_ids)
+        coverages_qs = coverages_qs.filter(company_id__in=company_ids)
+
+    companies = {cid: CompanyCoverage() for cid in companies_qs.values_list('id', flat=True)}
+    raw_ranges = {}
+    rows = coverages_qs.values_list(
+        'company_id', 'state_code', 'covers_entire_state',
+        'zip_range_start', 'zip_range_end', 'zip_codes_text',
+    )
+    for company_id, state, statewide, start, end, text in rows:
+        entry = companies.get(company_id)
+        if entry is None:
+            continue
+        entry.has_rules = True
+        state = (state or '').upper()
+        entry.states.add(state)
+        if statewide:
+            entry.statewide.add(state)
+        raw_ranges.setdefault((company_id, state), []).extend(parse_zip_intervals(start, end, text))
+    for (company_id, state), intervals in raw_ranges.items():
+        if intervals:
+            companies[company_id].ranges[state] = merge_intervals(intervals)
+    return companies
+
+
+class CoverageIndex:
+    def __init__(self, companies, version=None):
+        self.version = version
+        self._companies = companies
+        self._lock = threading.Lock()
+        self._compiled = None
+        self._arrays = None
+        self._states = None
+
+    @classmethod
+    def build(cls, version=None):
+        return cls(_load_companies(), version=version)
+
+    def patch_company(self, company_id):
+        """Reload the rules of a single company (or drop it if gone/unpublished)."""
+        loaded = _load_companies([company_id])
+        with self._lock:
+            old = self._companies.get(company_id)
+            new = loaded.get(company_id)
+            if new is not None:
+                self._companies[company_id] = new
+            else:
+                self._companies.pop(company_id, None)
+            self._compiled = None
+            if self._states is not None:
+                self._states = self._patch_states(self._states, company_id, old, new)
+
+    def _compile(self):
+        always = set()
+        events = {}
+        for company_id, entry in self._companies.items():
+            if entry.matches_everywhere:
+                always.add(company_id)
+                continue
+            for start, end in entry.all_intervals():
+                events.setdefault(start, []).append((company_id, True))
+                events.setdefault(end + 1, []).append((company_id, False))
+
+        bounds, owners, interned, active = [], [], {}, set()
+        for point in sorted(events):
+            for company_id, starts in events[point]:
+                if starts:
+                    active.add(company_id)
+                else:
+                    active.discard(company_id)
+            owner = frozenset(active)
+            bounds.append(point)
+            owners.append(interned.setdefault(owner, owner))
+        return bounds, owners, frozenset(always)
+
+    def _segments(self):
+        compiled = self._compiled
+        if compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = self._compile()
+                compiled = self._compiled
+        return compiled
+
+    @staticmethod
+    def _state_keys(entry):
+        # None collects companies without rules, which quotes treats as national
+        if entry is None:
+            return {}
+        if not entry.has_rules:
+            return {None: True}
+        return {state: state in entry.statewide for state in entry.states}
+
+    def _build_states(self):
+        states = {}
+        for company_id, entry in self._companies.items():
+            for state, statewide in self._state_keys(entry).items():
+                members, whole = states.setdefault(state, (set(), set()))
+                members.add(company_id)
+                if statewide:
+                    whole.add(company_id)
+        return {state: (frozenset(m), frozenset(w)) for state, (m, w) in states.items()}
+
+    def _patch_states(self, states, company_id, old, new):
+        """Return ``states`` with one company's memberships replaced (copy on write)."""
+        states = dict(states)
+        empty = (frozenset(), frozenset())
+        for state in self._state_keys(old):
+            members, whole = states.get(state, empty)
+            states[state] = (members - {company_id}, whole - {company_id})
+        for state, statewide in self._state_keys(new).items():
+            members, whole = states.get(state, empty)
+            states[state] = (members | {company_id}, whole | {company_id} if statewide else whole)
+        return states
+
+    def _state_table(self):
+        states = self._states
+        if states is None:
+            with self._lock:
+                if self._states is None:
+                    self._states = self._build_states()
+                states = self._states
+        return states
+
+    def lookup_state(self, state_code):
+        """Return (company IDs, IDs covering the whole state) for a state.
+
+        Companies without any coverage rows are national and included in
+        every state, mirroring the per-ZIP lookup.
+        """
+        states = self._state_table()
+        empty = (frozenset(), frozenset())
+        members, whole = states.get((state_code or '').upper(), empty)
+        national, _ = states.get(None, empty)
+        return members | national, whole | national
+
+    def lookup(self, zip_code):
+        """Return the set of published company IDs covering ``zip_code``."""
+        try:
+            z = int(str(zip_code).strip()[:5])
+        except Exception:
+            return frozenset()
+        bounds, owners, always = self._segments()
+        i = bisect.bisect_right(bounds, z) - 1
+        if i < 0:
+            return always
+        return always | owners[i]
+
+    def lookup_many(self, zips):
+        """Vectorized lookup for a batch of integer ZIPs.
+
+        Returns one frozenset of company IDs per input ZIP, in input order.
+        Uses NumPy ``searchsorted`` over the segment boundaries; the union with
+        state-wide/national companies is computed once per distinct segment.
+        """
+        compiled = self._segments()
+        bounds, owners, always = compiled
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.lookup(z) for z in zips]
+
+        arrays = self._arrays
+        if arrays is None or arrays[0] is not compiled:
+            arrays = (compiled, np.asarray(bounds, dtype=np.int64))
+            self._arrays = arrays
+        positions = np.searchsorted(arrays[1], np.asarray(zips, dtype=np.int64), side='right') - 1
+        segments, inverse = np.unique(positions, return_inverse=True)
+        matched = [always | owners[i] if i >= 0 else always for i in segments.tolist()]
+        return [matched[i] for i in inverse.tolist()]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_coverage_index():
+    """Return an up-to-date index, or None when it cannot be built."""
+    global _index
+    try:
+        version = get_version(VERSION_TAG)
+        index = _index
+        if index is None or index.version != version:
+            with _index_lock:
+                index = _index
+                if index is None or index.version != version:
+                    index = CoverageIndex.build(version)
+                    _index = index
+        return index
+    except Exception:
+        return None
+
+
+def coverage_changed(company_id=None):
+    """Publish a new coverage version and patch this process's index in place.
+
+    Other processes notice the version change and rebuild on their next lookup.
+    With ``company_id=None`` (bulk imports) the local index is simply dropped.
+    """
+    global _index
+    version = bump_version(VERSION_TAG)
+    with _index_lock:
+        index = _index
+        if index is None or index.version != version - 1:
+            # Never built here, or another process moved the version as well:
+            # the next lookup rebuilds from scratch.
+            return
+        if company_id is None:
+            _index = None
+            return
+        try:
+            index.patch_company(company_id)
+            index.version = version
+        except Exception:
+            _index = None
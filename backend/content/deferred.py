@@ -0,0 +1,40 @@
+"""Coalesce after-commit work per transaction.
+
+transaction.on_commit queues one callback per call, so a loop that saves 200
+rows inside one transaction runs 200 rebuilds after it commits. on_commit_batch
+queues a single callback per ``key`` and hands it every item collected before
+the commit. Outside a transaction (autocommit) it runs at once, like on_commit.
+"""
+from django.db import transaction
+
+_ATTR = '_content_commit_batches'
+
+
+def _pending(connection, callback):
+    # Rolling back a transaction or savepoint drops its callbacks, so a batch
+    # is only open while its callback is still queued on the connection
+    return any(queued[1] is callback for queued in connection.run_on_commit)
+
+
+def on_commit_batch(key, func, items=(), robust=False, using=None):
+    """Call ``func(set_of_items)`` once after the current transaction commits.
+
+    Calls with the same ``key`` in one transaction share the callback and
+    their ``items`` are merged.
+    """
+    connection = transaction.get_connection(using)
+    batches = connection.__dict__.setdefault(_ATTR, {})
+    batch = batches.get(key)
+    if batch is not None and _pending(connection, batch[1]):
+        batch[0].update(items)
+        return
+
+    collected = set(items)
+
+    def run():
+        if batches.get(key, (None,))[0] is collected:
+            del batches[key]
+        func(collected)
+
+    batches[key] = (collected, run)
+    transaction.on_commit(run, using=using, robust=robust)
@@ -0,0 +1,220 @@
+"""Keeps ArticleFeedEntry in step with Blog, Category and MainPage, and pages it.
+
+The builders take the entry model as an argument so rebuild_article_feed can
+reuse them; migrations keep frozen copies instead of importing this module.
+"""
+import base64
+import datetime
+import html
+import json
+import re
+
+from django.db.models import Q
+from django.utils.html import strip_tags
+
+# blogs_list ordering; the cursor encodes the same key
+ORDERING = ('group', '-created_at', 'sort_name', '-object_id')
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _join(*parts):
+    return '\n'.join(part for part in parts if part)
+
+
+# Tags that separate words; strip_tags alone would glue "<h2>Head</h2><p>body"
+# into "Headbody"
+_BLOCK_TAG = re.compile(
+    r'<\s*/?\s*(?:address|article|aside|blockquote|br|dd|div|dl|dt|figcaption|figure|footer'
+    r'|h[1-6]|header|hr|li|main|nav|ol|p|pre|section|table|tbody|td|tfoot|th|thead|tr|ul)\b[^>]*>',
+    re.IGNORECASE,
+)
+
+
+def html_to_text(value):
+    """Plain text of an HTML fragment with whitespace collapsed."""
+    if not value:
+        return ''
+    return re.sub(r'\s+', ' ', html.unescape(strip_tags(_BLOCK_TAG.sub(' ', value)))).strip()
+
+
+def blog_entry(entry_model, blog):
+    category = blog.category
+    parent_page = blog.parent_page
+    return entry_model(
+        kind='blog',
+        object_id=blog.pk,
+        group=1,
+        title=blog.title or '',
+        slug=blog.slug or '',
+        summary=blog.summary,
+        image=blog.hero_image.name if blog.hero_image else '',
+        label=category.name if category else '',
+        category_id=category.pk if category else None,
+        category_name=category.name if category else '',
+        category_slug=category.slug if category else '',
+        parent_page_id=parent_page.pk if parent_page else None,
+        parent_page_name=parent_page.name if parent_page else '',
+        parent_page_slug=parent_page.slug if parent_page else '',
+        created_at=blog.created_at,
+        sort_name='',
+        search_text=_join(blog.title, blog.summary),
+        body_text=html_to_text(blog.content),
+    )
+
+
+def category_entry(entry_model, category):
+    parent_page = category.parent_page
+    return entry_model(
+        kind='category',
+        object_id=category.pk,
+        group=0,
+        title=category.blog_title or category.name,
+        slug=category.slug or '',
+        summary=category.blog_summary,
+        image='',
+        label=parent_page.name if parent_page else 'Guide',
+        category_id=category.pk,
+        category_name=category.name,
+        category_slug=category.slug or '',
+        parent_page_id=parent_page.pk if parent_page else None,
+        parent_page_name=parent_page.name if parent_page else '',
+        parent_page_slug=parent_page.slug if parent_page else '',
+        created_at=None,
+        sort_name=category.name or '',
+        search_text=_join(category.name, category.blog_title, category.blog_summary),
+        body_text=html_to_text(category.blog_content),
+    )
+
+
+UPDATE_FIELDS = [
+    'group', 'title', 'slug', 'summary', 'image', 'label',
+    'category_id', 'category_name', 'category_slug',
+    'parent_page_id', 'parent_page_name', 'parent_page_slug',
+    'created_at', 'sort_name', 'search_text', 'body_text',
+]
+
+
+def upsert_entries(entry_model, entries, batch_size=500):
+    entry_model.objects.bulk_create(
+        entries, batch_size=batch_size,
+        update_conflicts=True, unique_fields=['kind', 'object_id'], update_fields=UPDATE_FIELDS,
+    )
+
+
+def sync_blog(blog):
+    from .models import ArticleFeedEntry
+    if blog.published:
+        upsert_entries(ArticleFeedEntry, [blog_entry(ArticleFeedEntry, blog)])
+    else:
+        remove_blog(blog.pk)
+
+
+def remove_blog(blog_id):
+    from .models import ArticleFeedEntry
+    ArticleFeedEntry.objects.filter(kind='blog', object_id=blog_id).delete()
+
+
+def sync_category(category):
+    from .models import ArticleFeedEntry
+    if category.blog_published:
+        upsert_entries(ArticleFeedEntry, [category_entry(ArticleFeedEntry, category)])
+    else:
+        ArticleFeedEntry.objects.filter(kind='category', object_id=category.pk).delete()
+    # Blogs in this category show its name
+    ArticleFeedEntry.objects.filter(kind='blog', category_id=category.pk).update(
+        label=category.name, category_name=category.name, category_slug=category.slug or '',
+    )
+
+
+def remove_category(category_id):
+    from .models import ArticleFeedEntry
+    ArticleFeedEntry.objects.filter(kind='category', object_id=category_id).delete()
+    # Blog.category is SET_NULL, which updates rows without sending signals
+    ArticleFeedEntry.objects.filter(kind='blog', category_id=category_id).update(
+        label='', category_id=None, category_name='', category_slug='',
+    )
+
+
+def sync_main_page(page):
+    from .models import ArticleFeedEntry
+    ArticleFeedEntry.objects.filter(parent_page_id=page.pk).update(
+        parent_page_name=page.name, parent_page_slug=page.slug,
+    )
+    ArticleFeedEntry.objects.filter(kind='category', parent_page_id=page.pk).update(label=page.name)
+
+
+def remove_main_page(page_id):
+    from .models import ArticleFeedEntry
+    # Categories cascade (and send signals); blogs are SET_NULL without signals
+    ArticleFeedEntry.objects.filter(kind='blog', parent_page_id=page_id).update(
+        parent_page_id=None, parent_page_name='', parent_page_slug='',
+    )
+
+
+def rebuild(entry_model, blog_model, category_model, batch_size=500):
+    """Bring every feed row in line with the source tables; returns the row count.
+
+    Rows are upserted and stale ones deleted, rather than all recreated, so
+    entry ids (which RelatedArticle points at) survive a rebuild.
+    """
+    entries = [
+        blog_entry(entry_model, blog)
+        for blog in blog_model.objects.filter(published=True).select_related('category', 'parent_page')
+        .iterator(chunk_size=batch_size)
+    ]
+    entries.extend(
+        category_entry(entry_model, category)
+        for category in category_model.objects.filter(blog_published=True).select_related('parent_page')
+        .iterator(chunk_size=batch_size)
+    )
+    upsert_entries(entry_model, entries, batch_size=batch_size)
+    current = {(entry.kind, entry.object_id) for entry in entries}
+    stale = [
+        pk for pk, kind, object_id in entry_model.objects.values_list('id', 'kind', 'object_id')
+        if (kind, object_id) not in current
+    ]
+    for start in range(0, len(stale), batch_size):
+        entry_model.objects.filter(id__in=stale[start:start + batch_size]).delete()
+    return len(entries)
+
+
+def encode_cursor(entry):
+    """Opaque keyset cursor pointing just after ``entry`` in ORDERING."""
+    key = [
+        entry.group,
+        entry.created_at.isoformat() if entry.created_at else None,
+        entry.sort_name,
+        entry.object_id,
+    ]
+    raw = json.dumps(key, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        group, created_at, sort_name, object_id = json.loads(raw)
+        if created_at is not None:
+            created_at = datetime.datetime.fromisoformat(created_at)
+        return int(group), created_at, str(sort_name), int(object_id)
+    except Exception as e:
+        raise InvalidCursor('Invalid cursor') from e
+
+
+def after_cursor(entries, cursor):
+    """Filter ``entries`` to rows that follow ``cursor`` in ORDERING (a keyset seek)."""
+    group, created_at, sort_name, object_id = decode_cursor(cursor)
+    if created_at is None:
+        # Categories: no date, ordered by name
+        same_group = Q(created_at__isnull=True) & (
+            Q(sort_name__gt=sort_name) | Q(sort_name=sort_name, object_id__lt=object_id)
+        )
+    else:
+        # Blogs: newest first, i.e. (created_at, id) < cursor
+        same_group = Q(created_at__lt=created_at) | Q(created_at=created_at, sort_name__gt=sort_name) | Q(
+            created_at=created_at, sort_name=sort_name, object_id__lt=object_id,
+        )
+    return entries.filter(Q(group__gt=group) | (Q(group=group) & same_group))
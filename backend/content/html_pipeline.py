@@ -0,0 +1,206 @@
+"""Save-time post-processing of CKEditor article HTML.
+
+render_article() rewrites the HTML once so pages no longer do it in the
+browser on every render:
+
+- images get ``decoding="async"``, all but the first (often the LCP image,
+  which stays eager) ``loading="lazy"`` and ``fetchpriority="low"``, and, for
+  files in our media storage, their intrinsic width/height (no layout shift);
+- tables are wrapped in the scrollable ``ai-table-wrap`` container;
+- h2/h3 headings get ``content-<slug>`` anchors (the scheme ArticleClient
+  used) and are collected into a table of contents;
+- words are counted for a reading-time estimate.
+
+Everything else is passed through unchanged. Results are stored on Blog and
+Category by their save(); `manage.py render_article_html` backfills.
+"""
+import math
+import re
+from html import escape, unescape
+from html.parser import HTMLParser
+from urllib.parse import unquote
+
+WORDS_PER_MINUTE = 200
+TOC_LEVELS = ('h2', 'h3')
+TABLE_WRAPPER = (
+    '<div class="ai-table-wrap overflow-x-auto my-8 rounded-lg shadow-lg" '
+    'style="background: white; padding: 1rem;">'
+)
+TABLE_CLASS = 'ai-table'
+TABLE_STYLE = 'width: 100%; border-collapse: separate; border-spacing: 0;'
+FIRST_IMAGE_DEFAULTS = (('decoding', 'async'),)
+IMAGE_DEFAULTS = (('loading', 'lazy'), ('decoding', 'async'), ('fetchpriority', 'low'))
+
+
+def slugify_heading(text):
+    """Same rule as the frontend's slugify(), so existing #anchors keep working."""
+    slug = re.sub(r'[^a-z0-9\s-]', '', (text or '').lower().strip())
+    return re.sub(r'-+', '-', re.sub(r'\s+', '-', slug))
+
+
+def image_size(src):
+    """(width, height) of a media-storage image referenced by ``src``, or None."""
+    from django.conf import settings
+    from django.core.files.storage import default_storage
+
+    media_url = settings.MEDIA_URL or ''
+    if not src or not media_url or not src.startswith(media_url) or media_url.startswith('http'):
+        return None
+    try:
+        from PIL import Image
+        with default_storage.open(unquote(src[len(media_url):].split('?')[0])) as fh:
+            with Image.open(fh) as image:
+                return image.size
+    except Exception:
+        return None
+
+
+def _start_tag(tag, attrs, self_closing=False):
+    parts = [tag]
+    for name, value in attrs:
+        parts.append(name if value is None else f'{name}="{escape(value, quote=True)}"')
+    return f"<{' '.join(parts)}{' /' if self_closing else ''}>"
+
+
+def _set_attr(attrs, name, value):
+    attrs = [(key, val) for key, val in attrs if key != name]
+    attrs.append((name, value))
+    return attrs
+
+
+class _ArticleParser(HTMLParser):
+    def __init__(self, image_size):
+        super().__init__(convert_charrefs=False)
+        self.image_size = image_size
+        self.parts = []
+        self.text = []
+        self.toc = []
+        self.used_ids = set()
+        self.table_depth = 0
+        self.images = 0
+        self.heading = None  # (tag, attrs, index in parts, text chunks)
+
+    # Output and text helpers
+
+    def _text(self, value):
+        self.text.append(value)
+        if self.heading is not None:
+            self.heading[3].append(value)
+
+    def _open_heading(self, tag, attrs):
+        self.heading = (tag, attrs, len(self.parts), [])
+        self.parts.append('')  # filled in once the heading text is known
+
+    def _close_heading(self):
+        tag, attrs, index, chunks = self.heading
+        self.heading = None
+        text = re.sub(r'\s+', ' ', ''.join(chunks)).strip()
+        base = slugify_heading(text) or f"section-{len(self.toc) + 1}"
+        anchor = f"content-{base}"
+        counter = 1
+        while anchor in self.used_ids:
+            anchor = f"content-{base}-{counter}"
+            counter += 1
+        self.used_ids.add(anchor)
+        self.parts[index] = _start_tag(tag, _set_attr(attrs, 'id', anchor))
+        self.toc.append({'id': anchor, 'level': tag, 'text': text})
+
+    def _image(self, attrs):
+        present = {name for name, _ in attrs}
+        defaults = FIRST_IMAGE_DEFAULTS if self.images == 0 else IMAGE_DEFAULTS
+        self.images += 1
+        for name, value in defaults:
+            if name not in present:
+                attrs.append((name, value))
+        if not {'width', 'height'} & present:
+            size = self.image_size(dict(attrs).get('src'))
+            if size:
+                attrs += [('width', str(size[0])), ('height', str(size[1]))]
+        return attrs
+
+    # HTMLParser callbacks
+
+    def handle_starttag(self, tag, attrs, self_closing=False):
+        self.text.append(' ')
+        if tag == 'img':
+            attrs = self._image(list(attrs))
+        elif tag == 'table':
+            if self.table_depth == 0:
+                self.parts.append(TABLE_WRAPPER)
+                classes = dict(attrs).get('class') or ''
+                if TABLE_CLASS not in classes.split():
+                    attrs = _set_attr(attrs, 'class', f"{classes} {TABLE_CLASS}".strip())
+                style = dict(attrs).get('style') or ''
+                attrs = _set_attr(attrs, 'style', f"{TABLE_STYLE} {style}".strip())
+            self.table_depth += 1
+        elif tag in TOC_LEVELS and self.heading is None and not self_closing:
+            self._open_heading(tag, attrs)
+            return
+        self.parts.append(_start_tag(tag, attrs, self_closing))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, self_closing=True)
+
+    def handle_endtag(self, tag):
+        self.text.append(' ')
+        if self.heading is not None and tag == self.heading[0]:
+            self._close_heading()
+        self.parts.append(f"</{tag}>")
+        if tag == 'table' and self.table_depth:
+            self.table_depth -= 1
+            if self.table_depth == 0:
+                self.parts.append('</div>')
+
+    def handle_data(self, data):
+        self.parts.append(data)
+        if self.cdata_elem is None:
+            self._text(data)
+
+    def handle_entityref(self, name):
+        self.parts.append(f"&{name};")
+        self._text(unescape(f"&{name};"))
+
+    def handle_charref(self, name):
+        self.parts.append(f"&#{name};")
+        self._text(unescape(f"&#{name};"))
+
+    def handle_comment(self, data):
+        self.parts.append(f"<!--{data}-->")
+
+    def handle_decl(self, decl):
+        self.parts.append(f"<!{decl}>")
+
+    def handle_pi(self, data):
+        self.parts.append(f"<?{data}>")
+
+    def unknown_decl(self, data):
+        self.parts.append(f"<![{data}]>")
+
+    def finish(self):
+        self.close()
+        if self.heading is not None:
+            self._close_heading()
+        if self.table_depth:
+            self.parts.append('</div>')
+        return ''.join(self.parts)
+
+
+def render_article(value, image_size=image_size):
+    """Post-process article HTML.
+
+    Returns a dict with the rewritten ``html``, the ``toc`` list of
+    ``{'id', 'level', 'text'}``, ``word_count`` and ``reading_time`` (whole
+    minutes, at least 1 for any text).
+    """
+    if not value:
+        return {'html': '', 'toc': [], 'word_count': 0, 'reading_time': 0}
+    parser = _ArticleParser(image_size)
+    parser.feed(value)
+    rendered = parser.finish()
+    word_count = len(re.findall(r"\w+(?:['’]\w+)*", ''.join(parser.text)))
+    return {
+        'html': rendered,
+        'toc': parser.toc,
+        'word_count': word_count,
+        'reading_time': math.ceil(word_count / WORDS_PER_MINUTE) if word_count else 0,
+    }
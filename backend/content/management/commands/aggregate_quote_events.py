@@ -0,0 +1,92 @@
+import collections
+import datetime
+import json
+import os
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from content.models import InsuranceCompany, QuoteStatDaily
+from content.quote_events import CLICK, FILE_PREFIX, FILE_SUFFIX, IMPRESSION, events_dir
+
+
+class Command(BaseCommand):
+    help = "Aggregate closed quote impression/click logs into daily per-company/ZIP3 counts"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', default='', help="Log directory (defaults to settings.QUOTE_EVENTS_DIR)")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows per bulk write (default 1000)")
+        parser.add_argument('--delete', action='store_true', help="Delete logs after aggregating instead of moving them to processed/")
+
+    def handle(self, *args, **options):
+        directory = options['dir'] or events_dir()
+        if not directory or not os.path.isdir(directory):
+            self.stdout.write(self.style.WARNING("No quote event directory; nothing to aggregate."))
+            return
+
+        # Today's files are still being appended to by the web workers
+        today = datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+        paths = []
+        for name in sorted(os.listdir(directory)):
+            if not (name.startswith(FILE_PREFIX) and name.endswith(FILE_SUFFIX)):
+                continue
+            day = name[len(FILE_PREFIX):len(FILE_PREFIX) + 10]
+            if day < today:
+                paths.append(os.path.join(directory, name))
+        if not paths:
+            self.stdout.write("No closed quote event logs to aggregate.")
+            return
+
+        counts = collections.defaultdict(lambda: [0, 0])
+        skipped = 0
+        for path in paths:
+            with open(path, encoding='utf-8') as fh:
+                for line in fh:
+                    try:
+                        event = json.loads(line)
+                        day = datetime.datetime.fromtimestamp(event['ts'], datetime.timezone.utc).date()
+                        slot = 0 if event['type'] == IMPRESSION else 1 if event['type'] == CLICK else None
+                        if slot is None:
+                            raise ValueError(event['type'])
+                        for company_id in event['companies']:
+                            counts[(day, int(company_id), str(event.get('zip3') or '')[:3])][slot] += 1
+                    except (ValueError, KeyError, TypeError):
+                        skipped += 1
+
+        known = set(InsuranceCompany.objects.filter(
+            id__in={company_id for _, company_id, _ in counts}
+        ).values_list('id', flat=True))
+        counts = {key: value for key, value in counts.items() if key[1] in known}
+
+        created = updated = 0
+        with transaction.atomic():
+            existing = {}
+            for stat in QuoteStatDaily.objects.filter(date__in={day for day, _, _ in counts}).select_for_update():
+                existing[(stat.date, stat.company_id, stat.zip3)] = stat
+            to_create, to_update = [], []
+            for (day, company_id, zip3), (impressions, clicks) in counts.items():
+                stat = existing.get((day, company_id, zip3))
+                if stat is None:
+                    to_create.append(QuoteStatDaily(
+                        date=day, company_id=company_id, zip3=zip3, impressions=impressions, clicks=clicks,
+                    ))
+                else:
+                    stat.impressions += impressions
+                    stat.clicks += clicks
+                    to_update.append(stat)
+            QuoteStatDaily.objects.bulk_create(to_create, batch_size=options['batch_size'])
+            QuoteStatDaily.objects.bulk_update(to_update, ['impressions', 'clicks'], batch_size=options['batch_size'])
+            created, updated = len(to_create), len(to_update)
+
+            # Retire the logs in the same unit of work so a rerun never double counts them
+            processed_dir = os.path.join(directory, 'processed')
+            for path in paths:
+                if options['delete']:
+                    os.unlink(path)
+                else:
+                    os.makedirs(processed_dir, exist_ok=True)
+                    os.replace(path, os.path.join(processed_dir, os.path.basename(path)))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Aggregated {len(paths)} log files: created={created}, updated={updated}, skipped_lines={skipped}"
+        ))
@@ -0,0 +1,147 @@
+import json
+import os
+import random
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import override_settings
+from django.core.cache import cache
+
+from content import quote_cache, views
+from content.coverage_bitmap import get_coverage_bitmap
+from content.coverage_index import get_coverage_index
+from content.models import InsuranceCompany, ZIP_MAX
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class QueryCounter:
+    """connection.execute_wrapper that counts queries.
+
+    CaptureQueriesContext reads connection.queries, which the test client's
+    request_started signal resets, so it reported 0 for view calls.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = "Time the quotes lookup paths and view calls; report p50/p95/p99 and query counts"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200, help="Timed calls per benchmark (default 200)")
+        parser.add_argument('--batch', type=int, default=1000, help="ZIPs per multi-ZIP call (default 1000)")
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--only', default='', help="Comma-separated benchmark names to run")
+        parser.add_argument('--baseline', default=os.path.join(settings.BASE_DIR, 'var', 'quotes-benchmark.json'),
+                            help="Baseline JSON file")
+        parser.add_argument('--save', action='store_true', help="Write the results as the new baseline")
+        parser.add_argument('--compare', action='store_true', help="Show the change against the saved baseline")
+
+    def handle(self, *args, **options):
+        # Keep benchmark traffic out of the impression/click logs
+        with override_settings(QUOTE_EVENTS_DIR=''):
+            self._run(options)
+
+    def _run(self, options):
+        if not InsuranceCompany.objects.filter(published=True).exists():
+            raise CommandError("No published companies; run generate_coverage_data first")
+
+        rng = random.Random(options['seed'])
+        iterations = max(1, options['iterations'])
+        zips = [f"{rng.randint(0, ZIP_MAX):05d}" for _ in range(iterations)]
+        batch = [f"{rng.randint(0, ZIP_MAX):05d}" for _ in range(options['batch'])]
+        companies_qs = InsuranceCompany.objects.filter(published=True).order_by('-rating', 'name')
+        client = Client()
+        factory = RequestFactory()
+
+        def uncached_view(zip_code):
+            # Drop the result-cache entry so the full path runs every time
+            cache.delete(quote_cache.cache_key(factory.get('/api/quotes/'), zip_code))
+            return client.get('/api/quotes/', {'zip': zip_code})
+
+        index = get_coverage_index()
+        bitmap = get_coverage_bitmap()
+        benchmarks = [
+            ('index_lookup', index and (lambda z: index.lookup(z)), zips),
+            ('bitmap_lookup', bitmap and (lambda z: bitmap.lookup(z)), zips),
+            ('sql_range_lookup', lambda z: views._match_companies_by_zip_ranges(companies_qs, z), zips),
+            ('matches_zip_loop', lambda z: views._match_companies_by_loop(companies_qs, z), zips[:max(1, iterations // 10)]),
+            ('index_lookup_many', index and (lambda _: index.lookup_many([int(z) for z in batch])), range(max(1, iterations // 10))),
+            ('view_quotes_cached', lambda _: client.get('/api/quotes/', {'zip': zips[0]}), range(iterations)),
+            ('view_quotes_uncached', uncached_view, zips),
+            ('view_quotes_bulk', lambda _: client.post('/api/quotes/bulk/', json.dumps({'zips': batch}),
+                                                       content_type='application/json'),
+             range(max(1, iterations // 10))),
+        ]
+        only = {name.strip() for name in options['only'].split(',') if name.strip()}
+
+        results = {}
+        for name, func, inputs in benchmarks:
+            if only and name not in only:
+                continue
+            if func is None:
+                self.stdout.write(f"{name:<22} skipped (not available)")
+                continue
+            inputs = list(inputs)
+            func(inputs[0])  # warm up
+            counter = QueryCounter()
+            with connection.execute_wrapper(counter):
+                func(inputs[0])
+            timings = []
+            for value in inputs:
+                started = time.perf_counter()
+                func(value)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            results[name] = {
+                'calls': len(timings),
+                'p50_ms': round(percentile(timings, 50), 4),
+                'p95_ms': round(percentile(timings, 95), 4),
+                'p99_ms': round(percentile(timings, 99), 4),
+                'queries': counter.count,
+            }
+
+        baseline = {}
+        if options['compare']:
+            try:
+                with open(options['baseline'], encoding='utf-8') as fh:
+                    baseline = json.load(fh).get('results', {})
+            except (OSError, ValueError):
+                self.stdout.write(self.style.WARNING(f"No baseline at {options['baseline']}"))
+
+        self.stdout.write(f"{'benchmark':<22} {'calls':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'queries':>8}")
+        for name, row in results.items():
+            line = (f"{name:<22} {row['calls']:>6} {row['p50_ms']:>10.3f} {row['p95_ms']:>10.3f} "
+                    f"{row['p99_ms']:>10.3f} {row['queries']:>8}")
+            base = baseline.get(name)
+            if base and base.get('p50_ms'):
+                change = (row['p50_ms'] - base['p50_ms']) / base['p50_ms'] * 100
+                line += f"   p50 {change:+.1f}% vs baseline, queries {base['queries']} -> {row['queries']}"
+            self.stdout.write(line)
+
+        if options['save']:
+            os.makedirs(os.path.dirname(os.path.abspath(options['baseline'])), exist_ok=True)
+            with open(options['baseline'], 'w', encoding='utf-8') as fh:
+                json.dump({
+                    'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                    'companies': companies_qs.count(),
+                    'iterations': iterations,
+                    'batch': options['batch'],
+                    'results': results,
+                }, fh, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Saved baseline to {options['baseline']}"))
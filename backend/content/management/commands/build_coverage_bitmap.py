@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from content.coverage_bitmap import bitmap_path, write_bitmap
+
+
+class Command(BaseCommand):
+    help = "Compile insurance coverage into the memory-mapped ZIP bitmap used by the quotes API"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='', help="Output file (defaults to settings.COVERAGE_BITMAP_PATH)")
+
+    def handle(self, *args, **options):
+        path = options['path'] or bitmap_path()
+        if not path:
+            self.stdout.write(self.style.WARNING("COVERAGE_BITMAP_PATH is empty; nothing to build."))
+            return
+        count = write_bitmap(path)
+        self.stdout.write(self.style.SUCCESS(f"Wrote coverage bitmap for {count} companies to {path}"))
@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from content import related
+
+
+class Command(BaseCommand):
+    help = "Recompute the RelatedArticle table (TF-IDF similarity between published articles)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=related.TOP_K, help="Related articles stored per article")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        articles, links = related.rebuild(k=options['top_k'])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Computed {links} related links for {articles} articles in {elapsed:.2f}s"
+        ))
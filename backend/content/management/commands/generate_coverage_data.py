@@ -0,0 +1,86 @@
+import random
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from content.models import CompanyCoverageSummary, InsuranceCompany, InsuranceCoverage, InsuranceCoverageZipRange, US_STATES, ZIP_MAX
+from content.signals import coverage_changed_on_commit
+
+
+SLUG_PREFIX = 'bench-'
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic insurance companies and coverage rules for benchmarking the quotes path"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--companies', type=int, default=200, help="Number of companies (default 200)")
+        parser.add_argument('--rules', type=int, default=50, help="Coverage rules per company (default 50)")
+        parser.add_argument('--statewide-share', type=float, default=0.05, help="Share of state-wide rules (default 0.05)")
+        parser.add_argument('--list-share', type=float, default=0.45, help="Share of explicit ZIP-list rules (default 0.45)")
+        parser.add_argument('--seed', type=int, default=1, help="Random seed (default 1)")
+        parser.add_argument('--clear', action='store_true', help=f"Delete previously generated '{SLUG_PREFIX}*' companies first")
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        states = [code for code, _ in US_STATES]
+        statewide_share = options['statewide_share']
+        list_share = options['list_share']
+
+        with transaction.atomic():
+            if options['clear']:
+                deleted, _ = InsuranceCompany.objects.filter(slug__startswith=SLUG_PREFIX).delete()
+                self.stdout.write(f"Deleted {deleted} previously generated rows")
+
+            offset = InsuranceCompany.objects.filter(slug__startswith=SLUG_PREFIX).count()
+            companies = InsuranceCompany.objects.bulk_create([
+                InsuranceCompany(
+                    name=f"Bench Insurance {offset + i:05d}",
+                    slug=f"{SLUG_PREFIX}{offset + i:05d}",
+                    rating=round(rng.uniform(3.0, 5.0), 1),
+                    short_description="Synthetic company for benchmarks",
+                    landing_url="https://example.com/quote",
+                    published=True,
+                )
+                for i in range(options['companies'])
+            ], batch_size=options['batch_size'])
+            if not all(company.pk for company in companies):
+                companies = list(InsuranceCompany.objects.filter(slug__in=[c.slug for c in companies]))
+
+            coverages = []
+            for company in companies:
+                for _ in range(options['rules']):
+                    roll = rng.random()
+                    cov = InsuranceCoverage(company_id=company.pk, state_code=rng.choice(states))
+                    if roll < statewide_share:
+                        cov.covers_entire_state = True
+                    elif roll < statewide_share + list_share:
+                        tokens = []
+                        for _ in range(rng.randint(1, 20)):
+                            start = rng.randint(0, ZIP_MAX)
+                            if rng.random() < 0.3:
+                                tokens.append(f"{start:05d}-{min(start + rng.randint(1, 200), ZIP_MAX):05d}")
+                            else:
+                                tokens.append(f"{start:05d}")
+                        cov.zip_codes_text = ', '.join(tokens)
+                    else:
+                        start = rng.randint(0, ZIP_MAX)
+                        cov.zip_range_start = start
+                        cov.zip_range_end = min(start + rng.randint(10, 5000), ZIP_MAX)
+                    coverages.append(cov)
+
+            coverages = InsuranceCoverage.objects.bulk_create(coverages, batch_size=options['batch_size'])
+            if not all(cov.pk for cov in coverages):
+                coverages = list(InsuranceCoverage.objects.filter(company__in=companies))
+            ranges = InsuranceCoverageZipRange.objects.bulk_create(
+                [zr for cov in coverages for zr in cov.zip_range_rows()], batch_size=options['batch_size'],
+            )
+            CompanyCoverageSummary.refresh(company.pk for company in companies)
+            # bulk_create bypasses save() signals; shares the one refresh the
+            # --clear cascade already queued
+            coverage_changed_on_commit()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {len(companies)} companies, {len(coverages)} coverage rules, {len(ranges)} ZIP ranges"
+        ))
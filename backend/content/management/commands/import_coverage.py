@@ -0,0 +1,247 @@
+import csv
+import json
+import re
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from content.coverage_index import merge_intervals
+from content.models import (
+    CompanyCoverageSummary, InsuranceCompany, InsuranceCoverage, InsuranceCoverageZipRange, US_STATES, ZIP_MAX,
+)
+from content.signals import coverage_changed_on_commit
+
+
+STATE_CODES = {code for code, _ in US_STATES}
+TRUE_VALUES = ('1', 'true', 'yes', 'y', 'on')
+
+
+class RowError(ValueError):
+    pass
+
+
+def _parse_zip(value, field):
+    value = str(value).strip()
+    if not value:
+        return None
+    if not value.isdigit() or int(value) > ZIP_MAX:
+        raise RowError(f"{field} must be a ZIP code, got {value!r}")
+    return int(value)
+
+
+def _normalize_zip_text(text):
+    """Validate a free-text ZIP list and return it as merged 'a-b, c' tokens."""
+    intervals = []
+    for part in re.split(r"[\s,]+", text or ''):
+        if not part:
+            continue
+        q = part.replace('–', '-').replace('—', '-')
+        m = re.match(r"^(\d{5})-(\d{5})$", q)
+        if m:
+            start, end = int(m.group(1)), int(m.group(2))
+            if start > end:
+                start, end = end, start
+        elif re.match(r"^\d{5}$", q):
+            start = end = int(q)
+        else:
+            raise RowError(f"Invalid ZIP or range {part!r}")
+        intervals.append((start, end))
+    return ', '.join(
+        f"{start:05d}" if start == end else f"{start:05d}-{end:05d}"
+        for start, end in merge_intervals(intervals)
+    )
+
+
+def normalize_row(row):
+    """Return (company key, field dict) for one input record."""
+    company = str(row.get('company') or row.get('company_slug') or row.get('company_name') or '').strip()
+    if not company:
+        raise RowError("Missing company")
+    state = str(row.get('state_code') or row.get('state') or '').strip().upper()
+    if state not in STATE_CODES:
+        raise RowError(f"Unknown state {state!r}")
+
+    statewide = row.get('covers_entire_state', False)
+    if not isinstance(statewide, bool):
+        statewide = str(statewide or '').strip().lower() in TRUE_VALUES
+
+    start = _parse_zip(row.get('zip_range_start') or '', 'zip_range_start')
+    end = _parse_zip(row.get('zip_range_end') or '', 'zip_range_end')
+    if start is not None and end is not None and start > end:
+        start, end = end, start
+    zip_text = row.get('zip_codes_text', row.get('zip_codes', '')) or ''
+    if isinstance(zip_text, list):
+        zip_text = ' '.join(str(z) for z in zip_text)
+    zip_text = _normalize_zip_text(str(zip_text))
+
+    if not statewide and start is None and end is None and not zip_text:
+        raise RowError("Row covers no ZIPs (set covers_entire_state, a range or zip_codes_text)")
+
+    return company, {
+        'state_code': state,
+        'covers_entire_state': statewide,
+        'zip_range_start': start,
+        'zip_range_end': end,
+        'zip_codes_text': zip_text,
+        'notes': str(row.get('notes') or '')[:255],
+    }
+
+
+def _coverage_key(company_id, fields):
+    return (company_id, fields['state_code'], fields['zip_range_start'], fields['zip_range_end'], fields['zip_codes_text'])
+
+
+class Command(BaseCommand):
+    help = "Stream insurance coverage rules from a CSV or NDJSON file and bulk-write them"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV/NDJSON file, or '-' for stdin")
+        parser.add_argument('--format', choices=('csv', 'ndjson'), help="Input format (default: from file extension)")
+        parser.add_argument('--batch-size', type=int, default=2000, help="Rows per bulk write (default 2000)")
+        parser.add_argument('--dry-run', action='store_true', help="Validate and write inside a transaction, then roll back")
+        parser.add_argument('--replace-company', action='store_true',
+                            help="Delete existing coverages of every company in the file before importing")
+        parser.add_argument('--max-errors', type=int, default=100, help="Abort after this many invalid rows")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('ndjson' if path.endswith(('.ndjson', '.jsonl')) else 'csv')
+        batch_size = max(1, options['batch_size'])
+
+        self.created = self.updated = self.deleted = self.errors = 0
+        self.max_errors = options['max_errors']
+        self.replace = options['replace_company']
+        self.replaced_companies = set()
+        self.touched_companies = set()
+        # Coverage rows by _coverage_key, loaded once per company and kept in
+        # step with what later batches create
+        self.existing = {}
+        self.loaded_companies = set()
+        self.companies = {}
+        for company_id, slug, name in InsuranceCompany.objects.values_list('id', 'slug', 'name'):
+            self.companies[slug.lower()] = company_id
+            self.companies.setdefault(name.strip().lower(), company_id)
+
+        started = time.monotonic()
+        rows = 0
+        handle = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        try:
+            with transaction.atomic():
+                batch = []
+                for line_no, record in self._records(handle, fmt):
+                    rows += 1
+                    try:
+                        company_key, fields = normalize_row(record)
+                        company_id = self.companies.get(company_key.lower())
+                        if company_id is None:
+                            raise RowError(f"Unknown company {company_key!r}")
+                    except RowError as e:
+                        self._row_error(line_no, e)
+                        continue
+                    batch.append((company_id, fields))
+                    if len(batch) >= batch_size:
+                        self._write_batch(batch)
+                        batch = []
+                        if options['verbosity'] > 1:
+                            self.stdout.write(f"  {rows} rows read")
+                if batch:
+                    self._write_batch(batch)
+                CompanyCoverageSummary.refresh(self.touched_companies)
+
+                if options['dry_run']:
+                    transaction.set_rollback(True)
+                elif self.touched_companies:
+                    # bulk_create/bulk_update bypass save() signals; shares the
+                    # one refresh the --replace-company deletes already queued
+                    coverage_changed_on_commit()
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        prefix = "[dry run] " if options['dry_run'] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}Imported {rows} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s): "
+            f"created={self.created}, updated={self.updated}, deleted={self.deleted}, errors={self.errors}"
+        ))
+
+    def _records(self, handle, fmt):
+        if fmt == 'csv':
+            reader = csv.DictReader(handle)
+            for record in reader:
+                yield reader.line_num, record
+            return
+        for line_no, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                self._row_error(line_no, e)
+                continue
+            if not isinstance(record, dict):
+                self._row_error(line_no, "Expected a JSON object")
+                continue
+            yield line_no, record
+
+    def _row_error(self, line_no, error):
+        self.errors += 1
+        self.stderr.write(f"line {line_no}: {error}")
+        if self.errors >= self.max_errors:
+            raise CommandError(f"Aborting after {self.errors} invalid rows")
+
+    def _write_batch(self, batch):
+        company_ids = {company_id for company_id, _ in batch}
+        self.touched_companies |= company_ids
+
+        if self.replace:
+            fresh = company_ids - self.replaced_companies
+            if fresh:
+                _, deleted = InsuranceCoverage.objects.filter(company_id__in=fresh).delete()
+                self.deleted += deleted.get(InsuranceCoverage._meta.label, 0)
+                self.replaced_companies |= fresh
+                # Nothing left to load for them
+                self.loaded_companies |= fresh
+
+        unloaded = company_ids - self.loaded_companies
+        if unloaded:
+            for cov in InsuranceCoverage.objects.filter(company_id__in=unloaded):
+                self.existing[_coverage_key(cov.company_id, {
+                    'state_code': cov.state_code,
+                    'zip_range_start': cov.zip_range_start,
+                    'zip_range_end': cov.zip_range_end,
+                    'zip_codes_text': cov.zip_codes_text,
+                })] = cov
+            self.loaded_companies |= unloaded
+        existing = self.existing
+
+        to_create, to_update = {}, {}
+        for company_id, fields in batch:
+            key = _coverage_key(company_id, fields)
+            cov = existing.get(key) or to_create.get(key)
+            if cov is None:
+                to_create[key] = InsuranceCoverage(company_id=company_id, **fields)
+                continue
+            cov.covers_entire_state = fields['covers_entire_state']
+            cov.notes = fields['notes']
+            if cov.pk:
+                to_update[cov.pk] = cov
+
+        created = InsuranceCoverage.objects.bulk_create(to_create.values(), batch_size=len(to_create) or None)
+        for key, cov in to_create.items():
+            if cov.pk:
+                existing[key] = cov
+            else:
+                # Backend did not return ids: reload this company next time
+                self.loaded_companies.discard(key[0])
+        if to_update:
+            InsuranceCoverage.objects.bulk_update(to_update.values(), ['covers_entire_state', 'notes'])
+            InsuranceCoverageZipRange.objects.filter(coverage_id__in=to_update).delete()
+        InsuranceCoverageZipRange.objects.bulk_create(
+            [zr for cov in [*created, *to_update.values()] for zr in cov.zip_range_rows()]
+        )
+        self.created += len(created)
+        self.updated += len(to_update)
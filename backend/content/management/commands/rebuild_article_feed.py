@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from content import feed, response_cache
+from content.models import ArticleFeedEntry, Blog, Category
+
+
+class Command(BaseCommand):
+    help = "Rebuild the ArticleFeedEntry table used by the blogs list from Blog and Category"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = feed.rebuild(ArticleFeedEntry, Blog, Category)
+            response_cache.models_changed(ArticleFeedEntry)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt article feed with {count} entries"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from content import response_cache, slugs
+from content.models import ArticleSlug, Blog, Category
+
+
+class Command(BaseCommand):
+    help = "Rebuild the ArticleSlug registry used by /api/blogs/<slug>/ from Blog and Category"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = slugs.rebuild(ArticleSlug, Blog, Category)
+            response_cache.models_changed(ArticleSlug)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt article slug registry with {count} entries"))
@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from content import response_cache
+from content.models import Blog, Category
+
+
+class Command(BaseCommand):
+    help = "Run the article HTML pipeline over every Blog and Category and store the derived columns"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200)
+        parser.add_argument('--only-missing', action='store_true', help="Skip articles that already have rendered HTML")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        started = time.perf_counter()
+        for model, source, rendered_field in (
+            (Blog, 'content', 'content_rendered'),
+            (Category, 'blog_content', 'blog_content_rendered'),
+        ):
+            queryset = model.objects.only('id', source).order_by('id')
+            if options['only_missing']:
+                queryset = queryset.filter(**{rendered_field: ''}).exclude(**{f'{source}__isnull': True}).exclude(**{source: ''})
+
+            count = 0
+            batch = []
+            for instance in queryset.iterator(chunk_size=batch_size):
+                instance.render_content()
+                batch.append(instance)
+                if len(batch) >= batch_size:
+                    count += self._flush(model, batch)
+            count += self._flush(model, batch)
+            self.stdout.write(f"{model._meta.verbose_name_plural}: rendered {count}")
+
+        response_cache.models_changed(Blog, Category)
+        self.stdout.write(self.style.SUCCESS(f"Done in {time.perf_counter() - started:.2f}s"))
+
+    def _flush(self, model, batch):
+        # bulk_update sends no signals; the derived columns feed nothing else
+        model.objects.bulk_update(batch, model.RENDERED_FIELDS)
+        count = len(batch)
+        batch.clear()
+        return count
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0071_alter_insurancecoverage_state_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InsuranceCoverageZipRange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start', models.PositiveIntegerField()),
+                ('end', models.PositiveIntegerField()),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='zip_ranges', to='content.insurancecompany')),
+                ('coverage', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='zip_ranges', to='content.insurancecoverage')),
+            ],
+            options={
+                'verbose_name': 'Insurance Coverage ZIP Range',
+                'verbose_name_plural': 'Insurance Coverage ZIP Ranges',
+                'indexes': [models.Index(fields=['start', 'end'], name='content_ins_start_92deab_idx')],
+            },
+        ),
+    ]
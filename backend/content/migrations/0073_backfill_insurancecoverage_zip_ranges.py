@@ -0,0 +1,93 @@
+import re
+
+from django.db import migrations
+
+# Frozen copies of content.models.normalized_zip_ranges and its helpers as of
+# this migration, so later changes to them cannot change what it backfills
+ZIP_MIN = 0
+ZIP_MAX = 99999
+
+
+def _parse_zip_intervals(zip_range_start=None, zip_range_end=None, zip_codes_text=''):
+    intervals = []
+    if zip_range_start or zip_range_end:
+        try:
+            start = int(zip_range_start) if zip_range_start is not None else None
+            end = int(zip_range_end) if zip_range_end is not None else None
+            if start is not None and end is not None:
+                if start > end:
+                    start, end = end, start
+                intervals.append((start, end))
+            elif start is not None:
+                intervals.append((start, start))
+            elif end is not None:
+                intervals.append((end, end))
+        except Exception:
+            pass
+    if (zip_codes_text or '').strip():
+        parts = [p.strip() for p in re.split(r"[\s,]+", zip_codes_text) if p.strip()]
+        for p in parts:
+            q = p.replace('–', '-').replace('—', '-')
+            q = re.sub(r"[^0-9-]", "", q)
+            m = re.match(r"^\s*(\d{5})\s*-\s*(\d{5})\s*$", q)
+            if m:
+                start = int(m.group(1))
+                end = int(m.group(2))
+                if start <= end:
+                    intervals.append((start, end))
+            elif q.isdigit():
+                intervals.append((int(q), int(q)))
+    return intervals
+
+
+def _merge_intervals(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _normalized_zip_ranges(covers_entire_state, zip_range_start=None, zip_range_end=None, zip_codes_text=''):
+    if covers_entire_state:
+        return [(ZIP_MIN, ZIP_MAX)]
+    return _merge_intervals(_parse_zip_intervals(zip_range_start, zip_range_end, zip_codes_text))
+
+
+def backfill_zip_ranges(apps, schema_editor):
+    InsuranceCoverage = apps.get_model('content', 'InsuranceCoverage')
+    InsuranceCoverageZipRange = apps.get_model('content', 'InsuranceCoverageZipRange')
+
+    InsuranceCoverageZipRange.objects.all().delete()
+    batch = []
+    for cov in InsuranceCoverage.objects.all().iterator():
+        intervals = _normalized_zip_ranges(
+            cov.covers_entire_state, cov.zip_range_start, cov.zip_range_end, cov.zip_codes_text,
+        )
+        for start, end in intervals:
+            batch.append(InsuranceCoverageZipRange(
+                coverage_id=cov.pk, company_id=cov.company_id, start=start, end=end,
+            ))
+        if len(batch) >= 1000:
+            InsuranceCoverageZipRange.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        InsuranceCoverageZipRange.objects.bulk_create(batch)
+
+
+def clear_zip_ranges(apps, schema_editor):
+    InsuranceCoverageZipRange = apps.get_model('content', 'InsuranceCoverageZipRange')
+    InsuranceCoverageZipRange.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('content', '0072_insurancecoverageziprange'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_zip_ranges, clear_zip_ranges),
+    ]
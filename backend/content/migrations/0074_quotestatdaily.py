@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0073_backfill_insurancecoverage_zip_ranges'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuoteStatDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('zip3', models.CharField(blank=True, default='', max_length=3)),
+                ('impressions', models.PositiveIntegerField(default=0)),
+                ('clicks', models.PositiveIntegerField(default=0)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='content.insurancecompany')),
+            ],
+            options={
+                'verbose_name': 'Quote Daily Stat',
+                'verbose_name_plural': 'Quote Daily Stats',
+                'ordering': ['-date', 'company'],
+                'constraints': [models.UniqueConstraint(fields=('date', 'company', 'zip3'), name='quote_stat_daily_unique')],
+            },
+        ),
+    ]
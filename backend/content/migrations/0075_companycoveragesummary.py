@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0074_quotestatdaily'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyCoverageSummary',
+            fields=[
+                ('company', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='coverage_summary', serialize=False, to='content.insurancecompany')),
+                ('states', models.JSONField(blank=True, default=list)),
+                ('statewide_states', models.JSONField(blank=True, default=list)),
+                ('states_count', models.PositiveIntegerField(default=0)),
+                ('zip_count', models.PositiveIntegerField(default=0)),
+                ('zip_ranges', models.JSONField(blank=True, default=list, help_text='Merged [start, end] ZIP pairs')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Company Coverage Summary',
+                'verbose_name_plural': 'Company Coverage Summaries',
+            },
+        ),
+    ]
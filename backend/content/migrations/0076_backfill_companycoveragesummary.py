@@ -0,0 +1,102 @@
+import re
+
+from django.db import migrations
+
+# Frozen copy of content.models.summarize_coverage and its helpers as of this
+# migration, so later changes to them cannot change what it backfills
+
+
+def _parse_zip_intervals(zip_range_start=None, zip_range_end=None, zip_codes_text=''):
+    intervals = []
+    if zip_range_start or zip_range_end:
+        try:
+            start = int(zip_range_start) if zip_range_start is not None else None
+            end = int(zip_range_end) if zip_range_end is not None else None
+            if start is not None and end is not None:
+                if start > end:
+                    start, end = end, start
+                intervals.append((start, end))
+            elif start is not None:
+                intervals.append((start, start))
+            elif end is not None:
+                intervals.append((end, end))
+        except Exception:
+            pass
+    if (zip_codes_text or '').strip():
+        parts = [p.strip() for p in re.split(r"[\s,]+", zip_codes_text) if p.strip()]
+        for p in parts:
+            q = p.replace('–', '-').replace('—', '-')
+            q = re.sub(r"[^0-9-]", "", q)
+            m = re.match(r"^\s*(\d{5})\s*-\s*(\d{5})\s*$", q)
+            if m:
+                start = int(m.group(1))
+                end = int(m.group(2))
+                if start <= end:
+                    intervals.append((start, end))
+            elif q.isdigit():
+                intervals.append((int(q), int(q)))
+    return intervals
+
+
+def _merge_intervals(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _summarize_coverage(rows):
+    states, statewide, intervals = set(), set(), []
+    for state, covers_entire_state, start, end, text in rows:
+        state = (state or '').upper()
+        states.add(state)
+        if covers_entire_state:
+            statewide.add(state)
+        intervals.extend(_parse_zip_intervals(start, end, text))
+    merged = _merge_intervals(intervals)
+    return {
+        'states': sorted(states),
+        'statewide_states': sorted(statewide),
+        'states_count': len(states),
+        'zip_count': sum(end - start + 1 for start, end in merged),
+        'zip_ranges': [[start, end] for start, end in merged],
+    }
+
+
+def backfill_summaries(apps, schema_editor):
+    InsuranceCompany = apps.get_model('content', 'InsuranceCompany')
+    InsuranceCoverage = apps.get_model('content', 'InsuranceCoverage')
+    CompanyCoverageSummary = apps.get_model('content', 'CompanyCoverageSummary')
+
+    rows = {company_id: [] for company_id in InsuranceCompany.objects.values_list('id', flat=True)}
+    coverages = InsuranceCoverage.objects.values_list(
+        'company_id', 'state_code', 'covers_entire_state', 'zip_range_start', 'zip_range_end', 'zip_codes_text',
+    )
+    for company_id, *row in coverages.iterator():
+        rows.setdefault(company_id, []).append(row)
+
+    CompanyCoverageSummary.objects.all().delete()
+    CompanyCoverageSummary.objects.bulk_create(
+        [CompanyCoverageSummary(company_id=company_id, **_summarize_coverage(company_rows))
+         for company_id, company_rows in rows.items()],
+        batch_size=500,
+    )
+
+
+def clear_summaries(apps, schema_editor):
+    CompanyCoverageSummary = apps.get_model('content', 'CompanyCoverageSummary')
+    CompanyCoverageSummary.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('content', '0075_companycoveragesummary'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_summaries, clear_summaries),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0076_backfill_companycoveragesummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleFeedEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('blog', 'Blog'), ('category', 'Category')], max_length=10)),
+                ('object_id', models.PositiveIntegerField()),
+                ('group', models.PositiveSmallIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('slug', models.SlugField(max_length=220)),
+                ('summary', models.TextField(blank=True, null=True)),
+                ('image', models.CharField(blank=True, default='', help_text='Storage name of the card image', max_length=255)),
+                ('label', models.CharField(blank=True, default='', max_length=120)),
+                ('category_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('category_name', models.CharField(blank=True, default='', max_length=120)),
+                ('category_slug', models.CharField(blank=True, default='', max_length=140)),
+                ('parent_page_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('parent_page_name', models.CharField(blank=True, default='', max_length=100)),
+                ('parent_page_slug', models.CharField(blank=True, default='', max_length=120)),
+                ('created_at', models.DateTimeField(blank=True, null=True)),
+                ('sort_name', models.CharField(blank=True, default='', max_length=120)),
+                ('search_text', models.TextField(blank=True, default='', help_text='Fields matched by the blogs_list search filter')),
+            ],
+            options={
+                'verbose_name': 'Article Feed Entry',
+                'verbose_name_plural': 'Article Feed Entries',
+                'ordering': ['group', '-created_at', 'sort_name', '-object_id'],
+                'indexes': [models.Index(fields=['group', '-created_at', 'sort_name', '-object_id'], name='article_feed_listing'), models.Index(fields=['parent_page_slug', 'group', '-created_at'], name='article_feed_parent_page'), models.Index(fields=['category_slug', '-created_at'], name='article_feed_category'), models.Index(fields=['slug'], name='article_feed_slug')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='article_feed_entry_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,86 @@
+from django.db import migrations
+
+# Frozen copy of the feed row builders as of this migration (before
+# body_text existed); later changes to content.feed must not reach here.
+
+
+def _join(*parts):
+    return '\n'.join(part for part in parts if part)
+
+
+def _blog_entry(ArticleFeedEntry, blog):
+    category = blog.category
+    parent_page = blog.parent_page
+    return ArticleFeedEntry(
+        kind='blog',
+        object_id=blog.pk,
+        group=1,
+        title=blog.title or '',
+        slug=blog.slug or '',
+        summary=blog.summary,
+        image=blog.hero_image.name if blog.hero_image else '',
+        label=category.name if category else '',
+        category_id=category.pk if category else None,
+        category_name=category.name if category else '',
+        category_slug=category.slug if category else '',
+        parent_page_id=parent_page.pk if parent_page else None,
+        parent_page_name=parent_page.name if parent_page else '',
+        parent_page_slug=parent_page.slug if parent_page else '',
+        created_at=blog.created_at,
+        sort_name='',
+        search_text=_join(blog.title, blog.summary),
+    )
+
+
+def _category_entry(ArticleFeedEntry, category):
+    parent_page = category.parent_page
+    return ArticleFeedEntry(
+        kind='category',
+        object_id=category.pk,
+        group=0,
+        title=category.blog_title or category.name,
+        slug=category.slug or '',
+        summary=category.blog_summary,
+        image='',
+        label=parent_page.name if parent_page else 'Guide',
+        category_id=category.pk,
+        category_name=category.name,
+        category_slug=category.slug or '',
+        parent_page_id=parent_page.pk if parent_page else None,
+        parent_page_name=parent_page.name if parent_page else '',
+        parent_page_slug=parent_page.slug if parent_page else '',
+        created_at=None,
+        sort_name=category.name or '',
+        search_text=_join(category.name, category.blog_title, category.blog_summary),
+    )
+
+
+def backfill_feed(apps, schema_editor):
+    ArticleFeedEntry = apps.get_model('content', 'ArticleFeedEntry')
+    Blog = apps.get_model('content', 'Blog')
+    Category = apps.get_model('content', 'Category')
+
+    entries = [
+        _blog_entry(ArticleFeedEntry, blog)
+        for blog in Blog.objects.filter(published=True).select_related('category', 'parent_page').iterator()
+    ]
+    entries.extend(
+        _category_entry(ArticleFeedEntry, category)
+        for category in Category.objects.filter(blog_published=True).select_related('parent_page').iterator()
+    )
+    ArticleFeedEntry.objects.all().delete()
+    ArticleFeedEntry.objects.bulk_create(entries, batch_size=500)
+
+
+def clear_feed(apps, schema_editor):
+    apps.get_model('content', 'ArticleFeedEntry').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('content', '0077_articlefeedentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_feed, clear_feed),
+    ]
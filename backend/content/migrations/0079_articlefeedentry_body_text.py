@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0078_backfill_articlefeedentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articlefeedentry',
+            name='body_text',
+            field=models.TextField(blank=True, default='', help_text='Article HTML as plain text, for full-text search'),
+        ),
+    ]
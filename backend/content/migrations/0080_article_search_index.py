@@ -0,0 +1,115 @@
+import html
+import re
+
+from django.db import migrations
+from django.utils.html import strip_tags
+
+# Frozen copies of content.feed.html_to_text and the search index DDL as of
+# this migration; later changes to those modules must not reach here.
+
+_BLOCK_TAG = re.compile(
+    r'<\s*/?\s*(?:address|article|aside|blockquote|br|dd|div|dl|dt|figcaption|figure|footer'
+    r'|h[1-6]|header|hr|li|main|nav|ol|p|pre|section|table|tbody|td|tfoot|th|thead|tr|ul)\b[^>]*>',
+    re.IGNORECASE,
+)
+
+
+def _html_to_text(value):
+    if not value:
+        return ''
+    return re.sub(r'\s+', ' ', html.unescape(strip_tags(_BLOCK_TAG.sub(' ', value)))).strip()
+
+
+TABLE = 'content_articlefeedentry'
+FTS_TABLE = 'content_articlefeedentry_fts'
+PG_INDEX = 'article_feed_search_gin'
+
+INSTALL = {
+    'postgresql': [
+        f"""
+        ALTER TABLE {TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(body_text, '')), 'C')
+        ) STORED
+        """,
+        f"CREATE INDEX {PG_INDEX} ON {TABLE} USING GIN (search_vector)",
+    ],
+    'sqlite': [
+        f"""
+        CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+            title, summary, body_text,
+            content='{TABLE}', content_rowid='id', tokenize='porter unicode61'
+        )
+        """,
+        f"""
+        CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, title, summary, body_text)
+            VALUES (new.id, new.title, coalesce(new.summary, ''), new.body_text);
+        END
+        """,
+        f"""
+        CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, summary, body_text)
+            VALUES ('delete', old.id, old.title, coalesce(old.summary, ''), old.body_text);
+        END
+        """,
+        f"""
+        CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, summary, body_text)
+            VALUES ('delete', old.id, old.title, coalesce(old.summary, ''), old.body_text);
+            INSERT INTO {FTS_TABLE}(rowid, title, summary, body_text)
+            VALUES (new.id, new.title, coalesce(new.summary, ''), new.body_text);
+        END
+        """,
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+    ],
+}
+UNINSTALL = {
+    'postgresql': [
+        f"DROP INDEX IF EXISTS {PG_INDEX}",
+        f"ALTER TABLE {TABLE} DROP COLUMN IF EXISTS search_vector",
+    ],
+    'sqlite': [
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+        f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    ],
+}
+
+
+def backfill_body_text(apps, schema_editor):
+    ArticleFeedEntry = apps.get_model('content', 'ArticleFeedEntry')
+    Blog = apps.get_model('content', 'Blog')
+    Category = apps.get_model('content', 'Category')
+
+    sources = {
+        'blog': dict(Blog.objects.values_list('id', 'content')),
+        'category': dict(Category.objects.values_list('id', 'blog_content')),
+    }
+    entries = list(ArticleFeedEntry.objects.only('id', 'kind', 'object_id'))
+    for entry in entries:
+        entry.body_text = _html_to_text(sources[entry.kind].get(entry.object_id))
+    ArticleFeedEntry.objects.bulk_update(entries, ['body_text'], batch_size=500)
+
+
+def install_search_index(apps, schema_editor):
+    for sql in INSTALL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def uninstall_search_index(apps, schema_editor):
+    for sql in UNINSTALL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('content', '0079_articlefeedentry_body_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_body_text, migrations.RunPython.noop),
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
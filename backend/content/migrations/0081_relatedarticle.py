@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0080_article_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_links', to='content.articlefeedentry')),
+                ('target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='content.articlefeedentry')),
+            ],
+            options={
+                'verbose_name': 'Related Article',
+                'verbose_name_plural': 'Related Articles',
+                'ordering': ['source', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('source', 'rank'), name='related_article_source_rank')],
+            },
+        ),
+    ]
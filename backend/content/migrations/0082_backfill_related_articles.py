@@ -0,0 +1,179 @@
+import math
+import re
+from collections import Counter
+
+import numpy as np
+from django.db import migrations
+
+# Frozen copy of content.related as of this migration, so later changes to the
+# scoring cannot change what it backfills
+
+TOP_K = 6
+# Per-field term weights
+TITLE_WEIGHT = 3
+SUMMARY_WEIGHT = 2
+BODY_WEIGHT = 1
+# Only the strongest terms of each article take part in matching
+MAX_TERMS = 64
+# Terms in more than this share of articles carry no signal
+MAX_DF_SHARE = 0.5
+# Articles under the same parent page score a little higher
+SAME_SECTION_BOOST = 1.25
+MIN_SCORE = 0.02
+
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further get had has have
+having he her here hers him his how i if in into is it its itself just let me more most my no nor not
+now of off on once only or other our ours out over own same she should so some such than that the their
+theirs them then there these they this those through to too under until up very was we were what when
+where which while who whom why will with would you your yours
+""".split())
+
+
+def tokenize(text):
+    return [
+        word for word in re.findall(r'[a-z][a-z0-9]+', (text or '').lower())
+        if word not in STOP_WORDS
+    ]
+
+
+def _term_counts(title, summary, body):
+    counts = Counter()
+    for text, weight in ((title, TITLE_WEIGHT), (summary, SUMMARY_WEIGHT), (body, BODY_WEIGHT)):
+        for word in tokenize(text):
+            counts[word] += weight
+    return counts
+
+
+class TfidfModel:
+    """Sparse TF-IDF vectors of a corpus, stored row-wise (CSR) and term-wise (postings)."""
+
+    def __init__(self, ids, sections, rows, cols, weights, term_count):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.sections = np.asarray(sections, dtype=np.int64)
+        self.positions = {entry_id: position for position, entry_id in enumerate(ids)}
+        size = len(self.ids)
+
+        order = np.lexsort((cols, rows))
+        self.row_ptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=size))))
+        self.row_cols = cols[order]
+        self.row_weights = weights[order]
+
+        order = np.lexsort((rows, cols))
+        self.col_ptr = np.concatenate(([0], np.cumsum(np.bincount(cols, minlength=term_count))))
+        self.col_rows = rows[order]
+        self.col_weights = weights[order]
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def fit(cls, documents):
+        """Build the model from (id, section_id or None, title, summary, body) tuples."""
+        ids, sections, counts = [], [], []
+        for entry_id, section, title, summary, body in documents:
+            ids.append(entry_id)
+            sections.append(-1 if section is None else section)
+            counts.append(_term_counts(title, summary, body))
+
+        vocabulary = {}
+        rows, cols, tf = [], [], []
+        for row, doc_counts in enumerate(counts):
+            for term, count in doc_counts.items():
+                rows.append(row)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                tf.append(count)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        tf = np.asarray(tf, dtype=np.float64)
+        size, term_count = len(ids), len(vocabulary)
+
+        df = np.bincount(cols, minlength=term_count)
+        idf = np.log((1 + size) / (1 + df)) + 1
+        weights = (1 + np.log(tf)) * idf[cols] if len(tf) else tf
+
+        # A term must be shared to link two articles, and not be everywhere
+        max_df = max(2, math.floor(size * MAX_DF_SHARE)) if size >= 10 else size
+        keep = (df[cols] >= 2) & (df[cols] <= max_df)
+        rows, cols, weights = rows[keep], cols[keep], weights[keep]
+
+        # Strongest MAX_TERMS terms per article
+        order = np.lexsort((-weights, rows))
+        rows, cols, weights = rows[order], cols[order], weights[order]
+        starts = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=size))))[:-1]
+        keep = np.arange(len(rows)) - starts[rows] < MAX_TERMS
+        rows, cols, weights = rows[keep], cols[keep], weights[keep]
+
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=size))
+        if len(weights):
+            weights = weights / norms[rows]
+        return cls(ids, sections, rows, cols, weights, term_count)
+
+    def scores(self, position):
+        """Similarity of the article at ``position`` to every article (itself excluded)."""
+        start, end = self.row_ptr[position], self.row_ptr[position + 1]
+        terms, term_weights = self.row_cols[start:end], self.row_weights[start:end]
+        result = np.zeros(len(self), dtype=np.float64)
+        if not len(terms):
+            return result
+
+        # Gather the postings of every term in one pass: posting offsets of
+        # term t are col_ptr[t] .. col_ptr[t + 1]
+        lengths = self.col_ptr[terms + 1] - self.col_ptr[terms]
+        firsts = np.repeat(self.col_ptr[terms] - (np.cumsum(lengths) - lengths), lengths)
+        offsets = firsts + np.arange(lengths.sum())
+        result += np.bincount(
+            self.col_rows[offsets],
+            weights=self.col_weights[offsets] * np.repeat(term_weights, lengths),
+            minlength=len(self),
+        )
+
+        section = self.sections[position]
+        if section >= 0:
+            result[self.sections == section] *= SAME_SECTION_BOOST
+        result[position] = 0
+        return result
+
+    def top(self, position, k=TOP_K, scores=None):
+        """Best ``k`` (position, score) pairs for the article at ``position``."""
+        if scores is None:
+            scores = self.scores(position)
+        candidates = np.flatnonzero(scores >= MIN_SCORE)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # Best first; ties go to the newer (higher id) entry
+        candidates = candidates[np.lexsort((-self.ids[candidates], -scores[candidates]))]
+        return [(int(candidate), float(scores[candidate])) for candidate in candidates]
+
+
+def backfill_related(apps, schema_editor):
+    ArticleFeedEntry = apps.get_model('content', 'ArticleFeedEntry')
+    RelatedArticle = apps.get_model('content', 'RelatedArticle')
+    documents = ArticleFeedEntry.objects.order_by('id').values_list(
+        'id', 'parent_page_id', 'title', 'summary', 'body_text',
+    )
+    model = TfidfModel.fit(documents.iterator(chunk_size=1000))
+    links = [
+        RelatedArticle(
+            source_id=int(model.ids[position]), target_id=int(model.ids[target]), rank=rank, score=score,
+        )
+        for position in range(len(model))
+        for rank, (target, score) in enumerate(model.top(position))
+    ]
+    RelatedArticle.objects.all().delete()
+    RelatedArticle.objects.bulk_create(links, batch_size=1000)
+
+
+def clear_related(apps, schema_editor):
+    apps.get_model('content', 'RelatedArticle').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('content', '0081_relatedarticle'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_related, clear_related),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0082_backfill_related_articles'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleSlug',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(max_length=220, unique=True)),
+                ('blog', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='slug_route', to='content.blog')),
+                ('category', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='slug_route', to='content.category')),
+            ],
+            options={
+                'verbose_name': 'Article Slug',
+                'verbose_name_plural': 'Article Slugs',
+                'constraints': [models.CheckConstraint(condition=models.Q(models.Q(('blog__isnull', False), ('category__isnull', True)), models.Q(('blog__isnull', True), ('category__isnull', False)), _connector='OR'), name='article_slug_one_target')],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+def backfill_slugs(apps, schema_editor):
+    # Frozen copy of content.slugs.rebuild as of this migration: Blogs first,
+    # then published categories by id
+    ArticleSlug = apps.get_model('content', 'ArticleSlug')
+    Blog = apps.get_model('content', 'Blog')
+    Category = apps.get_model('content', 'Category')
+
+    ArticleSlug.objects.all().delete()
+    routes = {}
+    for blog_id, slug in Blog.objects.order_by('id').values_list('id', 'slug'):
+        if slug:
+            routes.setdefault(slug, ArticleSlug(slug=slug, blog_id=blog_id))
+    categories = Category.objects.filter(blog_published=True).order_by('id').values_list('id', 'slug')
+    for category_id, slug in categories:
+        if slug:
+            routes.setdefault(slug, ArticleSlug(slug=slug, category_id=category_id))
+    ArticleSlug.objects.bulk_create(routes.values(), batch_size=500)
+
+
+def clear_slugs(apps, schema_editor):
+    apps.get_model('content', 'ArticleSlug').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('content', '0083_articleslug'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_slugs, clear_slugs),
+    ]
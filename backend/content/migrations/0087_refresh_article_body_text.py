@@ -0,0 +1,48 @@
+import html
+import re
+
+from django.db import migrations
+from django.utils.html import strip_tags
+
+# Frozen copy of content.feed.html_to_text as of this migration. Earlier
+# rows were extracted without word breaks at block tags ("Headbody").
+
+_BLOCK_TAG = re.compile(
+    r'<\s*/?\s*(?:address|article|aside|blockquote|br|dd|div|dl|dt|figcaption|figure|footer'
+    r'|h[1-6]|header|hr|li|main|nav|ol|p|pre|section|table|tbody|td|tfoot|th|thead|tr|ul)\b[^>]*>',
+    re.IGNORECASE,
+)
+
+
+def _html_to_text(value):
+    if not value:
+        return ''
+    return re.sub(r'\s+', ' ', html.unescape(strip_tags(_BLOCK_TAG.sub(' ', value)))).strip()
+
+
+def refresh_body_text(apps, schema_editor):
+    ArticleFeedEntry = apps.get_model('content', 'ArticleFeedEntry')
+    Blog = apps.get_model('content', 'Blog')
+    Category = apps.get_model('content', 'Category')
+
+    sources = {
+        'blog': dict(Blog.objects.values_list('id', 'content')),
+        'category': dict(Category.objects.values_list('id', 'blog_content')),
+    }
+    changed = []
+    for entry in ArticleFeedEntry.objects.only('id', 'kind', 'object_id', 'body_text'):
+        text = _html_to_text(sources[entry.kind].get(entry.object_id))
+        if text != entry.body_text:
+            entry.body_text = text
+            changed.append(entry)
+    ArticleFeedEntry.objects.bulk_update(changed, ['body_text'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('content', '0086_updated_at_for_sitemap'),
+    ]
+
+    operations = [
+        migrations.RunPython(refresh_body_text, migrations.RunPython.noop),
+    ]
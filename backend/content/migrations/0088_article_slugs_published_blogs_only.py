@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def rebuild_slugs(apps, schema_editor):
+    # Frozen copy of content.slugs.rebuild as of this migration: published
+    # Blogs first, then published categories by id. Unpublished Blogs no
+    # longer hide the category that shares their slug.
+    ArticleSlug = apps.get_model('content', 'ArticleSlug')
+    Blog = apps.get_model('content', 'Blog')
+    Category = apps.get_model('content', 'Category')
+
+    ArticleSlug.objects.all().delete()
+    routes = {}
+    for blog_id, slug in Blog.objects.filter(published=True).order_by('id').values_list('id', 'slug'):
+        if slug:
+            routes.setdefault(slug, ArticleSlug(slug=slug, blog_id=blog_id))
+    categories = Category.objects.filter(blog_published=True).order_by('id').values_list('id', 'slug')
+    for category_id, slug in categories:
+        if slug:
+            routes.setdefault(slug, ArticleSlug(slug=slug, category_id=category_id))
+    ArticleSlug.objects.bulk_create(routes.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('content', '0087_refresh_article_body_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_slugs, migrations.RunPython.noop),
+    ]
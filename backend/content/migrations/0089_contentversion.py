@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0088_article_slugs_published_blogs_only'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentVersion',
+            fields=[
+                ('tag', models.CharField(max_length=200, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField()),
+            ],
+            options={
+                'verbose_name': 'Content Version',
+                'verbose_name_plural': 'Content Versions',
+            },
+        ),
+    ]
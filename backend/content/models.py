@@ -1,5 +1,6 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils.text import slugify
+from django.utils import timezone
 import re
 from ckeditor.fields import RichTextField
 from ckeditor_uploader.fields import RichTextUploadingField
@@ -22,6 +23,7 @@ class MainPage(models.Model):
     meta_title = models.CharField(max_length=255, blank=True, default='')
     meta_description = models.TextField(blank=True, default='')
     meta_keywords = models.TextField(blank=True, default='')
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["order", "name"]
@@ -37,6 +39,16 @@ class MainPage(models.Model):
 
 
 
+def _render_on_save(instance, field, save_kwargs):
+    """Re-render article HTML unless a partial save leaves ``field`` alone."""
+    update_fields = save_kwargs.get('update_fields')
+    if update_fields is not None and field not in update_fields:
+        return
+    instance.render_content()
+    if update_fields is not None:
+        save_kwargs['update_fields'] = set(update_fields) | set(instance.RENDERED_FIELDS)
+
+
 class Category(models.Model):
     name = models.CharField(max_length=120)
     slug = models.SlugField(max_length=140)
@@ -63,6 +75,13 @@ class Category(models.Model):
     blog_reviewer_image = models.ImageField(upload_to="blog/reviewers/", blank=True, null=True, help_text="Reviewer image for this article")
     blog_reviewer_description = models.TextField(blank=True, null=True, help_text="Short description about the reviewer")
 
+    # Derived from blog_content on save (content/html_pipeline.py)
+    blog_content_rendered = models.TextField(blank=True, default='', editable=False)
+    blog_content_toc = models.JSONField(default=list, blank=True, editable=False)
+    blog_word_count = models.PositiveIntegerField(default=0, editable=False)
+    blog_reading_time = models.PositiveSmallIntegerField(default=0, editable=False, help_text="Minutes")
+    updated_at = models.DateTimeField(auto_now=True)
+
     class Meta:
         unique_together = ("parent_page", "slug")
         ordering = ["name"]
@@ -72,11 +91,34 @@ class Category(models.Model):
     def __str__(self):
         return f"{self.name} — {self.parent_page.name}"
 
+    RENDERED_FIELDS = ['blog_content_rendered', 'blog_content_toc', 'blog_word_count', 'blog_reading_time']
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)
+        _render_on_save(self, 'blog_content', kwargs)
         super().save(*args, **kwargs)
 
+    def render_content(self):
+        """Fill the derived blog_content columns (see html_pipeline.py)."""
+        from .html_pipeline import render_article
+        rendered = render_article(self.blog_content)
+        self.blog_content_rendered = rendered['html']
+        self.blog_content_toc = rendered['toc']
+        self.blog_word_count = rendered['word_count']
+        self.blog_reading_time = rendered['reading_time']
+
+    def clean(self):
+        # A published category is served at /blogs/<slug>/ like a Blog
+        slug = self.slug or slugify(self.name or '')
+        if self.blog_published and slug:
+            from .slugs import RESERVED_SLUGS, slug_owner
+            if slug in RESERVED_SLUGS:
+                raise ValidationError({'slug': f'"{slug}" is reserved; choose another article URL.'})
+            owner = slug_owner(slug, category_id=self.pk)
+            if owner is not None:
+                raise ValidationError({'slug': f'The article URL "{slug}" is already used by {owner.describe()}.'})
+
 
 class Blog(models.Model):
     title = models.CharField(max_length=200)
@@ -106,10 +148,18 @@ class Blog(models.Model):
     reviewer_image = models.ImageField(upload_to="blog/reviewers/", blank=True, null=True)
     reviewer_description = models.TextField(blank=True, null=True)
 
+    # Derived from content on save (content/html_pipeline.py)
+    content_rendered = models.TextField(blank=True, default='', editable=False)
+    content_toc = models.JSONField(default=list, blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=0, editable=False, help_text="Minutes")
+
     published = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    RENDERED_FIELDS = ['content_rendered', 'content_toc', 'word_count', 'reading_time']
+
     class Meta:
         ordering = ["-created_at"]
 
@@ -122,7 +172,8 @@ class Blog(models.Model):
         - If a category is selected and parent_page is missing, set parent_page
           to category.parent_page to prevent cross-page leakage.
         - Generate slug preferring the category slug; otherwise use a slugified
-          title. Enforce uniqueness by adding a numeric suffix when required.
+          title. Enforce uniqueness by adding a numeric suffix when required
+          (checked against ArticleSlug, so Category article slugs count too).
         """
         # Auto-align parent_page
         try:
@@ -138,19 +189,25 @@ class Blog(models.Model):
             base = slugify(self.title or '')
 
         candidate = base or (self.slug or '') or slugify(self.title or '')
-        from django.db.models import Q
         if candidate:
-            i = 0
-            unique = candidate
-            while Blog.objects.filter(Q(slug=unique) & ~Q(pk=self.pk)).exists():
-                i += 1
-                unique = f"{candidate}-{i}"
-            self.slug = unique
+            # The registry covers Blogs and published categories-as-blogs
+            from .slugs import next_free_slug
+            self.slug = next_free_slug(candidate, blog_id=self.pk)
         else:
             self.slug = slugify(self.title or '')
 
+        _render_on_save(self, 'content', kwargs)
         super().save(*args, **kwargs)
 
+    def render_content(self):
+        """Fill the derived content columns (see html_pipeline.py)."""
+        from .html_pipeline import render_article
+        rendered = render_article(self.content)
+        self.content_rendered = rendered['html']
+        self.content_toc = rendered['toc']
+        self.word_count = rendered['word_count']
+        self.reading_time = rendered['reading_time']
+
     def clean(self):
         # Must belong to at least one of: parent_page or category
         # Allow both when they match (category.parent_page == parent_page)
@@ -166,6 +223,113 @@ class Blog(models.Model):
 
     # Note: single save() above handles parent_page alignment and slug generation.
 
+
+class ArticleSlug(models.Model):
+    """Which article /api/blogs/<slug>/ serves: a Blog or a category-as-blog.
+
+    The unique slug index resolves a URL in one query and keeps Blog and
+    Category slugs from colliding. Maintained by content/slugs.py.
+    """
+    slug = models.SlugField(max_length=220, unique=True)
+    blog = models.OneToOneField(Blog, on_delete=models.CASCADE, null=True, blank=True, related_name='slug_route')
+    category = models.OneToOneField(Category, on_delete=models.CASCADE, null=True, blank=True, related_name='slug_route')
+
+    class Meta:
+        verbose_name = "Article Slug"
+        verbose_name_plural = "Article Slugs"
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(blog__isnull=False, category__isnull=True) | models.Q(blog__isnull=True, category__isnull=False),
+                name="article_slug_one_target",
+            ),
+        ]
+
+    def __str__(self):
+        return self.slug
+
+    def describe(self):
+        if self.blog_id:
+            return f'the blog "{self.blog}"'
+        return f'the category "{self.category.name}"'
+
+
+class ArticleFeedEntry(models.Model):
+    """List-card projection of a published Blog or category-as-blog.
+
+    One row per listable article so blogs_list can filter, order and page in
+    SQL without loading article HTML. Maintained by signals.py via
+    content/feed.py; rebuild with `manage.py rebuild_article_feed`.
+    """
+    KIND_BLOG = 'blog'
+    KIND_CATEGORY = 'category'
+    KIND_CHOICES = [
+        (KIND_BLOG, 'Blog'),
+        (KIND_CATEGORY, 'Category'),
+    ]
+    # Categories are listed first ("pillar" guides), then blogs by date
+    GROUP_CATEGORY = 0
+    GROUP_BLOG = 1
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    group = models.PositiveSmallIntegerField()
+    title = models.CharField(max_length=200)
+    slug = models.SlugField(max_length=220)
+    summary = models.TextField(blank=True, null=True)
+    image = models.CharField(max_length=255, blank=True, default='', help_text="Storage name of the card image")
+    label = models.CharField(max_length=120, blank=True, default='')
+    category_id = models.PositiveIntegerField(blank=True, null=True)
+    category_name = models.CharField(max_length=120, blank=True, default='')
+    category_slug = models.CharField(max_length=140, blank=True, default='')
+    parent_page_id = models.PositiveIntegerField(blank=True, null=True)
+    parent_page_name = models.CharField(max_length=100, blank=True, default='')
+    parent_page_slug = models.CharField(max_length=120, blank=True, default='')
+    created_at = models.DateTimeField(blank=True, null=True)
+    sort_name = models.CharField(max_length=120, blank=True, default='')
+    search_text = models.TextField(blank=True, default='', help_text="Fields matched by the blogs_list search filter")
+    body_text = models.TextField(blank=True, default='', help_text="Article HTML as plain text, for full-text search")
+
+    class Meta:
+        ordering = ["group", "-created_at", "sort_name", "-object_id"]
+        verbose_name = "Article Feed Entry"
+        verbose_name_plural = "Article Feed Entries"
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="article_feed_entry_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["group", "-created_at", "sort_name", "-object_id"], name="article_feed_listing"),
+            models.Index(fields=["parent_page_slug", "group", "-created_at"], name="article_feed_parent_page"),
+            models.Index(fields=["category_slug", "-created_at"], name="article_feed_category"),
+            models.Index(fields=["slug"], name="article_feed_slug"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.title}"
+
+
+class RelatedArticle(models.Model):
+    """One precomputed "related article" link, best first by ``rank``.
+
+    Scored offline by TF-IDF text similarity (content/related.py); refreshed
+    per article from signals.py and in full by
+    `manage.py compute_related_articles`.
+    """
+    source = models.ForeignKey(ArticleFeedEntry, on_delete=models.CASCADE, related_name='related_links')
+    target = models.ForeignKey(ArticleFeedEntry, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ["source", "rank"]
+        verbose_name = "Related Article"
+        verbose_name_plural = "Related Articles"
+        constraints = [
+            models.UniqueConstraint(fields=["source", "rank"], name="related_article_source_rank"),
+        ]
+
+    def __str__(self):
+        return f"{self.source_id} -> {self.target_id} ({self.score:.3f})"
+
 # All prior content models (HomePage, Section, SiteConfig, Page, PageSection,
 # Menu, MenuItem) have been removed to reset the schema.
 # Define new models here when ready.
@@ -669,6 +833,9 @@ US_STATES = [
     ('WV', 'West Virginia'), ('WI', 'Wisconsin'), ('WY', 'Wyoming')
 ]
 
+ZIP_MIN = 0
+ZIP_MAX = 99999
+
 class InsuranceCompany(models.Model):
     name = models.CharField(max_length=200)
     slug = models.SlugField(max_length=220, unique=True)
@@ -729,6 +896,33 @@ class InsuranceCoverage(models.Model):
             return f"{self.company.name} — {label} (state-wide)"
         return f"{self.company.name} — {label}"
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.sync_zip_ranges()
+
+    def zip_range_rows(self):
+        """Unsaved InsuranceCoverageZipRange rows describing this coverage.
+
+        State-wide coverage matches any ZIP (see matches_zip), so it is stored
+        as the full ZIP_MIN..ZIP_MAX interval.
+        """
+        intervals = normalized_zip_ranges(
+            self.covers_entire_state, self.zip_range_start, self.zip_range_end, self.zip_codes_text,
+        )
+        return [
+            InsuranceCoverageZipRange(coverage_id=self.pk, company_id=self.company_id, start=start, end=end)
+            for start, end in intervals
+        ]
+
+    def sync_zip_ranges(self):
+        InsuranceCoverageZipRange.objects.filter(coverage_id=self.pk).delete()
+        InsuranceCoverageZipRange.objects.bulk_create(self.zip_range_rows())
+
+    def zip_intervals(self):
+        """Return the ZIP rules of this row as inclusive (start, end) pairs."""
+        return parse_zip_intervals(self.zip_range_start, self.zip_range_end, self.zip_codes_text)
+
     def matches_zip(self, zip_code: str) -> bool:
         try:
             z = int(str(zip_code).strip()[:5])
@@ -736,42 +930,171 @@ class InsuranceCoverage(models.Model):
             return False
         if self.covers_entire_state:
             return True
-        # Range handling: support start-only, end-only, and swapped ranges
-        if self.zip_range_start or self.zip_range_end:
-            try:
-                start = int(self.zip_range_start) if self.zip_range_start is not None else None
-                end = int(self.zip_range_end) if self.zip_range_end is not None else None
-                if start is not None and end is not None:
-                    if start > end:
-                        start, end = end, start
-                    if start <= z <= end:
-                        return True
-                elif start is not None and start == z:
-                    return True
-                elif end is not None and end == z:
-                    return True
-            except Exception:
-                pass
-        if (self.zip_codes_text or '').strip():
-            parts = [p.strip() for p in re.split(r"[\s,]+", self.zip_codes_text) if p.strip()]
-            for p in parts:
-                # Support explicit ZIPs and simple ranges like '30000-30099' (allow spaces)
-                # Normalize en-dash/em-dash to hyphen
-                q = p.replace('–', '-').replace('—', '-')
-                # Remove any non-digit/non-hyphen characters (handles accidental punctuation)
-                q = re.sub(r"[^0-9-]", "", q)
-                m = re.match(r"^\s*(\d{5})\s*-\s*(\d{5})\s*$", q)
-                if m:
-                    try:
-                        start = int(m.group(1))
-                        end = int(m.group(2))
-                        if start <= z <= end:
-                            return True
-                    except Exception:
-                        pass
-                elif q.isdigit() and int(q) == z:
-                    return True
-        return False
+        return any(start <= z <= end for start, end in self.zip_intervals())
+
+
+def parse_zip_intervals(zip_range_start=None, zip_range_end=None, zip_codes_text=''):
+    """Parse coverage ZIP fields into inclusive (start, end) integer pairs.
+
+    Shared by InsuranceCoverage.matches_zip and the compiled coverage index so
+    both always agree on what a rule covers.
+    """
+    intervals = []
+    # Range handling: support start-only, end-only, and swapped ranges
+    if zip_range_start or zip_range_end:
+        try:
+            start = int(zip_range_start) if zip_range_start is not None else None
+            end = int(zip_range_end) if zip_range_end is not None else None
+            if start is not None and end is not None:
+                if start > end:
+                    start, end = end, start
+                intervals.append((start, end))
+            elif start is not None:
+                intervals.append((start, start))
+            elif end is not None:
+                intervals.append((end, end))
+        except Exception:
+            pass
+    if (zip_codes_text or '').strip():
+        parts = [p.strip() for p in re.split(r"[\s,]+", zip_codes_text) if p.strip()]
+        for p in parts:
+            # Support explicit ZIPs and simple ranges like '30000-30099' (allow spaces)
+            # Normalize en-dash/em-dash to hyphen
+            q = p.replace('–', '-').replace('—', '-')
+            # Remove any non-digit/non-hyphen characters (handles accidental punctuation)
+            q = re.sub(r"[^0-9-]", "", q)
+            m = re.match(r"^\s*(\d{5})\s*-\s*(\d{5})\s*$", q)
+            if m:
+                start = int(m.group(1))
+                end = int(m.group(2))
+                # Reversed ranges in free text never matched anything; keep that
+                if start <= end:
+                    intervals.append((start, end))
+            elif q.isdigit():
+                intervals.append((int(q), int(q)))
+    return intervals
+
+
+def normalized_zip_ranges(covers_entire_state, zip_range_start=None, zip_range_end=None, zip_codes_text=''):
+    """Merged (start, end) pairs stored in InsuranceCoverageZipRange for one coverage."""
+    from .coverage_index import merge_intervals
+    if covers_entire_state:
+        return [(ZIP_MIN, ZIP_MAX)]
+    return merge_intervals(parse_zip_intervals(zip_range_start, zip_range_end, zip_codes_text))
+
+
+class InsuranceCoverageZipRange(models.Model):
+    """Normalized integer ZIP intervals of an InsuranceCoverage row.
+
+    Filled from InsuranceCoverage.save(); lets the database answer
+    "which companies cover ZIP X" with a single indexed range query.
+    """
+    coverage = models.ForeignKey(InsuranceCoverage, on_delete=models.CASCADE, related_name='zip_ranges')
+    # Denormalized from coverage.company so lookups need no extra join
+    company = models.ForeignKey(InsuranceCompany, on_delete=models.CASCADE, related_name='zip_ranges')
+    start = models.PositiveIntegerField()
+    end = models.PositiveIntegerField()
+
+    class Meta:
+        verbose_name = "Insurance Coverage ZIP Range"
+        verbose_name_plural = "Insurance Coverage ZIP Ranges"
+        indexes = [
+            models.Index(fields=["start", "end"]),
+        ]
+
+    def __str__(self):
+        return f"{self.start:05d}-{self.end:05d}"
+
+
+def summarize_coverage(rows):
+    """Summary fields for one company from its coverage rows.
+
+    ``rows`` are (state_code, covers_entire_state, zip_range_start,
+    zip_range_end, zip_codes_text) tuples. ZIP counts cover explicit ranges
+    and lists only; state-wide states are reported separately.
+    """
+    from .coverage_index import merge_intervals
+    states, statewide, intervals = set(), set(), []
+    for state, covers_entire_state, start, end, text in rows:
+        state = (state or '').upper()
+        states.add(state)
+        if covers_entire_state:
+            statewide.add(state)
+        intervals.extend(parse_zip_intervals(start, end, text))
+    merged = merge_intervals(intervals)
+    return {
+        'states': sorted(states),
+        'statewide_states': sorted(statewide),
+        'states_count': len(states),
+        'zip_count': sum(end - start + 1 for start, end in merged),
+        'zip_ranges': [[start, end] for start, end in merged],
+    }
+
+
+class CompanyCoverageSummary(models.Model):
+    """Materialized coverage totals of one company.
+
+    Recomputed from signals.py when the company's coverage rows change, so
+    the admin changelist and the company API never aggregate per request.
+    """
+    company = models.OneToOneField(InsuranceCompany, on_delete=models.CASCADE, primary_key=True, related_name='coverage_summary')
+    states = models.JSONField(default=list, blank=True)
+    statewide_states = models.JSONField(default=list, blank=True)
+    states_count = models.PositiveIntegerField(default=0)
+    zip_count = models.PositiveIntegerField(default=0)
+    zip_ranges = models.JSONField(default=list, blank=True, help_text="Merged [start, end] ZIP pairs")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Company Coverage Summary"
+        verbose_name_plural = "Company Coverage Summaries"
+
+    def __str__(self):
+        return f"{self.company} ({self.states_count} states, {self.zip_count} ZIPs)"
+
+    @classmethod
+    def refresh(cls, company_ids):
+        """Recompute the summaries of ``company_ids`` (missing companies are skipped)."""
+        company_ids = set(company_ids)
+        existing = set(InsuranceCompany.objects.filter(id__in=company_ids).values_list('id', flat=True))
+        if not existing:
+            return 0
+        rows = {company_id: [] for company_id in existing}
+        coverages = InsuranceCoverage.objects.filter(company_id__in=existing).values_list(
+            'company_id', 'state_code', 'covers_entire_state', 'zip_range_start', 'zip_range_end', 'zip_codes_text',
+        )
+        for company_id, *row in coverages:
+            rows[company_id].append(row)
+
+        fields = ['states', 'statewide_states', 'states_count', 'zip_count', 'zip_ranges', 'updated_at']
+        summaries = [cls(company_id=company_id, **summarize_coverage(company_rows)) for company_id, company_rows in rows.items()]
+        for summary in summaries:
+            summary.updated_at = timezone.now()
+        cls.objects.bulk_create(summaries, update_conflicts=True, unique_fields=['company'], update_fields=fields)
+        return len(summaries)
+
+
+class QuoteStatDaily(models.Model):
+    """Daily quote impressions/clicks per company and ZIP3 prefix.
+
+    Aggregated from the quote event logs by `manage.py aggregate_quote_events`.
+    """
+    date = models.DateField()
+    company = models.ForeignKey(InsuranceCompany, on_delete=models.CASCADE, related_name='daily_stats')
+    zip3 = models.CharField(max_length=3, blank=True, default='')
+    impressions = models.PositiveIntegerField(default=0)
+    clicks = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-date", "company"]
+        verbose_name = "Quote Daily Stat"
+        verbose_name_plural = "Quote Daily Stats"
+        constraints = [
+            models.UniqueConstraint(fields=["date", "company", "zip3"], name="quote_stat_daily_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.company} {self.zip3 or '---'}"
 
 
 class PressLogo(models.Model):
@@ -807,6 +1130,7 @@ class TeamMember(models.Model):
     description = RichTextUploadingField('Bio/Description', blank=True, null=True)
     order = models.PositiveIntegerField(default=0)
     published = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["order", "name"]
@@ -838,3 +1162,20 @@ class PressItem(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class ContentVersion(models.Model):
+    """Version counter of one kind of derived data (see content/versions.py).
+
+    Kept in the database so every worker and instance sees the same value
+    and a bump is an atomic row update.
+    """
+    tag = models.CharField(max_length=200, primary_key=True)
+    value = models.BigIntegerField()
+
+    class Meta:
+        verbose_name = "Content Version"
+        verbose_name_plural = "Content Versions"
+
+    def __str__(self):
+        return f"{self.tag}={self.value}"
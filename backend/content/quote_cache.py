@@ -0,0 +1,90 @@
+"""Result cache for the per-ZIP `quotes` response.
+
+Entries are keyed by the normalized ZIP, the request origin (company logos are
+absolute URLs) and the current coverage version. Saving or deleting an
+InsuranceCompany/InsuranceCoverage bumps the version (see signals.py), so stale
+entries simply become unreachable and expire on their own; nothing is scanned
+or deleted. The version lives in the database, so workers on a per-process
+cache still see changes made by other processes.
+
+Hit and miss counts are kept per process and added to the shared counters at
+most every FLUSH_INTERVAL seconds, so a lookup costs no extra cache round trip.
+"""
+import threading
+import time
+
+from django.core.cache import cache
+
+from .coverage_index import VERSION_TAG
+from .versions import get_version
+
+KEY_PREFIX = 'content:quotes:'
+HITS_KEY = KEY_PREFIX + 'hits'
+MISSES_KEY = KEY_PREFIX + 'misses'
+# Safety net only; invalidation is driven by the version
+TIMEOUT = 60 * 60
+FLUSH_INTERVAL = 10
+
+_counts = {HITS_KEY: 0, MISSES_KEY: 0}
+_counts_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def cache_key(request, zip_code):
+    origin = f"{request.scheme}://{request.get_host()}"
+    return f"{KEY_PREFIX}{get_version(VERSION_TAG)}:{origin}:{zip_code or '-'}"
+
+
+def _add(key, delta):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def flush_counts():
+    """Add this process's pending hit/miss counts to the shared counters."""
+    global _last_flush
+    with _counts_lock:
+        pending = {key: n for key, n in _counts.items() if n}
+        for key in pending:
+            _counts[key] = 0
+        _last_flush = time.monotonic()
+    try:
+        for key, n in pending.items():
+            _add(key, n)
+    except Exception:
+        # Statistics only; never fail a request over them
+        pass
+
+
+def _count(key):
+    with _counts_lock:
+        _counts[key] += 1
+        due = time.monotonic() - _last_flush >= FLUSH_INTERVAL
+    if due:
+        flush_counts()
+
+
+def lookup(key):
+    payload = cache.get(key)
+    _count(MISSES_KEY if payload is None else HITS_KEY)
+    return payload
+
+
+def store(key, payload):
+    cache.set(key, payload, TIMEOUT)
+
+
+def stats():
+    flush_counts()
+    hits = cache.get(HITS_KEY) or 0
+    misses = cache.get(MISSES_KEY) or 0
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else None,
+        'version': get_version(VERSION_TAG),
+    }
@@ -0,0 +1,140 @@
+"""Buffered quote impression/click recorder.
+
+Request handlers only append to an in-memory buffer; a daemon thread writes
+the buffer in batches to newline-delimited JSON files under
+settings.QUOTE_EVENTS_DIR. Files rotate daily and are per process
+(``events-YYYY-MM-DD-<pid>.ndjson``) so appends from different workers never
+interleave. `manage.py aggregate_quote_events` folds closed files into
+QuoteStatDaily.
+
+Each line is one event::
+
+    {"ts": 1700000000.0, "type": "impression", "zip3": "100", "companies": [3, 7]}
+    {"ts": 1700000000.0, "type": "click", "zip3": "100", "companies": [3]}
+"""
+import atexit
+import collections
+import json
+import os
+import threading
+import time
+
+from django.conf import settings
+
+IMPRESSION = 'impression'
+CLICK = 'click'
+FLUSH_INTERVAL = 2.0
+FLUSH_THRESHOLD = 1000
+# Drop events instead of growing without bound if the disk stalls
+MAX_BUFFERED = 100000
+FILE_PREFIX = 'events-'
+FILE_SUFFIX = '.ndjson'
+
+
+def events_dir():
+    return getattr(settings, 'QUOTE_EVENTS_DIR', '') or ''
+
+
+def log_filename(day, pid=None):
+    return f"{FILE_PREFIX}{day}-{pid or os.getpid()}{FILE_SUFFIX}"
+
+
+class EventRecorder:
+    def __init__(self, directory):
+        self.directory = directory
+        self._buffer = collections.deque(maxlen=MAX_BUFFERED)
+        self._wakeup = threading.Event()
+        self._write_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def record(self, event_type, zip_code, company_ids):
+        if not company_ids:
+            return
+        self._ensure_thread()
+        self._buffer.append((time.time(), event_type, str(zip_code or '')[:3], list(company_ids)))
+        if len(self._buffer) >= FLUSH_THRESHOLD:
+            self._wakeup.set()
+
+    def _ensure_thread(self):
+        # A forked worker inherits the object but not the thread
+        if self._pid == os.getpid():
+            return
+        with self._thread_lock:
+            if self._pid != os.getpid():
+                self._buffer.clear()
+                self._thread = threading.Thread(target=self._run, name='quote-events', daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(FLUSH_INTERVAL)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+    def flush(self):
+        """Append everything buffered so far to today's log file."""
+        with self._write_lock:
+            events = []
+            while self._buffer:
+                try:
+                    events.append(self._buffer.popleft())
+                except IndexError:
+                    break
+            if not events:
+                return 0
+            by_day = collections.defaultdict(list)
+            for ts, event_type, zip3, company_ids in events:
+                by_day[time.strftime('%Y-%m-%d', time.gmtime(ts))].append(json.dumps(
+                    {'ts': round(ts, 3), 'type': event_type, 'zip3': zip3, 'companies': company_ids},
+                    separators=(',', ':'),
+                ))
+            os.makedirs(self.directory, exist_ok=True)
+            for day, lines in by_day.items():
+                path = os.path.join(self.directory, log_filename(day))
+                with open(path, 'a', encoding='utf-8') as fh:
+                    fh.write('\n'.join(lines) + '\n')
+            return len(events)
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder():
+    """Return the process-wide recorder, or None when logging is disabled."""
+    global _recorder
+    directory = events_dir()
+    if not directory:
+        return None
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = EventRecorder(directory)
+                atexit.register(_flush_at_exit)
+    return _recorder
+
+
+def _flush_at_exit():
+    try:
+        if _recorder is not None:
+            _recorder.flush()
+    except Exception:
+        pass
+
+
+def record_impressions(zip_code, company_ids):
+    recorder = get_recorder()
+    if recorder is not None:
+        recorder.record(IMPRESSION, zip_code, company_ids)
+
+
+def record_click(zip_code, company_id):
+    recorder = get_recorder()
+    if recorder is not None:
+        recorder.record(CLICK, zip_code, [company_id])
@@ -0,0 +1,328 @@
+"""Related-article links from offline TF-IDF text similarity.
+
+Each ArticleFeedEntry becomes an L2-normalised TF-IDF vector over its title,
+summary and body text (title and summary words count extra). Cosine
+similarity against every other article is a sparse dot product over an
+inverted index, computed with NumPy; the best TOP_K per article are stored in
+RelatedArticle so blog_detail reads them with one indexed query.
+
+`manage.py compute_related_articles` refits the model and recomputes the
+whole table. signals.py calls refresh() once per transaction that saved or
+deleted articles. Each process keeps its fitted model (vocabulary, IDF and
+vectors) under the 'related' version, so refresh() only re-vectorizes the
+changed articles with the cached IDF and recomputes their lists and the lists
+they now enter or leave. A process whose model is a version behind refits.
+IDF weights drift slightly until the next full run.
+"""
+import math
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+from . import response_cache
+from .versions import bump_version, get_version
+
+VERSION_TAG = 'related'
+
+TOP_K = 6
+# Per-field term weights
+TITLE_WEIGHT = 3
+SUMMARY_WEIGHT = 2
+BODY_WEIGHT = 1
+# Only the strongest terms of each article take part in matching
+MAX_TERMS = 64
+# Terms in more than this share of articles carry no signal
+MAX_DF_SHARE = 0.5
+# Articles under the same parent page score a little higher
+SAME_SECTION_BOOST = 1.25
+MIN_SCORE = 0.02
+
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further get had has have
+having he her here hers him his how i if in into is it its itself just let me more most my no nor not
+now of off on once only or other our ours out over own same she should so some such than that the their
+theirs them then there these they this those through to too under until up very was we were what when
+where which while who whom why will with would you your yours
+""".split())
+
+
+def tokenize(text):
+    return [
+        word for word in re.findall(r'[a-z][a-z0-9]+', (text or '').lower())
+        if word not in STOP_WORDS
+    ]
+
+
+def _term_counts(title, summary, body):
+    counts = Counter()
+    for text, weight in ((title, TITLE_WEIGHT), (summary, SUMMARY_WEIGHT), (body, BODY_WEIGHT)):
+        for word in tokenize(text):
+            counts[word] += weight
+    return counts
+
+
+def _vectors(counts, vocabulary, idf, usable):
+    """(rows, cols, weights) of the unit TF-IDF vectors of ``counts``, one row per document."""
+    rows, cols, tf = [], [], []
+    for row, doc_counts in enumerate(counts):
+        for term, count in doc_counts.items():
+            col = vocabulary.get(term)
+            if col is not None and usable[col]:
+                rows.append(row)
+                cols.append(col)
+                tf.append(count)
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    tf = np.asarray(tf, dtype=np.float64)
+    weights = (1 + np.log(tf)) * idf[cols] if len(tf) else tf
+
+    # Strongest MAX_TERMS terms per article
+    order = np.lexsort((-weights, rows))
+    rows, cols, weights = rows[order], cols[order], weights[order]
+    starts = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=len(counts)))))[:-1]
+    keep = np.arange(len(rows)) - starts[rows] < MAX_TERMS
+    rows, cols, weights = rows[keep], cols[keep], weights[keep]
+
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=len(counts)))
+    if len(weights):
+        weights = weights / norms[rows]
+    return rows, cols, weights
+
+
+class TfidfModel:
+    """Sparse TF-IDF vectors of a corpus, stored row-wise (CSR) and term-wise (postings).
+
+    The fitted vocabulary and IDF are kept, so patch() can re-vectorize a few
+    changed articles without re-reading and re-fitting the whole corpus.
+    """
+
+    def __init__(self, ids, sections, rows, cols, weights, vocabulary, idf, usable):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.sections = np.asarray(sections, dtype=np.int64)
+        self.positions = {int(entry_id): position for position, entry_id in enumerate(self.ids)}
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.usable = usable
+        self.version = None
+        size, term_count = len(self.ids), len(vocabulary)
+
+        order = np.lexsort((cols, rows))
+        self.row_ptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=size))))
+        self.row_cols = cols[order]
+        self.row_weights = weights[order]
+
+        order = np.lexsort((rows, cols))
+        self.col_ptr = np.concatenate(([0], np.cumsum(np.bincount(cols, minlength=term_count))))
+        self.col_rows = rows[order]
+        self.col_weights = weights[order]
+
+    def __len__(self):
+        return len(self.ids)
+
+    @staticmethod
+    def _read(documents):
+        ids, sections, counts = [], [], []
+        for entry_id, section, title, summary, body in documents:
+            ids.append(entry_id)
+            sections.append(-1 if section is None else section)
+            counts.append(_term_counts(title, summary, body))
+        return ids, sections, counts
+
+    @classmethod
+    def fit(cls, documents):
+        """Build the model from (id, section_id or None, title, summary, body) tuples."""
+        ids, sections, counts = cls._read(documents)
+        vocabulary = {}
+        for doc_counts in counts:
+            for term in doc_counts:
+                vocabulary.setdefault(term, len(vocabulary))
+        size, term_count = len(ids), len(vocabulary)
+
+        df = np.zeros(term_count, dtype=np.int64)
+        for doc_counts in counts:
+            df[[vocabulary[term] for term in doc_counts]] += 1
+        idf = np.log((1 + size) / (1 + df)) + 1
+        # A term must be shared to link two articles, and not be everywhere
+        max_df = max(2, math.floor(size * MAX_DF_SHARE)) if size >= 10 else size
+        usable = (df >= 2) & (df <= max_df)
+
+        rows, cols, weights = _vectors(counts, vocabulary, idf, usable)
+        return cls(ids, sections, rows, cols, weights, vocabulary, idf, usable)
+
+    def patch(self, documents, removed=()):
+        """A copy with ``documents`` (re)vectorized and ``removed`` ids dropped.
+
+        The new vectors use this model's vocabulary and IDF: terms it never
+        saw are left out until the next fit.
+        """
+        ids, sections, counts = self._read(documents)
+        dropped = set(ids) | set(removed)
+        kept = np.flatnonzero(~np.isin(self.ids, np.fromiter(dropped, dtype=np.int64, count=len(dropped))))
+
+        lengths = self.row_ptr[kept + 1] - self.row_ptr[kept]
+        offsets = np.repeat(self.row_ptr[kept] - (np.cumsum(lengths) - lengths), lengths) + np.arange(lengths.sum())
+        rows = np.repeat(np.arange(len(kept)), lengths)
+        new_rows, new_cols, new_weights = _vectors(counts, self.vocabulary, self.idf, self.usable)
+        return type(self)(
+            np.concatenate((self.ids[kept], np.asarray(ids, dtype=np.int64))),
+            np.concatenate((self.sections[kept], np.asarray(sections, dtype=np.int64))),
+            np.concatenate((rows, new_rows + len(kept))),
+            np.concatenate((self.row_cols[offsets], new_cols)),
+            np.concatenate((self.row_weights[offsets], new_weights)),
+            self.vocabulary, self.idf, self.usable,
+        )
+
+    def scores(self, position):
+        """Similarity of the article at ``position`` to every article (itself excluded)."""
+        start, end = self.row_ptr[position], self.row_ptr[position + 1]
+        terms, term_weights = self.row_cols[start:end], self.row_weights[start:end]
+        result = np.zeros(len(self), dtype=np.float64)
+        if not len(terms):
+            return result
+
+        # Gather the postings of every term in one pass: posting offsets of
+        # term t are col_ptr[t] .. col_ptr[t + 1]
+        lengths = self.col_ptr[terms + 1] - self.col_ptr[terms]
+        firsts = np.repeat(self.col_ptr[terms] - (np.cumsum(lengths) - lengths), lengths)
+        offsets = firsts + np.arange(lengths.sum())
+        result += np.bincount(
+            self.col_rows[offsets],
+            weights=self.col_weights[offsets] * np.repeat(term_weights, lengths),
+            minlength=len(self),
+        )
+
+        section = self.sections[position]
+        if section >= 0:
+            result[self.sections == section] *= SAME_SECTION_BOOST
+        result[position] = 0
+        return result
+
+    def top(self, position, k=TOP_K, scores=None):
+        """Best ``k`` (position, score) pairs for the article at ``position``."""
+        if scores is None:
+            scores = self.scores(position)
+        candidates = np.flatnonzero(scores >= MIN_SCORE)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # Best first; ties go to the newer (higher id) entry
+        candidates = candidates[np.lexsort((-self.ids[candidates], -scores[candidates]))]
+        return [(int(candidate), float(scores[candidate])) for candidate in candidates]
+
+
+DOCUMENT_FIELDS = ('id', 'parent_page_id', 'title', 'summary', 'body_text')
+
+
+def _documents(entries):
+    return entries.order_by('id').values_list(*DOCUMENT_FIELDS).iterator(chunk_size=1000)
+
+
+def load_model():
+    from .models import ArticleFeedEntry
+    return TfidfModel.fit(_documents(ArticleFeedEntry.objects.all()))
+
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def _updated_model(changed_ids=None):
+    """This process's model, brought up to date under a new version.
+
+    Re-vectorizes ``changed_ids`` with the cached vocabulary and IDF when this
+    process holds the previous version; refits from the database when it has
+    no model, another process changed articles since, or ``changed_ids`` is
+    None.
+    """
+    global _model
+    from .models import ArticleFeedEntry
+    with _model_lock:
+        model = _model
+        version = bump_version(VERSION_TAG)
+        if changed_ids is None or model is None or model.version != version - 1:
+            model = load_model()
+        else:
+            live = set(ArticleFeedEntry.objects.values_list('id', flat=True))
+            known = set(model.positions)
+            # Rows added without a refresh (e.g. rebuild_article_feed) come along too
+            stale = (set(changed_ids) & live) | (live - known)
+            model = model.patch(_documents(ArticleFeedEntry.objects.filter(id__in=stale)), removed=known - live)
+        model.version = version
+        _model = model
+        return model
+
+
+def _links(model, positions, link_model, k):
+    links = []
+    for position in positions:
+        for rank, (target, score) in enumerate(model.top(position, k)):
+            links.append(link_model(
+                source_id=int(model.ids[position]), target_id=int(model.ids[target]), rank=rank, score=score,
+            ))
+    return links
+
+
+def rebuild(k=TOP_K, batch_size=1000):
+    """Refit the model and recompute every article's related list; returns (articles, links)."""
+    from django.db import transaction
+    from .models import RelatedArticle
+    model = _updated_model()
+    links = _links(model, range(len(model)), RelatedArticle, k)
+    with transaction.atomic():
+        RelatedArticle.objects.all().delete()
+        RelatedArticle.objects.bulk_create(links, batch_size=batch_size)
+    response_cache.models_changed(RelatedArticle)
+    return len(model), len(links)
+
+
+def refresh(changes, k=TOP_K):
+    """Update the related lists touched by changed articles.
+
+    ``changes`` is an iterable of (kind, object_id) feed keys; deleted
+    articles are fine (their links are already gone with the feed row).
+    Recomputes the lists of the changed articles, the lists that pointed at
+    them, the lists they now score into, and lists left short by deletions.
+    Returns the number of lists rewritten.
+    """
+    from django.db import transaction
+    from django.db.models import Count, Min, Q
+    from .models import ArticleFeedEntry, RelatedArticle
+
+    keys = Q()
+    for kind, object_id in changes:
+        keys |= Q(kind=kind, object_id=object_id)
+    if not keys:
+        return 0
+    changed_ids = set(ArticleFeedEntry.objects.filter(keys).values_list('id', flat=True))
+
+    model = _updated_model(changed_ids)
+    current = {
+        source_id: (count, threshold)
+        for source_id, count, threshold in RelatedArticle.objects.values('source_id')
+        .annotate(count=Count('id'), threshold=Min('score')).values_list('source_id', 'count', 'threshold')
+    }
+    affected = set(changed_ids)
+    affected.update(RelatedArticle.objects.filter(target_id__in=changed_ids).values_list('source_id', flat=True))
+    affected.update(
+        source_id for source_id, (count, _) in current.items() if count < k
+    )
+    for entry_id in changed_ids:
+        position = model.positions.get(entry_id)
+        if position is None:
+            continue
+        scores = model.scores(position)
+        for other in np.flatnonzero(scores >= MIN_SCORE):
+            other_id = int(model.ids[other])
+            count, threshold = current.get(other_id, (0, 0.0))
+            if count < k or scores[other] > threshold:
+                affected.add(other_id)
+
+    positions = sorted(model.positions[entry_id] for entry_id in affected if entry_id in model.positions)
+    links = _links(model, positions, RelatedArticle, k)
+    with transaction.atomic():
+        RelatedArticle.objects.filter(source_id__in=affected).delete()
+        RelatedArticle.objects.bulk_create(links, batch_size=1000)
+    response_cache.models_changed(RelatedArticle)
+    return len(positions)
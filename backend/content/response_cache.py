@@ -0,0 +1,94 @@
+"""Server-side cache of read-only JSON responses, invalidated by model signals.
+
+@cached_response(Model, ...) stores a view's response bytes per request URL.
+The cache key embeds the version tag (versions.py) of every model the view
+reads; signals.py bumps a model's tag after a transaction that saved,
+deleted or re-linked (m2m) one of its rows commits, so every entry that
+depends on it is rebuilt on its next read. Writers that bypass signals
+(bulk_create/bulk_update, queryset update) call models_changed() themselves.
+
+Views keep @never_cache: browsers and proxies still revalidate every time,
+only the database work is saved. Views that want cheap revalidation instead
+use @cache_control(no_cache=True) with @etag_response outside
+@cached_response, so an unchanged response is answered with a 304.
+"""
+import functools
+import hashlib
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+
+from .versions import get_versions, bump_version
+
+TIMEOUT = 60 * 60
+TAG_PREFIX = 'response:'
+KEY_PREFIX = 'content:response:'
+# Responses worth keeping; errors are always rebuilt
+CACHEABLE_STATUS = (200, 404)
+
+
+def model_tag(model):
+    return TAG_PREFIX + model._meta.label_lower
+
+
+def models_changed(*models):
+    """Drop every cached response that depends on ``models`` once the transaction commits."""
+    tags = {model_tag(model) for model in models}
+
+    def bump():
+        for tag in tags:
+            bump_version(tag)
+
+    transaction.on_commit(bump)
+
+
+def cached_response(*models):
+    """Cache a GET view's responses until one of ``models`` changes."""
+    tags = sorted({model_tag(model) for model in models})
+
+    def decorator(view):
+        name = f"{view.__module__}.{view.__qualname__}"
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            versions = get_versions(tags)
+            # The full URL covers args, the query string and the host that
+            # absolute media URLs are built from
+            raw = '|'.join([name, request.build_absolute_uri(), *(str(versions[tag]) for tag in tags)])
+            key = KEY_PREFIX + hashlib.md5(raw.encode()).hexdigest()
+
+            cached = cache.get(key)
+            if cached is not None:
+                status, content_type, content = cached
+                response = HttpResponse(content, status=status, content_type=content_type)
+                response['X-Response-Cache'] = 'hit'
+                return response
+
+            response = view(request, *args, **kwargs)
+            if response.status_code in CACHEABLE_STATUS and not response.streaming:
+                cache.set(key, (response.status_code, response['Content-Type'], response.content), TIMEOUT)
+                response['X-Response-Cache'] = 'miss'
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def etag_response(view):
+    """Give a GET view's 200 responses a content ETag and answer a matching If-None-Match with 304."""
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = view(request, *args, **kwargs)
+        if request.method not in ('GET', 'HEAD') or response.status_code != 200 or response.streaming:
+            return response
+        etag = quote_etag(hashlib.md5(response.content).hexdigest())
+        response['ETag'] = etag
+        return get_conditional_response(request, etag=etag, response=response)
+
+    return wrapper
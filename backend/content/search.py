@@ -0,0 +1,164 @@
+"""Full-text search over ArticleFeedEntry (title, summary, body text).
+
+PostgreSQL: a stored generated ``search_vector`` tsvector column (weighted
+A/B/C) with a GIN index, queried with ``@@`` and ranked by ``ts_rank_cd``.
+SQLite: an external-content FTS5 table kept in sync by triggers, ranked by
+``bm25``. Both are maintained by the database itself, so every save,
+bulk_create or update reaches the index. Other backends (and a missing
+index) fall back to the ``icontains`` filter.
+
+The index is created by migration 0080 and is not part of Django's model
+state; queries reach it through RawSQL and the postgres search expressions.
+"""
+import re
+
+from django.db import connection
+from django.db.models import FloatField, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, NullIf
+from django.utils.html import escape
+
+TABLE = 'content_articlefeedentry'
+FTS_TABLE = 'content_articlefeedentry_fts'
+PG_CONFIG = 'english'
+
+# Highlight markers; the snippet is HTML-escaped before they become <mark>
+_OPEN, _CLOSE = '\x02', '\x03'
+
+# Longest query honoured; keeps tsquery/MATCH strings small
+MAX_TERMS = 8
+
+_available = None
+
+
+def is_available():
+    """Whether the full-text index exists on this database (checked once per process)."""
+    global _available
+    if _available is None:
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == 'postgresql':
+                    columns = connection.introspection.get_table_description(cursor, TABLE)
+                    _available = any(column.name == 'search_vector' for column in columns)
+                elif connection.vendor == 'sqlite':
+                    _available = FTS_TABLE in connection.introspection.table_names(cursor)
+                else:
+                    _available = False
+        except Exception:
+            return False
+    return _available
+
+
+def query_terms(text):
+    """Word tokens of a user query (punctuation and operators dropped)."""
+    return re.findall(r'\w+', (text or '').lower())[:MAX_TERMS]
+
+
+def _pg_tsquery(terms):
+    # Every term must match; the last one as a prefix for search-as-you-type
+    parts = [f"{term}:*" if i == len(terms) - 1 else term for i, term in enumerate(terms)]
+    return ' & '.join(parts)
+
+
+def _fts5_match(terms):
+    parts = [f'"{term}"*' if i == len(terms) - 1 else f'"{term}"' for i, term in enumerate(terms)]
+    return ' '.join(parts)
+
+
+def _pg_search(terms):
+    """(vector, query) expressions for the generated ``search_vector`` column."""
+    from django.contrib.postgres.search import SearchQuery, SearchVectorField
+
+    vector = RawSQL(f"{TABLE}.search_vector", [], output_field=SearchVectorField())
+    return vector, SearchQuery(_pg_tsquery(terms), config=PG_CONFIG, search_type='raw')
+
+
+def _pg_matches(entries, terms):
+    from django.contrib.postgres.search import SearchVectorExact
+
+    vector, query = _pg_search(terms)
+    return entries.filter(SearchVectorExact(vector, query)), vector, query
+
+
+def _fts5_subquery(select, params, match, output_field):
+    # The FTS5 auxiliary functions only work in a query on the FTS table, so
+    # each row looks up its own index row by rowid
+    return RawSQL(
+        f"SELECT {select} FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = {TABLE}.id",
+        [*params, match], output_field=output_field,
+    )
+
+
+def _fts5_matches(entries, match):
+    return entries.filter(id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]))
+
+
+def ranked(entries, text):
+    """Filter ``entries`` to full-text matches of ``text``, best first.
+
+    Adds ``search_rank`` to each row. Returns None when no full-text index
+    is available. Snippets are left to add_snippets(), which only builds
+    them for the rows actually shown.
+    """
+    terms = query_terms(text)
+    if not terms or not is_available():
+        return None
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import SearchRank
+
+        entries, vector, query = _pg_matches(entries, terms)
+        entries = entries.annotate(search_rank=SearchRank(vector, query, cover_density=True))
+    else:
+        match = _fts5_match(terms)
+        entries = _fts5_matches(entries, match).annotate(
+            # bm25 is lower-is-better; weights follow title > summary > body
+            search_rank=_fts5_subquery(f"-bm25({FTS_TABLE}, 10.0, 4.0, 1.0)", [], match, FloatField()),
+        )
+    return entries.order_by('-search_rank', 'group', '-created_at', '-object_id')
+
+
+def add_snippets(rows, text):
+    """Set ``search_snippet`` on ``rows`` (a page of entries) in one query.
+
+    The snippet is the body text (else the summary) around the matches of
+    ``text``, with the matching words wrapped in the highlight markers;
+    render it with highlight().
+    """
+    rows = list(rows)
+    terms = query_terms(text)
+    snippets = {}
+    if rows and terms and is_available():
+        entries = type(rows[0]).objects.filter(id__in=[row.id for row in rows])
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.search import SearchHeadline
+
+            query = _pg_search(terms)[1]
+            snippet = SearchHeadline(
+                Coalesce(NullIf('body_text', Value('')), 'summary', Value('')), query, config=PG_CONFIG,
+                start_sel=_OPEN, stop_sel=_CLOSE, max_words=30, min_words=12, max_fragments=1,
+            )
+        else:
+            snippet = _fts5_subquery(
+                f"snippet({FTS_TABLE}, -1, %s, %s, '…', 24)", [_OPEN, _CLOSE], _fts5_match(terms), TextField(),
+            )
+        snippets = dict(entries.annotate(search_snippet=snippet).values_list('id', 'search_snippet'))
+    for row in rows:
+        row.search_snippet = snippets.get(row.id) or ''
+    return rows
+
+
+def matching(entries, text):
+    """Filter ``entries`` to full-text matches without ranking (keeps their order)."""
+    terms = query_terms(text)
+    if not terms or not is_available():
+        return None
+    if connection.vendor == 'postgresql':
+        return _pg_matches(entries, terms)[0]
+    return _fts5_matches(entries, _fts5_match(terms))
+
+
+def highlight(snippet):
+    """HTML for a search snippet: escaped text with <mark> around matches."""
+    if not snippet:
+        return ''
+    return escape(snippet).replace(_OPEN, '<mark>').replace(_CLOSE, '</mark>')
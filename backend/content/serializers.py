@@ -0,0 +1,96 @@
+"""Type-aware JSON for HomePageSection and PageSection.
+
+Both section models share one schema, but each ``type`` only uses a few of
+its ~40 columns: a ``rich_text`` section needs ``body``, a ``rich_columns``
+one the title/subtitle/rich triplet of each column its layout shows, and so
+on. Every type keeps ``body``: the frontend hides sections whose body is
+empty. SectionSerializer emits the common fields plus the ones its type uses,
+so homepage and page_detail return the same shape for the same section.
+
+Both endpoints accept sparse fieldsets: ``?fields=title,body`` keeps only
+those fields (``id`` and ``type`` are always sent) and ``?exclude=body``
+drops fields. Sections are loaded with ``.only()`` the columns that can
+still be emitted.
+"""
+
+COMMON_FIELDS = (
+    'id', 'type', 'layout', 'title', 'subtitle', 'anchor_id', 'order',
+    'collapsible', 'background_color', 'text_color', 'columns_count',
+)
+# Sent even when a sparse fieldset leaves them out, so clients can route sections
+ALWAYS_FIELDS = ('id', 'type')
+# Needed to decide what a row emits
+CONTROL_FIELDS = ('id', 'type', 'layout', 'columns_count')
+
+MAX_COLUMNS = 5
+LAYOUT_COLUMNS = {'split': 2, 'grid2': 2, 'grid3': 3, 'grid4': 4, 'grid5': 5}
+COLUMN_PARTS = ('title', 'subtitle', 'rich')
+COLUMN_FIELDS = tuple(
+    f"col{i}_{part}" for i in range(1, MAX_COLUMNS + 1) for part in COLUMN_PARTS
+)
+
+TYPE_FIELDS = {
+    'rich_text': ('body', 'editor_blocks'),
+    'rich_columns': ('body',) + COLUMN_FIELDS,
+    'media': ('body', 'image'),
+    'video': ('body', 'video_url'),
+    'graph': ('body', 'chart_config'),
+    'code': ('body', 'code'),
+    'gallery': ('body', 'media_gallery', 'cta_text', 'cta_url'),
+    'stats': ('body', 'stats'),
+    'editor': ('body', 'editor_blocks'),
+    'cta': ('body', 'cta_text', 'cta_url'),
+}
+# Unknown or legacy types render their body
+DEFAULT_TYPE_FIELDS = ('body',)
+
+FILE_FIELDS = frozenset({'image'})
+SECTION_FIELDS = frozenset(COMMON_FIELDS).union(*TYPE_FIELDS.values())
+
+
+def _names(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+def column_count(section):
+    """How many rich columns the section's layout shows (columns_count wins if larger)."""
+    count = max(LAYOUT_COLUMNS.get(section.layout, 1), section.columns_count or 1)
+    return min(count, MAX_COLUMNS)
+
+
+class SectionSerializer:
+    """Serialize sections of either model; see the module docstring."""
+
+    def __init__(self, get_absolute_url, fields=None, exclude=()):
+        self.get_absolute_url = get_absolute_url
+        wanted = SECTION_FIELDS if fields is None else (set(fields) & SECTION_FIELDS) | set(ALWAYS_FIELDS)
+        self.wanted = frozenset(wanted - (set(exclude) - set(ALWAYS_FIELDS)))
+
+    @classmethod
+    def from_request(cls, request, get_absolute_url):
+        """Serializer for ``?fields=`` / ``?exclude=`` (comma-separated); unknown names are ignored."""
+        fields = _names(request.GET.get('fields')) if 'fields' in request.GET else None
+        return cls(get_absolute_url, fields=fields, exclude=_names(request.GET.get('exclude')))
+
+    def only(self, queryset):
+        """``queryset`` limited to the columns this serializer can emit."""
+        return queryset.only(*sorted(self.wanted | set(CONTROL_FIELDS)))
+
+    def fields_for(self, section):
+        if section.type == 'rich_columns':
+            specific = ('body',) + COLUMN_FIELDS[:column_count(section) * len(COLUMN_PARTS)]
+        else:
+            specific = TYPE_FIELDS.get(section.type, DEFAULT_TYPE_FIELDS)
+        return [name for name in COMMON_FIELDS + specific if name in self.wanted]
+
+    def serialize(self, section):
+        data = {}
+        for name in self.fields_for(section):
+            value = getattr(section, name)
+            if name in FILE_FIELDS:
+                value = self.get_absolute_url(value.url) if value else None
+            data[name] = value
+        return data
+
+    def serialize_many(self, sections):
+        return [self.serialize(section) for section in sections]
@@ -0,0 +1,173 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import (
+    Blog, Category, CompanyCoverageSummary, HomePage, HomePageSection, InsuranceCompany, InsuranceCoverage,
+    MainPage, Page, PageSection, PressItem, PressLogo, SiteConfig, TeamMember,
+)
+from . import coverage_bitmap, coverage_index, feed, related, response_cache, sitemaps, slugs, suggest
+from .deferred import on_commit_batch
+
+
+# ==== Quotes & Companies (State/ZIP coverage) ====
+
+def coverage_changed_on_commit(company_id=None):
+    """Refresh summaries, the coverage index and the bitmap after this transaction.
+
+    Work is coalesced per transaction: a queryset delete of 200 coverage rows
+    sends 200 post_delete signals but triggers a single refresh. ``None``
+    means many companies changed. Bulk writers (bulk_create/bulk_update and
+    queryset update() send no model signals) call this themselves.
+    """
+    # Run after commit so other processes never rebuild from rolled-back rows.
+    on_commit_batch('coverage', _after_coverage_commit, [company_id])
+
+
+def _after_coverage_commit(changes):
+    company_ids = changes - {None}
+    if company_ids:
+        CompanyCoverageSummary.refresh(company_ids)
+    notify_coverage_changed(next(iter(changes)) if len(changes) == 1 else None)
+
+
+def notify_coverage_changed(company_id=None):
+    """Refresh the coverage index and bitmap now; ``None`` means many companies changed.
+
+    Use coverage_changed_on_commit() inside a transaction.
+    """
+    coverage_index.coverage_changed(company_id)
+    try:
+        coverage_bitmap.coverage_changed()
+    except Exception:
+        # The stale file has been removed; quotes falls back to the index
+        pass
+
+
+@receiver([post_save, post_delete], sender=InsuranceCompany)
+def insurance_company_changed(sender, instance, **kwargs):
+    coverage_changed_on_commit(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=InsuranceCoverage)
+def insurance_coverage_changed(sender, instance, **kwargs):
+    coverage_changed_on_commit(instance.company_id)
+
+
+# ==== Article slugs, feed (blogs_list cards), search suggestions and related articles ====
+
+def _article_changed(kind, object_id):
+    # One refresh per transaction, however many articles it saves
+    on_commit_batch('suggest', suggest.articles_changed, [(kind, object_id)])
+    # Related lists are a nicety; a failure is logged, not raised into the save
+    on_commit_batch('related', related.refresh, [(kind, object_id)], robust=True)
+
+
+def _guide_routes_changed(category_ids):
+    # A category gained or lost its article slug, so its sitemap entry moves
+    for category_id in category_ids:
+        _sitemap_changed('guides', category_id)
+
+
+@receiver(post_save, sender=Blog)
+def blog_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _guide_routes_changed(slugs.sync_blog(instance))
+        feed.sync_blog(instance)
+        _article_changed('blog', instance.pk)
+
+
+@receiver(post_delete, sender=Blog)
+def blog_deleted(sender, instance, **kwargs):
+    # The route went with the Blog (CASCADE); a category may claim the slug
+    if instance.slug:
+        _guide_routes_changed(slugs.release(instance.slug))
+    feed.remove_blog(instance.pk)
+    _article_changed('blog', instance.pk)
+
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        slugs.sync_category(instance)
+        feed.sync_category(instance)
+        _article_changed('category', instance.pk)
+
+
+@receiver(post_delete, sender=Category)
+def category_deleted(sender, instance, **kwargs):
+    feed.remove_category(instance.pk)
+    _article_changed('category', instance.pk)
+
+
+@receiver(post_save, sender=MainPage)
+def main_page_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        feed.sync_main_page(instance)
+
+
+@receiver(post_delete, sender=MainPage)
+def main_page_deleted(sender, instance, **kwargs):
+    feed.remove_main_page(instance.pk)
+
+
+# ==== Sitemap chunks ====
+
+def _sitemap_changed(section, pk):
+    transaction.on_commit(lambda: sitemaps.object_changed(section, pk))
+
+
+@receiver([post_save, post_delete], sender=Blog)
+def blog_sitemap_changed(sender, instance, **kwargs):
+    _sitemap_changed('blogs', instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def category_sitemap_changed(sender, instance, **kwargs):
+    _sitemap_changed('guides', instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Page)
+def page_sitemap_changed(sender, instance, **kwargs):
+    _sitemap_changed('pages', instance.pk)
+    # A Page hides the MainPage with the same slug
+    transaction.on_commit(lambda: sitemaps.section_changed('mainpages'))
+
+
+@receiver([post_save, post_delete], sender=MainPage)
+def main_page_sitemap_changed(sender, instance, **kwargs):
+    _sitemap_changed('mainpages', instance.pk)
+
+
+@receiver([post_save, post_delete], sender=TeamMember)
+def team_member_sitemap_changed(sender, instance, **kwargs):
+    _sitemap_changed('team', instance.pk)
+
+
+# ==== Cached API responses (content/response_cache.py) ====
+
+# Models that @cached_response views read and editors change one row at a
+# time. Derived tables written in bulk (ArticleFeedEntry, ArticleSlug,
+# RelatedArticle) are invalidated by their writers.
+RESPONSE_CACHE_MODELS = (
+    Blog, Category, HomePage, HomePageSection, MainPage, Page, PageSection, PressItem, PressLogo, SiteConfig, TeamMember,
+)
+
+
+def content_row_changed(sender, **kwargs):
+    response_cache.models_changed(sender)
+
+
+def content_relation_changed(sender, instance, action, model, **kwargs):
+    if action.startswith('post_'):
+        response_cache.models_changed(type(instance), model)
+
+
+for _model in RESPONSE_CACHE_MODELS:
+    post_save.connect(content_row_changed, sender=_model, dispatch_uid=f'response_cache_save_{_model.__name__}')
+    post_delete.connect(content_row_changed, sender=_model, dispatch_uid=f'response_cache_delete_{_model.__name__}')
+    for _field in _model._meta.many_to_many:
+        m2m_changed.connect(
+            content_relation_changed, sender=_field.remote_field.through,
+            dispatch_uid=f'response_cache_m2m_{_model.__name__}_{_field.name}',
+        )
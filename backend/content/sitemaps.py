@@ -0,0 +1,173 @@
+"""sitemap.xml: a sitemap index over per-section chunks of public URLs.
+
+Each section lists one model at its frontend route. Sections are split into
+chunks by primary-key range (CHUNK_SIZE ids each), so a row always lands in
+the same chunk, no chunk exceeds the protocol's 50,000 URLs, and a change
+only invalidates its own chunk. Chunk XML is cached under version tags
+(versions.py) that signals.py bumps through object_changed(); an uncached
+chunk streams straight from an ``.iterator()`` query and is cached as it
+goes out.
+"""
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Max
+
+from .versions import get_version, bump_version
+
+CHUNK_SIZE = 50000
+CACHE_TIMEOUT = 60 * 60 * 24
+# URLs per streamed piece
+STREAM_BATCH = 500
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+URLSET_OPEN = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_CLOSE = '</urlset>\n'
+
+
+class Section:
+    __slots__ = ('name', 'queryset', 'path')
+
+    def __init__(self, name, queryset, path):
+        self.name = name
+        self.queryset = queryset
+        self.path = path
+
+    def url(self, slug):
+        return settings.SITE_URL + self.path.format(slug=quote(slug))
+
+
+def _blogs():
+    from .models import Blog
+    return Blog.objects.filter(published=True).exclude(slug='')
+
+
+def _guides():
+    from .models import Category
+    # Only categories that own their article slug (see slugs.py)
+    return Category.objects.filter(blog_published=True, slug_route__isnull=False)
+
+
+def _pages():
+    from .models import Page
+    return Page.objects.filter(published=True)
+
+
+def _main_pages():
+    from .models import MainPage, Page
+    # The frontend's /<slug> route serves a Page first
+    return MainPage.objects.exclude(slug__in=Page.objects.filter(published=True).values('slug'))
+
+
+def _team():
+    from .models import TeamMember
+    return TeamMember.objects.filter(published=True).exclude(slug='')
+
+
+SECTIONS = {
+    section.name: section
+    for section in (
+        Section('blogs', _blogs, '/articles/{slug}'),
+        Section('guides', _guides, '/articles/{slug}'),
+        Section('pages', _pages, '/{slug}'),
+        Section('mainpages', _main_pages, '/{slug}'),
+        Section('team', _team, '/team-member/{slug}'),
+    )
+}
+
+INDEX_TAG = 'sitemap'
+
+
+def _section_tag(section):
+    return f"sitemap:{section}"
+
+
+def _chunk_tag(section, chunk):
+    return f"sitemap:{section}:{chunk}"
+
+
+def chunk_of(pk):
+    return pk // CHUNK_SIZE
+
+
+def object_changed(section, pk):
+    """Invalidate the chunk holding ``pk`` (and the index, whose lastmods move)."""
+    bump_version(_chunk_tag(section, chunk_of(pk)))
+    bump_version(INDEX_TAG)
+
+
+def section_changed(section):
+    """Invalidate every chunk of ``section``."""
+    bump_version(_section_tag(section))
+    bump_version(INDEX_TAG)
+
+
+def _lastmod(value):
+    return f"<lastmod>{value.date().isoformat()}</lastmod>" if value else ''
+
+
+def index_xml(chunk_url, origin):
+    """Sitemap index XML; ``chunk_url(section, chunk)`` gives each chunk's absolute URL.
+
+    ``origin`` (scheme and host of those URLs) is part of the cache key, so a
+    host never gets an index pointing at another host.
+    """
+    key = f"sitemap:index:{get_version(INDEX_TAG)}:{origin}"
+    body = cache.get(key)
+    if body is None:
+        parts = [XML_HEADER, '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+        for name, section in SECTIONS.items():
+            chunks = (
+                section.queryset().order_by().annotate(chunk=F('pk') / CHUNK_SIZE)
+                .values('chunk').annotate(lastmod=Max('updated_at')).order_by('chunk')
+            )
+            for row in chunks:
+                parts.append(
+                    f"<sitemap><loc>{escape(chunk_url(name, row['chunk']))}</loc>{_lastmod(row['lastmod'])}</sitemap>\n"
+                )
+        parts.append('</sitemapindex>\n')
+        body = ''.join(parts)
+        cache.set(key, body, CACHE_TIMEOUT)
+    return body
+
+
+def _chunk_key(section, chunk):
+    return "sitemap:chunk:{}:{}:{}:{}".format(
+        section, chunk, get_version(_section_tag(section)), get_version(_chunk_tag(section, chunk)),
+    )
+
+
+def _chunk_rows(section, chunk):
+    return SECTIONS[section].queryset().filter(pk__gte=chunk * CHUNK_SIZE, pk__lt=(chunk + 1) * CHUNK_SIZE)
+
+
+def cached_chunk(section, chunk):
+    return cache.get(_chunk_key(section, chunk))
+
+
+def chunk_exists(section, chunk):
+    """Whether the chunk has any URL; the index never lists empty chunks."""
+    return _chunk_rows(section, chunk).exists()
+
+
+def stream_chunk(section, chunk):
+    """Yield the chunk's urlset XML piece by piece, caching the whole once sent."""
+    key = _chunk_key(section, chunk)
+    spec = SECTIONS[section]
+    rows = _chunk_rows(section, chunk).order_by('pk').values_list('slug', 'updated_at').iterator(chunk_size=2000)
+    sent = [XML_HEADER + URLSET_OPEN]
+    yield sent[0]
+    batch = []
+    for slug, updated_at in rows:
+        batch.append(f"<url><loc>{escape(spec.url(slug))}</loc>{_lastmod(updated_at)}</url>\n")
+        if len(batch) >= STREAM_BATCH:
+            piece = ''.join(batch)
+            batch.clear()
+            sent.append(piece)
+            yield piece
+    piece = ''.join(batch) + URLSET_CLOSE
+    sent.append(piece)
+    yield piece
+    cache.set(key, ''.join(sent), CACHE_TIMEOUT)
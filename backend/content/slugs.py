@@ -0,0 +1,121 @@
+"""Article slug registry: one ArticleSlug row per published Blog and category-as-blog.
+
+/api/blogs/<slug>/ resolves through the unique slug index in one query, and
+new slugs are checked against Blogs and Categories at once. When a published
+Blog and a Category claim the same slug the Blog keeps it, as blog_detail
+always preferred Blogs; Category.clean reports the collision in the admin.
+Unpublished Blogs hold no route, so a draft never hides a live category, and
+a slug freed by unpublishing, renaming or deleting a Blog goes back to the
+category that claims it.
+"""
+import re
+
+# Paths under /api/blogs/ that are routes, not articles
+RESERVED_SLUGS = frozenset({'batch'})
+
+
+def resolve(slug):
+    """The ArticleSlug for ``slug`` with its Blog or Category loaded, or None."""
+    from .models import ArticleSlug
+    return ArticleSlug.objects.select_related(
+        'blog__category', 'blog__parent_page', 'category__parent_page',
+    ).filter(slug=slug).first()
+
+
+def next_free_slug(candidate, blog_id=None):
+    """``candidate`` or its first free ``-N`` variant, in a single query.
+
+    Taken are the registry's slugs and every Blog's, published or not (the
+    Blog.slug column is unique). ``blog_id`` is the Blog being saved; its own
+    slug does not count as taken.
+    """
+    from .models import ArticleSlug, Blog
+    routes = ArticleSlug.objects.filter(slug__startswith=candidate)
+    blogs = Blog.objects.filter(slug__startswith=candidate)
+    if blog_id is not None:
+        routes = routes.exclude(blog_id=blog_id)
+        blogs = blogs.exclude(pk=blog_id)
+    taken = routes.order_by().values_list('slug', flat=True).union(
+        blogs.order_by().values_list('slug', flat=True),
+    )
+    suffix = re.compile(rf'^{re.escape(candidate)}(?:-(\d+))?$')
+    used = {0} if candidate in RESERVED_SLUGS else set()
+    for slug in taken:
+        match = suffix.match(slug)
+        if match:
+            used.add(int(match.group(1)) if match.group(1) else 0)
+    if 0 not in used:
+        return candidate
+    i = 1
+    while i in used:
+        i += 1
+    return f"{candidate}-{i}"
+
+
+def slug_owner(slug, blog_id=None, category_id=None):
+    """The ArticleSlug holding ``slug`` for another article, or None."""
+    from .models import ArticleSlug
+    owners = ArticleSlug.objects.filter(slug=slug)
+    if blog_id is not None:
+        owners = owners.exclude(blog_id=blog_id)
+    if category_id is not None:
+        owners = owners.exclude(category_id=category_id)
+    return owners.first()
+
+
+def sync_blog(blog):
+    """Give a published Blog its route; returns the ids of categories whose route changed."""
+    from .models import ArticleSlug
+    old = ArticleSlug.objects.filter(blog=blog).values_list('slug', flat=True).first()
+    changed = []
+    if blog.published and blog.slug:
+        if blog.slug != old:
+            # The Blog wins a slug a category still holds
+            displaced = ArticleSlug.objects.filter(slug=blog.slug, category__isnull=False)
+            changed.extend(displaced.values_list('category_id', flat=True))
+            displaced.delete()
+        ArticleSlug.objects.update_or_create(blog=blog, defaults={'slug': blog.slug})
+    else:
+        ArticleSlug.objects.filter(blog=blog).delete()
+    if old and old != (blog.slug if blog.published else None):
+        changed.extend(release(old))
+    return changed
+
+
+def release(slug):
+    """Hand a slug no Blog routes any more to the published category claiming it.
+
+    Call after a Blog gives ``slug`` up (unpublished, renamed or deleted).
+    Returns the ids of categories whose route changed.
+    """
+    from .models import Category
+    changed = []
+    for category in Category.objects.filter(slug=slug, blog_published=True).order_by('id'):
+        sync_category(category)
+        changed.append(category.pk)
+    return changed
+
+
+def sync_category(category):
+    from .models import ArticleSlug
+    route = ArticleSlug.objects.filter(category=category)
+    if not (category.blog_published and category.slug) or slug_owner(category.slug, category_id=category.pk):
+        # Not an article, or a Blog already owns the slug
+        route.delete()
+    else:
+        ArticleSlug.objects.update_or_create(category=category, defaults={'slug': category.slug})
+
+
+def rebuild(slug_model, blog_model, category_model, batch_size=500):
+    """Recreate the registry (published Blogs first, then published categories by id); returns the row count."""
+    slug_model.objects.all().delete()
+    routes = {}
+    for blog_id, slug in blog_model.objects.filter(published=True).order_by('id').values_list('id', 'slug'):
+        if slug:
+            routes.setdefault(slug, slug_model(slug=slug, blog_id=blog_id))
+    categories = category_model.objects.filter(blog_published=True).order_by('id').values_list('id', 'slug')
+    for category_id, slug in categories:
+        if slug:
+            routes.setdefault(slug, slug_model(slug=slug, category_id=category_id))
+    slug_model.objects.bulk_create(routes.values(), batch_size=batch_size)
+    return len(routes)
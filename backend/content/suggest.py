@@ -0,0 +1,164 @@
+"""In-process prefix index of article titles for search-bar suggestions.
+
+Every word of every published Blog / category-as-blog title goes into one
+sorted token list; a keystroke is a few bisects plus a set intersection, with
+no database query. The index is built on first use and patched per article
+from signals.py; other processes notice the version bump and rebuild (see
+versions.py).
+"""
+import bisect
+import re
+import threading
+
+from .versions import get_version, bump_version
+
+VERSION_TAG = 'suggest'
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+
+
+def tokenize(text):
+    return re.findall(r'\w+', (text or '').lower())
+
+
+class Suggestion:
+    __slots__ = ('key', 'title', 'slug', 'kind', 'title_lower', 'tokens')
+
+    def __init__(self, key, title, slug, kind):
+        self.key = key
+        self.title = title
+        self.slug = slug
+        self.kind = kind
+        self.title_lower = title.lower()
+        self.tokens = tokenize(title)
+
+
+def _load_suggestions(kind=None, object_id=None):
+    from .models import ArticleFeedEntry
+
+    rows = ArticleFeedEntry.objects.all()
+    if kind is not None:
+        rows = rows.filter(kind=kind, object_id=object_id)
+    return {
+        (kind, object_id): Suggestion((kind, object_id), title, slug, kind)
+        for kind, object_id, title, slug in rows.values_list('kind', 'object_id', 'title', 'slug')
+        if title
+    }
+
+
+class SuggestIndex:
+    def __init__(self, suggestions, version=None):
+        self.version = version
+        self._suggestions = suggestions
+        self._lock = threading.Lock()
+        self._compiled = None
+
+    @classmethod
+    def build(cls, version=None):
+        return cls(_load_suggestions(), version=version)
+
+    def patch(self, kind, object_id):
+        """Reload one article (or drop it if it is gone/unpublished)."""
+        loaded = _load_suggestions(kind, object_id)
+        with self._lock:
+            key = (kind, object_id)
+            if key in loaded:
+                self._suggestions[key] = loaded[key]
+            else:
+                self._suggestions.pop(key, None)
+            self._compiled = None
+
+    def _compile(self):
+        pairs = sorted(
+            (token, key)
+            for key, suggestion in self._suggestions.items()
+            for token in set(suggestion.tokens)
+        )
+        return [token for token, _ in pairs], [key for _, key in pairs], dict(self._suggestions)
+
+    def _tokens(self):
+        compiled = self._compiled
+        if compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = self._compile()
+                compiled = self._compiled
+        return compiled
+
+    def _keys_with_prefix(self, tokens, keys, prefix, exact=False):
+        if exact:
+            lo, hi = bisect.bisect_left(tokens, prefix), bisect.bisect_right(tokens, prefix)
+        else:
+            lo = bisect.bisect_left(tokens, prefix)
+            hi = bisect.bisect_left(tokens, prefix + '\U0010ffff')
+        return set(keys[lo:hi])
+
+    def suggest(self, query, limit=DEFAULT_LIMIT):
+        """Top ``limit`` suggestions whose titles contain every query word.
+
+        The last word matches as a prefix (the user is still typing it).
+        Titles starting with the query rank first, then earlier matches,
+        then shorter titles.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        tokens, keys, suggestions = self._tokens()
+        matched = None
+        for i, term in enumerate(terms):
+            found = self._keys_with_prefix(tokens, keys, term, exact=i < len(terms) - 1)
+            matched = found if matched is None else matched & found
+            if not matched:
+                return []
+
+        needle = ' '.join(terms)
+        ranked = sorted(
+            (suggestions[key] for key in matched),
+            key=lambda s: (
+                not s.title_lower.startswith(needle),
+                s.title_lower.find(terms[0]),
+                len(s.title),
+                s.title_lower,
+            ),
+        )
+        return ranked[:limit]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_suggest_index():
+    """Return an up-to-date index, or None when it cannot be built."""
+    global _index
+    try:
+        version = get_version(VERSION_TAG)
+        index = _index
+        if index is None or index.version != version:
+            with _index_lock:
+                index = _index
+                if index is None or index.version != version:
+                    index = SuggestIndex.build(version)
+                    _index = index
+        return index
+    except Exception:
+        return None
+
+
+def articles_changed(changes):
+    """Publish a new suggest version and patch the local index.
+
+    ``changes`` is an iterable of (kind, object_id) feed keys.
+    """
+    global _index
+    version = bump_version(VERSION_TAG)
+    with _index_lock:
+        index = _index
+        if index is None or index.version != version - 1:
+            return
+        try:
+            for kind, object_id in changes:
+                index.patch(kind, object_id)
+            index.version = version
+        except Exception:
+            _index = None
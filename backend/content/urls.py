@@ -10,10 +10,19 @@ urlpatterns = [
     path('categories/', views.categories_for_page, name='categories_for_page'),
     path('categories/all/', views.categories_api, name='categories_api'),
     path('blogs/', views.blogs_list, name='blogs_list'),
+    path('blogs/batch/', views.blogs_batch, name='blogs_batch'),
     path('blogs/<slug:slug>/', views.blog_detail, name='blog_detail'),
+    path('search/suggest/', views.search_suggest, name='search_suggest'),
     path('pages-with-categories/', views.pages_with_categories, name='pages_with_categories'),
+    path('layout/', views.layout, name='layout'),
+    path('batch/', views.api_batch, name='batch'),
     path('contact/submit/', views.contact_submit, name='contact_submit'),
     path('quotes/', views.quotes, name='quotes'),
+    path('quotes/bulk/', views.quotes_bulk, name='quotes_bulk'),
+    path('quotes/state/<str:code>/', views.quotes_by_state, name='quotes_by_state'),
+    path('quotes/click/<int:company_id>/', views.quote_click, name='quote_click'),
+    path('quotes/cache-stats/', views.quotes_cache_stats, name='quotes_cache_stats'),
+    path('companies/<slug:slug>/', views.company_detail, name='company_detail'),
     path('main-page/<slug:slug>/', views.main_page_detail, name='main_page_detail'),
     path('page/<slug:slug>/', views.page_detail, name='page_detail'),
     path('team-member/<slug:slug>/', views.team_member_detail, name='team_member_detail'),
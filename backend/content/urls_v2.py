@@ -0,0 +1,9 @@
+from django.urls import path
+from . import api_v2
+
+urlpatterns = [
+    path('articles/', api_v2.articles, name='v2_articles'),
+    path('articles/<slug:slug>/', api_v2.article_detail, name='v2_article_detail'),
+    path('pages/<slug:slug>/', api_v2.page_detail, name='v2_page_detail'),
+    path('team-members/<slug:slug>/', api_v2.team_member_detail, name='v2_team_member_detail'),
+]
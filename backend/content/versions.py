@@ -0,0 +1,53 @@
+"""Version counters used to invalidate derived data across processes.
+
+Each tag is an integer in a ContentVersion row. Writers bump the tag when the
+rows behind it change; readers remember the value they built against and
+rebuild when it moves. A bump is an UPDATE ... value + 1 read back inside the
+same transaction, so two concurrent bumps always return different values and
+the "patch when I hold version - 1" logic of the in-process indexes stays
+sound. Cache entries keyed on these versions can live in a per-process cache.
+"""
+import time
+
+from django.db import transaction
+from django.db.models import F
+
+
+def _initial_value():
+    # Seed from the clock so a counter that was dropped never comes back with
+    # a value some reader already built against.
+    return int(time.time() * 1000)
+
+
+def _create(tags):
+    from .models import ContentVersion
+    ContentVersion.objects.bulk_create(
+        [ContentVersion(tag=tag, value=_initial_value()) for tag in tags], ignore_conflicts=True,
+    )
+
+
+def get_version(tag):
+    return get_versions([tag])[tag]
+
+
+def bump_version(tag):
+    from .models import ContentVersion
+    counter = ContentVersion.objects.filter(tag=tag)
+    with transaction.atomic():
+        # The UPDATE holds the row lock until commit, so the value read back is ours
+        if not counter.update(value=F('value') + 1):
+            _create([tag])
+            counter.update(value=F('value') + 1)
+        return counter.values_list('value', flat=True).get()
+
+
+def get_versions(tags):
+    """{tag: version} for several tags with a single query."""
+    from .models import ContentVersion
+    tags = list(tags)
+    found = dict(ContentVersion.objects.filter(tag__in=tags).values_list('tag', 'value'))
+    missing = [tag for tag in tags if tag not in found]
+    if missing:
+        _create(missing)
+        found.update(ContentVersion.objects.filter(tag__in=missing).values_list('tag', 'value'))
+    return {tag: found[tag] for tag in tags}
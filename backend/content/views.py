@@ -1,42 +1,57 @@
-from django.http import JsonResponse, HttpResponse
-from django.views.decorators.cache import never_cache
+from django.http import JsonResponse, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.views.decorators.cache import cache_control, never_cache
 from django.views.decorators.csrf import csrf_exempt
-from django.db.models import Q
+from django.db.models import Q, Count, Exists, OuterRef
 from django.core.paginator import Paginator
+from django.core.files.storage import default_storage
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 from django.template.loader import render_to_string
-from .models import Blog, SiteConfig, HomePage, HomePageSection, MainPage, Category, Page, PageSection, PressLogo, TeamMember, ContactMessage
+from django.urls import reverse
+from .models import ArticleFeedEntry, ArticleSlug, Blog, SiteConfig, HomePage, HomePageSection, MainPage, Category, RelatedArticle, Page, PageSection, PressLogo, PressItem, TeamMember, ContactMessage
+from .coverage_bitmap import get_coverage_bitmap
+from .coverage_index import get_coverage_index
+from .slugs import resolve as resolve_slug
+from . import batch, feed, quote_cache, search as fulltext, sitemaps
+from .suggest import DEFAULT_LIMIT as SUGGEST_DEFAULT_LIMIT, MAX_LIMIT as SUGGEST_MAX_LIMIT, get_suggest_index
+from .quote_events import record_click, record_impressions
+from .response_cache import cached_response, etag_response
+from .serializers import SectionSerializer
 import json
 
+def _footer_address_payload(load_site_config):
+    """Footer address: the latest article's, else SiteConfig's (``load_site_config()``)."""
+    article_with_address = Blog.objects.filter(
+        footer_address__isnull=False,
+        footer_address__gt=''
+    ).order_by('-created_at').first()
+
+    if article_with_address:
+        return {
+            'address': article_with_address.footer_address,
+            'source': 'article',
+            'article_title': article_with_address.title
+        }
+
+    site_config = load_site_config()
+    if site_config and site_config.company_address:
+        return {
+            'address': site_config.company_address,
+            'source': 'site_config',
+            'article_title': 'Site Configuration'
+        }
+
+    return {
+        'address': '',
+        'source': 'none',
+        'article_title': ''
+    }
+
 # Footer address function
+@cached_response(Blog, SiteConfig)
 def get_footer_address(request):
     try:
-        article_with_address = Blog.objects.filter(
-            footer_address__isnull=False,
-            footer_address__gt=''
-        ).order_by('-created_at').first()
-        
-        if article_with_address:
-            return JsonResponse({
-                'address': article_with_address.footer_address,
-                'source': 'article',
-                'article_title': article_with_address.title
-            })
-        
-        site_config = SiteConfig.objects.first()
-        if site_config and site_config.company_address:
-            return JsonResponse({
-                'address': site_config.company_address,
-                'source': 'site_config',
-                'article_title': 'Site Configuration'
-            })
-        
-        return JsonResponse({
-            'address': '',
-            'source': 'none',
-            'article_title': ''
-        })
+        return JsonResponse(_footer_address_payload(SiteConfig.objects.first))
     except Exception as e:
         return JsonResponse({
             'error': str(e),
@@ -46,6 +61,7 @@ def get_footer_address(request):
         }, status=500)
 
 @never_cache
+@cached_response(HomePage, HomePageSection, PressLogo)
 def homepage(request):
     try:
         homepage_config = HomePage.objects.first()
@@ -59,41 +75,10 @@ def homepage(request):
                 return relative_url
             return request.build_absolute_uri(relative_url)
         
-        sections = []
-        for section in HomePageSection.objects.filter(homepage=homepage_config).order_by('order'):
-            section_data = {
-                'id': section.id,
-                'type': section.type,
-                'layout': section.layout,
-                'title': section.title,
-                'subtitle': section.subtitle,
-                'anchor_id': section.anchor_id,
-                'background_color': section.background_color,
-                'text_color': section.text_color,
-            }
-            
-            if section.type == 'rich_text':
-                section_data['body'] = section.body
-            elif section.type == 'rich_columns':
-                section_data.update({
-                    'col1_title': section.col1_title,
-                    'col1_subtitle': section.col1_subtitle,
-                    'col1_rich': section.col1_rich,
-                    'col2_title': section.col2_title,
-                    'col2_subtitle': section.col2_subtitle,
-                    'col2_rich': section.col2_rich,
-                    'col3_title': section.col3_title,
-                    'col3_subtitle': section.col3_subtitle,
-                    'col3_rich': section.col3_rich,
-                    'col4_title': section.col4_title,
-                    'col4_subtitle': section.col4_subtitle,
-                    'col4_rich': section.col4_rich,
-                    'col5_title': section.col5_title,
-                    'col5_subtitle': section.col5_subtitle,
-                    'col5_rich': section.col5_rich,
-                })
-            
-            sections.append(section_data)
+        serializer = SectionSerializer.from_request(request, get_absolute_url)
+        sections = serializer.serialize_many(
+            serializer.only(HomePageSection.objects.filter(homepage=homepage_config).order_by('order'))
+        )
 
         # Fetch PressLogos
         press_logos_data = []
@@ -117,13 +102,39 @@ def homepage(request):
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+def _site_config_payload(config, get_absolute_url):
+    if not config:
+        return {}
+    return {
+        'brand_name': config.brand_name,
+        'hero_title': config.hero_title,
+        'tagline': config.tagline,
+        'email': config.email,
+        'phone_number': config.phone_number,
+        'disclaimer': config.disclaimer,
+        'logo_url': get_absolute_url(config.logo.url) if config.logo else None,
+        'logo_icon_url': get_absolute_url(config.logo_icon.url) if config.logo_icon else None,
+        'favicon_url': get_absolute_url(config.favicon.url) if config.favicon else None,
+        'logo_height_px': config.logo_height_px,
+        'accent_orange_hex': config.accent_orange_hex,
+        'accent_orange_hover_hex': config.accent_orange_hover_hex,
+        'accent_gradient_from_hex': config.accent_gradient_from_hex,
+        'accent_gradient_to_hex': config.accent_gradient_to_hex,
+        'facebook_url': config.facebook_url,
+        'twitter_url': config.twitter_url,
+        'instagram_url': config.instagram_url,
+        'youtube_url': config.youtube_url,
+        'linkedin_url': config.linkedin_url,
+        'copyright_text': config.copyright_text,
+        'footer_about_text': config.footer_about_text,
+        'company_address': config.company_address,
+        'updated_at': config.updated_at
+    }
+
 @never_cache
+@cached_response(SiteConfig)
 def site_config(request):
     try:
-        config = SiteConfig.objects.first()
-        if not config:
-            return JsonResponse({})
-        
         def get_absolute_url(relative_url):
             if not relative_url:
                 return None
@@ -131,63 +142,51 @@ def site_config(request):
                 return relative_url
             return request.build_absolute_uri(relative_url)
 
-        return JsonResponse({
-            'brand_name': config.brand_name,
-            'hero_title': config.hero_title,
-            'tagline': config.tagline,
-            'email': config.email,
-            'phone_number': config.phone_number,
-            'disclaimer': config.disclaimer,
-            'logo_url': get_absolute_url(config.logo.url) if config.logo else None,
-            'logo_icon_url': get_absolute_url(config.logo_icon.url) if config.logo_icon else None,
-            'favicon_url': get_absolute_url(config.favicon.url) if config.favicon else None,
-            'logo_height_px': config.logo_height_px,
-            'accent_orange_hex': config.accent_orange_hex,
-            'accent_orange_hover_hex': config.accent_orange_hover_hex,
-            'accent_gradient_from_hex': config.accent_gradient_from_hex,
-            'accent_gradient_to_hex': config.accent_gradient_to_hex,
-            'facebook_url': config.facebook_url,
-            'twitter_url': config.twitter_url,
-            'instagram_url': config.instagram_url,
-            'youtube_url': config.youtube_url,
-            'linkedin_url': config.linkedin_url,
-            'copyright_text': config.copyright_text,
-            'footer_about_text': config.footer_about_text,
-            'company_address': config.company_address,
-            'updated_at': config.updated_at
-        })
+        return JsonResponse(_site_config_payload(SiteConfig.objects.first(), get_absolute_url))
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+def _header_pages():
+    """MainPages shown in the navbar, in menu order."""
+    return MainPage.objects.filter(show_in_header=True).order_by('order')
+
+def _main_pages_payload(pages):
+    return {
+        'pages': [{
+            'name': p.name,
+            'slug': p.slug,
+            'has_dropdown': p.has_dropdown,
+            'meta_title': p.meta_title,
+            'meta_description': p.meta_description,
+            'meta_keywords': p.meta_keywords,
+        } for p in pages]
+    }
+
 @never_cache
+@cached_response(MainPage)
 def main_pages(request):
     try:
-        pages = MainPage.objects.filter(show_in_header=True).order_by('order')
-        return JsonResponse({
-            'pages': [{
-                'name': p.name,
-                'slug': p.slug,
-                'has_dropdown': p.has_dropdown,
-                'meta_title': p.meta_title,
-                'meta_description': p.meta_description,
-                'meta_keywords': p.meta_keywords,
-            } for p in pages]
-        })
+        return JsonResponse(_main_pages_payload(_header_pages()))
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+def _menu_footer_payload():
+    # Fetch ALL published pages regardless of show_in_footer setting, both
+    # columns in one query
+    pages = Page.objects.filter(
+        page_type__in=('company', 'legal'), published=True
+    ).only('title', 'slug', 'page_type').order_by('footer_order', 'title')
+    columns = {'company': [], 'legal': []}
+    for p in pages:
+        # Map 'title' to 'name' for frontend compatibility
+        columns[p.page_type].append({'name': p.title, 'slug': p.slug})
+    return columns
+
 @never_cache
+@cached_response(Page)
 def menu_footer(request):
     try:
-        # Fetch ALL published pages regardless of show_in_footer setting
-        company_pages = Page.objects.filter(page_type='company', published=True).order_by('footer_order', 'title')
-        legal_pages = Page.objects.filter(page_type='legal', published=True).order_by('footer_order', 'title')
-        
-        return JsonResponse({
-            # Map 'title' to 'name' for frontend compatibility
-            'company': [{'name': p.title, 'slug': p.slug} for p in company_pages],
-            'legal': [{'name': p.title, 'slug': p.slug} for p in legal_pages]
-        })
+        return JsonResponse(_menu_footer_payload())
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
@@ -196,6 +195,7 @@ def categories_for_page(request):
     return JsonResponse({'categories': []})
 
 @never_cache
+@cached_response(Category, MainPage)
 def categories_api(request):
     try:
         cats = Category.objects.all()
@@ -211,6 +211,7 @@ def categories_api(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 @never_cache
+@cached_response(ArticleFeedEntry, Blog, Category, MainPage)
 def blogs_list(request):
     try:
         page = int(request.GET.get('page', 1))
@@ -218,50 +219,17 @@ def blogs_list(request):
         search = request.GET.get('search', '')
         category_slug = request.GET.get('category', '')
         parent_page_slug = request.GET.get('parent_page', '')
-        
-        # 1. Fetch Blogs
-        blog_query = Q(published=True)
-        if search:
-            blog_query &= Q(title__icontains=search) | Q(summary__icontains=search)
+
+        # Blogs and categories-as-blogs share one denormalized card table
+        # (ArticleFeedEntry): categories first as "pillar" guides, then blogs
+        # newest first, filtered and paged in SQL.
+        entries = ArticleFeedEntry.objects.all()
         if category_slug:
-            blog_query &= Q(category__slug=category_slug)
+            # A Category doesn't belong to another Category
+            entries = entries.filter(kind=ArticleFeedEntry.KIND_BLOG, category_slug=category_slug)
         if parent_page_slug:
-            blog_query &= Q(parent_page__slug=parent_page_slug)
-            
-        blogs = list(Blog.objects.filter(blog_query).order_by('-created_at'))
-
-        # 2. Fetch Categories (that act as Blogs)
-        # Only include categories if we are NOT filtering by a specific category
-        # (Because a Category doesn't belong to another Category)
-        # OR if the user is searching (we want to find matching categories)
-        cats = []
-        if not category_slug or search:
-            cat_query = Q(blog_published=True)
-            if search:
-                cat_query &= Q(name__icontains=search) | Q(blog_title__icontains=search) | Q(blog_summary__icontains=search)
-            if parent_page_slug:
-                cat_query &= Q(parent_page__slug=parent_page_slug)
-            
-            # If filtering by category, strictly we shouldn't show other categories.
-            # But if searching, we might match a category name.
-            if category_slug:
-                 # If filtering by category, we usually don't show categories unless... 
-                 # maybe we skip adding categories to the list if a category filter is active.
-                 # Let's respect the "Not filtering by category" rule for now.
-                 cat_query &= Q(slug=category_slug) # Only show the category itself if it matches?
-
-            if not category_slug:
-                cats = list(Category.objects.filter(cat_query))
-        
-        # 3. Combine
-        # We want Categories to appear as "Featured" or "Pillar" content, perhaps at the top?
-        # Since they don't have created_at, we can't easily interleave by date.
-        # Let's prepend them.
-        combined_items = cats + blogs
-        
-        paginator = Paginator(combined_items, page_size)
-        page_obj = paginator.get_page(page)
-        
+            entries = entries.filter(parent_page_slug=parent_page_slug)
+
         def get_absolute_url(relative_url):
             if not relative_url:
                 return None
@@ -269,35 +237,39 @@ def blogs_list(request):
                 return relative_url
             return request.build_absolute_uri(relative_url)
 
+        cursor_mode = 'cursor' in request.GET
+        ranked = None
+        if search:
+            # Full-text index when available, else the plain substring filter.
+            # Page mode orders matches by relevance; cursor mode keeps the
+            # listing order.
+            matched = fulltext.matching(entries, search)
+            if matched is None:
+                entries = entries.filter(search_text__icontains=search)
+            else:
+                if not cursor_mode:
+                    ranked = fulltext.ranked(entries, search)
+                entries = matched
+
+        facets = _feed_facets(entries, request.GET.get('facets', ''))
+
+        if cursor_mode:
+            return _blogs_list_by_cursor(request, entries, page_size, get_absolute_url, facets)
+
+        paginator = Paginator(ranked if ranked is not None else entries.order_by(*feed.ORDERING), page_size)
+        page_obj = paginator.get_page(page)
+
+        rows = list(page_obj)
+        if ranked is not None:
+            fulltext.add_snippets(rows, search)
         results = []
-        for item in page_obj:
-            if isinstance(item, Blog):
-                results.append({
-                    'id': item.id,
-                    'title': item.title,
-                    'slug': item.slug,
-                    'summary': item.summary,
-                    'hero_image': get_absolute_url(item.hero_image.url) if item.hero_image else None,
-                    'category': item.category.name if item.category else None,
-                    'created_at': item.created_at
-                })
-            elif isinstance(item, Category):
-                 # Map Category to Blog-like structure
-                 results.append({
-                    'id': f"cat-{item.id}",
-                    'title': item.blog_title or item.name,
-                    'slug': item.slug,
-                    'summary': item.blog_summary,
-                    # Categories might not have a hero image field on the model directly (unless added)
-                    # For now send None or maybe check if there's an author image we can abuse? No.
-                    'hero_image': None, 
-                    'category': "Guide", # Label them as Guides or similar? Or just use their own name?
-                    # Since they ARE the category, maybe label them with their Parent Page?
-                    'category_label': item.parent_page.name if item.parent_page else "Guide",
-                    'created_at': None # No date
-                })
+        for entry in rows:
+            card = _feed_entry_card(entry, get_absolute_url)
+            if ranked is not None:
+                card['snippet'] = fulltext.highlight(entry.search_snippet)
+            results.append(card)
 
-        return JsonResponse({
+        data = {
             'blogs': results,
             'pagination': {
                 'total_count': paginator.count,
@@ -306,32 +278,310 @@ def blogs_list(request):
                 'has_next': page_obj.has_next(),
                 'has_previous': page_obj.has_previous()
             }
-        })
+        }
+        if facets is not None:
+            data['facets'] = facets
+        return JsonResponse(data)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+FEED_FACETS = ('parent_page', 'category')
+
+def _feed_facets(entries, requested):
+    """Counts per parent page and category for the filtered feed, in one GROUP BY.
+
+    ``requested`` is the ?facets= value: a comma-separated subset of
+    FEED_FACETS, or "1"/"all" for every facet. Returns None when empty.
+    """
+    requested = [name.strip() for name in requested.split(',') if name.strip()]
+    if not requested:
+        return None
+    names = FEED_FACETS if any(name in ('1', 'true', 'all') for name in requested) else [
+        name for name in FEED_FACETS if name in requested
+    ]
+    facets = {name: {} for name in names}
+    rows = entries.order_by().values(
+        'kind', 'parent_page_slug', 'parent_page_name', 'category_slug', 'category_name',
+    ).annotate(count=Count('id'))
+    for row in rows:
+        if 'parent_page' in facets and row['parent_page_slug']:
+            bucket = facets['parent_page'].setdefault(
+                row['parent_page_slug'], {'slug': row['parent_page_slug'], 'name': row['parent_page_name'], 'count': 0},
+            )
+            bucket['count'] += row['count']
+        # ?category= only lists blogs, so category guides are not counted here
+        if 'category' in facets and row['kind'] == ArticleFeedEntry.KIND_BLOG and row['category_slug']:
+            bucket = facets['category'].setdefault(
+                row['category_slug'], {'slug': row['category_slug'], 'name': row['category_name'], 'count': 0},
+            )
+            bucket['count'] += row['count']
+    return {
+        name: sorted(buckets.values(), key=lambda b: (-b['count'], b['name']))
+        for name, buckets in facets.items()
+    }
+
+# Cursor mode is meant for crawlers; keep each seek bounded
+MAX_CURSOR_PAGE_SIZE = 100
+
+def _blogs_list_by_cursor(request, entries, page_size, get_absolute_url, facets=None):
+    """Keyset pagination for blogs_list (opt in with ?cursor=, empty for the first page).
+
+    Each page seeks past the previous one on the feed listing index instead of
+    OFFSET, so deep pages cost the same as the first. The total is only
+    counted when asked for with ?count=1.
+    """
+    page_size = max(1, min(page_size, MAX_CURSOR_PAGE_SIZE))
+    cursor = request.GET.get('cursor', '')
+    total_count = entries.count() if request.GET.get('count') in ('1', 'true') else None
+    if cursor:
+        try:
+            entries = feed.after_cursor(entries, cursor)
+        except feed.InvalidCursor as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+    rows = list(entries.order_by(*feed.ORDERING)[:page_size + 1])
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+    data = {
+        'blogs': [_feed_entry_card(entry, get_absolute_url) for entry in rows],
+        'pagination': {
+            'cursor': cursor,
+            'next_cursor': feed.encode_cursor(rows[-1]) if has_next else None,
+            'has_next': has_next,
+            'page_size': page_size,
+            'total_count': total_count,
+        }
+    }
+    if facets is not None:
+        data['facets'] = facets
+    return JsonResponse(data)
+
+def _feed_entry_card(entry, get_absolute_url):
+    """Card dict of an ArticleFeedEntry, in the shape blogs_list has always returned."""
+    if entry.kind == ArticleFeedEntry.KIND_BLOG:
+        return {
+            'id': entry.object_id,
+            'title': entry.title,
+            'slug': entry.slug,
+            'summary': entry.summary,
+            'hero_image': get_absolute_url(default_storage.url(entry.image)) if entry.image else None,
+            'category': entry.category_name or None,
+            'created_at': entry.created_at,
+        }
+    return {
+        'id': f"cat-{entry.object_id}",
+        'title': entry.title,
+        'slug': entry.slug,
+        'summary': entry.summary,
+        'hero_image': None,
+        'category': "Guide",
+        'category_label': entry.label or "Guide",
+        'created_at': None,
+    }
+
+@never_cache
+def search_suggest(request):
+    """Title suggestions for the search bar, served from the in-process index."""
+    query = request.GET.get('q', '') or request.GET.get('search', '')
+    try:
+        limit = max(1, min(int(request.GET.get('limit', SUGGEST_DEFAULT_LIMIT)), SUGGEST_MAX_LIMIT))
+    except ValueError:
+        limit = SUGGEST_DEFAULT_LIMIT
+
+    index = get_suggest_index()
+    if index is None:
+        return JsonResponse({'suggestions': [], 'error': 'Suggestions unavailable'}, status=503)
+    return JsonResponse({
+        'suggestions': [
+            {'title': s.title, 'slug': s.slug, 'type': s.kind}
+            for s in index.suggest(query, limit)
+        ],
+    })
+
+def _pages_with_categories_payload(pages):
+    """``pages`` must prefetch 'categories'."""
+    return {
+        'pages': [{
+            'name': p.name,
+            'slug': p.slug,
+            'has_dropdown': p.has_dropdown,
+            'categories': [{
+                'name': c.name,
+                'slug': c.slug
+            } for c in p.categories.all()]
+        } for p in pages]
+    }
+
 @never_cache
+@cached_response(MainPage, Category)
 def pages_with_categories(request):
     try:
         # Use MainPage as it holds the category structure for the navbar
-        pages = MainPage.objects.filter(show_in_header=True).prefetch_related('categories').order_by('order')
-        
+        return JsonResponse(_pages_with_categories_payload(_header_pages().prefetch_related('categories')))
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@cache_control(no_cache=True)
+@etag_response
+@cached_response(SiteConfig, Page, Blog, MainPage, Category)
+def layout(request):
+    """Everything the site chrome (navbar, footer, hero) loads, in one response.
+
+    Same payloads as site-config, menu/footer, footer-address, main-pages and
+    pages-with-categories, built with five queries. Clients revalidate with
+    If-None-Match and get a 304 while nothing has changed.
+    """
+    try:
+        def get_absolute_url(relative_url):
+            if not relative_url:
+                return None
+            if relative_url.startswith('http'):
+                return relative_url
+            return request.build_absolute_uri(relative_url)
+
+        config = SiteConfig.objects.first()
+        header_pages = list(_header_pages().prefetch_related('categories'))
+        return JsonResponse({
+            'site_config': _site_config_payload(config, get_absolute_url),
+            'menu_footer': _menu_footer_payload(),
+            'footer_address': _footer_address_payload(lambda: config),
+            'main_pages': _main_pages_payload(header_pages),
+            'pages_with_categories': _pages_with_categories_payload(header_pages),
+        })
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@csrf_exempt
+@never_cache
+def api_batch(request):
+    """Run several /api/ GETs in one request (see batch.py).
+
+    GET ?path=/api/a/&path=/api/b/ or POST {"paths": [...]}; ``parallel``
+    runs the views on a thread pool. Returns {"responses": {path: {"status",
+    "body"}}} in request order.
+    """
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body or b'{}')
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+        if not isinstance(data, dict):
+            return JsonResponse({'error': 'Expected a JSON object'}, status=400)
+        paths = data.get('paths')
+        parallel = bool(data.get('parallel'))
+    elif request.method == 'GET':
+        paths = request.GET.getlist('path')
+        parallel = request.GET.get('parallel') in ('1', 'true')
+    else:
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        paths = batch.normalize_paths(paths)
+    except batch.BatchError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    try:
+        return JsonResponse({'responses': batch.run(request, paths, parallel=parallel)})
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+RELATED_LIMIT = 3
+
+
+def _related_cards(kind, object_id, parent_page_slug, get_absolute_url):
+    """Related-article cards of one article: precomputed similar articles, else
+    the first same-page siblings in feed order (one indexed query either way)."""
+    links = RelatedArticle.objects.filter(
+        source__kind=kind, source__object_id=object_id,
+    ).select_related('target').order_by('rank')[:RELATED_LIMIT]
+    entries = [link.target for link in links]
+    if not entries and parent_page_slug:
+        entries = ArticleFeedEntry.objects.filter(parent_page_slug=parent_page_slug).exclude(
+            kind=kind, object_id=object_id,
+        ).order_by(*feed.ORDERING)[:RELATED_LIMIT]
+    return [_article_card(entry, get_absolute_url) for entry in entries]
+
+
+def _article_card(entry, get_absolute_url):
+    """Lightweight card of an ArticleFeedEntry, in the shape of blog_detail's related_blogs."""
+    if entry.kind == ArticleFeedEntry.KIND_BLOG:
+        return {
+            'id': entry.object_id,
+            'title': entry.title,
+            'slug': entry.slug,
+            'summary': entry.summary,
+            'hero_image': get_absolute_url(default_storage.url(entry.image)) if entry.image else None,
+            'category': entry.category_name or None,
+            'created_at': entry.created_at.isoformat() if entry.created_at else None,
+        }
+    return {
+        'id': f'cat-{entry.object_id}',
+        'title': entry.title,
+        'slug': entry.slug,
+        'summary': entry.summary or '',
+        'hero_image': None,
+        'category': entry.category_name,
+        'created_at': None,
+    }
+
+
+MAX_BATCH_SLUGS = 50
+
+
+@never_cache
+@cached_response(ArticleSlug, ArticleFeedEntry, Blog, Category, MainPage)
+def blogs_batch(request):
+    """Article cards for several slugs at once: /api/blogs/batch/?slugs=a,b,c.
+
+    Slugs resolve through the ArticleSlug registry like blog_detail, so a
+    Blog and a category-as-blog are both found; two queries regardless of
+    the number of slugs. Cards come back in request order; unknown or
+    unpublished slugs are listed under ``missing``.
+    """
+    try:
+        def get_absolute_url(relative_url):
+            if not relative_url:
+                return None
+            if relative_url.startswith('http'):
+                return relative_url
+            return request.build_absolute_uri(relative_url)
+
+        slugs = []
+        for value in request.GET.getlist('slugs'):
+            for slug in value.split(','):
+                slug = slug.strip()
+                if slug and slug not in slugs:
+                    slugs.append(slug)
+        if len(slugs) > MAX_BATCH_SLUGS:
+            return JsonResponse({'error': f'At most {MAX_BATCH_SLUGS} slugs per request'}, status=400)
+        if not slugs:
+            return JsonResponse({'results': [], 'missing': []})
+
+        owners = {}
+        keys = Q()
+        for slug, blog_id, category_id in ArticleSlug.objects.filter(slug__in=slugs).values_list('slug', 'blog_id', 'category_id'):
+            if blog_id is not None:
+                owners[(ArticleFeedEntry.KIND_BLOG, blog_id)] = slug
+                keys |= Q(kind=ArticleFeedEntry.KIND_BLOG, object_id=blog_id)
+            else:
+                owners[(ArticleFeedEntry.KIND_CATEGORY, category_id)] = slug
+                keys |= Q(kind=ArticleFeedEntry.KIND_CATEGORY, object_id=category_id)
+
+        # The feed only holds published articles
+        cards = {}
+        if owners:
+            for entry in ArticleFeedEntry.objects.filter(keys):
+                cards[owners[(entry.kind, entry.object_id)]] = _article_card(entry, get_absolute_url)
+
         return JsonResponse({
-            'pages': [{
-                'name': p.name,
-                'slug': p.slug,
-                'has_dropdown': p.has_dropdown,
-                'categories': [{
-                    'name': c.name, 
-                    'slug': c.slug
-                } for c in p.categories.all()]
-            } for p in pages]
+            'results': [cards[slug] for slug in slugs if slug in cards],
+            'missing': [slug for slug in slugs if slug not in cards],
         })
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
 # Blog detail API
 @never_cache
+@cached_response(ArticleSlug, Blog, Category, MainPage, RelatedArticle)
 def blog_detail(request, slug):
     try:
         # Build absolute URL for media files
@@ -342,49 +592,21 @@ def blog_detail(request, slug):
                 return relative_url
             return request.build_absolute_uri(relative_url)
         
+        # One indexed lookup finds the Blog or category-as-blog behind the slug
+        route = resolve_slug(slug)
+
         # Try to find in Blog model first
         try:
-            blog = Blog.objects.get(slug=slug, published=True)
-            
-            # Get related content from same parent page
-            related_blogs = []
-            if blog.parent_page:
-                # 1. Fetch related Blogs
-                related_b = Blog.objects.filter(
-                    parent_page=blog.parent_page, 
-                    published=True
-                ).exclude(id=blog.id)
-
-                # 2. Fetch related Categories (acting as blogs)
-                related_c = Category.objects.filter(
-                    parent_page=blog.parent_page,
-                    blog_published=True
-                )
-
-                # Combine and take first 3
-                combined = list(related_b) + list(related_c)
-                for item in combined[:3]:
-                    if isinstance(item, Blog):
-                        related_blogs.append({
-                            'id': item.id,
-                            'title': item.title,
-                            'slug': item.slug,
-                            'summary': item.summary,
-                            'hero_image': get_absolute_url(item.hero_image.url) if item.hero_image else None,
-                            'category': item.category.name if item.category else None,
-                            'created_at': item.created_at.isoformat() if item.created_at else None,
-                        })
-                    elif isinstance(item, Category):
-                        related_blogs.append({
-                            'id': f'cat-{item.id}',
-                            'title': item.blog_title or item.name,
-                            'slug': item.slug,
-                            'summary': item.blog_summary or '',
-                            'hero_image': None,
-                            'category': item.name,
-                            'created_at': None,
-                        })
+            blog = route.blog if route else None
+            if blog is None or not blog.published:
+                raise Blog.DoesNotExist
             
+            # Precomputed similar articles; same-page siblings when there are none
+            related_blogs = _related_cards(
+                ArticleFeedEntry.KIND_BLOG, blog.id,
+                blog.parent_page.slug if blog.parent_page else '', get_absolute_url,
+            )
+
             return JsonResponse({
                 'blog': {
                     'id': blog.id,
@@ -392,7 +614,10 @@ def blog_detail(request, slug):
                     'slug': blog.slug,
                     'summary': blog.summary,
                     'content': blog.content,
-                    'content_html': blog.content,
+                    'content_html': blog.content_rendered or blog.content,
+                    'toc': blog.content_toc if blog.content_rendered else None,
+                    'word_count': blog.word_count,
+                    'reading_time': blog.reading_time,
                     'hero_image': get_absolute_url(blog.hero_image.url) if blog.hero_image else None,
                     'category': blog.category.name if blog.category else None,
                     'category_slug': blog.category.slug if blog.category else None,
@@ -415,47 +640,16 @@ def blog_detail(request, slug):
             })
         except Blog.DoesNotExist:
             # Try to find in Category inline blogs
-            category = Category.objects.get(slug=slug, blog_published=True)
-            
-            # Get related content from same parent page
-            related_blogs = []
-            if category.parent_page:
-                # 1. Fetch related Blogs
-                related_b = Blog.objects.filter(
-                    parent_page=category.parent_page, 
-                    published=True
-                )
-
-                # 2. Fetch related Categories (acting as blogs)
-                related_c = Category.objects.filter(
-                    parent_page=category.parent_page,
-                    blog_published=True
-                ).exclude(id=category.id)
-
-                # Combine and take first 3
-                combined = list(related_b) + list(related_c)
-                for item in combined[:3]:
-                    if isinstance(item, Blog):
-                        related_blogs.append({
-                            'id': item.id,
-                            'title': item.title,
-                            'slug': item.slug,
-                            'summary': item.summary,
-                            'hero_image': get_absolute_url(item.hero_image.url) if item.hero_image else None,
-                            'category': item.category.name if item.category else None,
-                            'created_at': item.created_at.isoformat() if item.created_at else None,
-                        })
-                    elif isinstance(item, Category):
-                        related_blogs.append({
-                            'id': f'cat-{item.id}',
-                            'title': item.blog_title or item.name,
-                            'slug': item.slug,
-                            'summary': item.blog_summary or '',
-                            'hero_image': None,
-                            'category': item.name,
-                            'created_at': None,
-                        })
+            category = route.category if route else None
+            if category is None or not category.blog_published:
+                raise Category.DoesNotExist
             
+            # Precomputed similar articles; same-page siblings when there are none
+            related_blogs = _related_cards(
+                ArticleFeedEntry.KIND_CATEGORY, category.id,
+                category.parent_page.slug if category.parent_page else '', get_absolute_url,
+            )
+
             return JsonResponse({
                 'blog': {
                     'id': f'cat-{category.id}',
@@ -463,7 +657,10 @@ def blog_detail(request, slug):
                     'slug': category.slug,
                     'summary': category.blog_summary or '',
                     'content': category.blog_content or '',
-                    'content_html': category.blog_content or '',
+                    'content_html': category.blog_content_rendered or category.blog_content or '',
+                    'toc': category.blog_content_toc if category.blog_content_rendered else None,
+                    'word_count': category.blog_word_count,
+                    'reading_time': category.blog_reading_time,
                     'hero_image': None,
                     'category': category.name,
                     'category_slug': category.slug,
@@ -524,35 +721,30 @@ def quotes(request):
         
         raw_zip = request.GET.get('zip', '')
         zip_code = ''.join(ch for ch in str(raw_zip) if ch.isdigit())[:5]
-        
-        # Optimize query with prefetch_related to avoid N+1 problem
-        companies_qs = InsuranceCompany.objects.filter(published=True).prefetch_related('coverages').order_by('-rating', 'name')
-        
+
+        cache_key = quote_cache.cache_key(request, zip_code if len(zip_code) == 5 else '')
+        payload = quote_cache.lookup(cache_key)
+        if payload is not None:
+            record_impressions(zip_code, [company['id'] for company in payload['companies']])
+            return JsonResponse({**payload, 'zip': zip_code})
+
+        companies_qs = InsuranceCompany.objects.filter(published=True).order_by('-rating', 'name')
+
         filtered_companies = []
         if len(zip_code) == 5:
-            for company in companies_qs:
+            # Fast path: shared mmap bitmap when it is at the current coverage
+            # version, then the in-process interval index
+            index = get_coverage_bitmap() or get_coverage_index()
+            if index is not None:
+                company_ids = index.lookup(zip_code)
+                if company_ids:
+                    filtered_companies = list(companies_qs.filter(id__in=company_ids))
+            else:
                 try:
-                    covs = list(getattr(company, 'coverages').all())
+                    filtered_companies = _match_companies_by_zip_ranges(companies_qs, zip_code)
                 except Exception:
-                    covs = []
-                
-                # Fallback: If company has NO specific coverage rules (no InsuranceCoverage objects),
-                # treat it as "National" and show it for all ZIPs.
-                if not covs:
-                    filtered_companies.append(company)
-                    continue
-
-                matches = False
-                for cov in covs:
-                    try:
-                        if cov.matches_zip(zip_code):
-                            matches = True
-                            break
-                    except Exception:
-                        continue
-                if matches:
-                    filtered_companies.append(company)
-            
+                    filtered_companies = _match_companies_by_loop(companies_qs, zip_code)
+
             # Soft Fail / Fallback:
             # If strict ZIP filtering returns NO results, show all companies
             # so the user doesn't see a blank page.
@@ -560,32 +752,15 @@ def quotes(request):
                 filtered_companies = list(companies_qs)
         else:
             filtered_companies = list(companies_qs)
-        
-        companies_data = []
-        for company in filtered_companies:
-            logo_url = None
-            if company.logo:
-                try:
-                    logo_url = request.build_absolute_uri(company.logo.url)
-                except Exception:
-                    pass
-
-            companies_data.append({
-                'id': company.id,
-                'name': company.name,
-                'slug': company.slug,
-                'logo': logo_url,
-                'headline': company.headline,
-                'features': company.features,
-                'cta_text': company.cta_text,
-                'short_description': company.short_description,
-                'rating': float(company.rating) if company.rating else None,
-                'domain_url': company.domain_url,
-                'landing_url': company.landing_url,
-                'short_url': company.short_url,
-                'contact_url': company.contact_url,
-            })
-        
+
+        companies_data = [_company_data(request, company, zip_code) for company in filtered_companies]
+        quote_cache.store(cache_key, {
+            'ok': True,
+            'companies': companies_data,
+            'count': len(companies_data),
+        })
+        record_impressions(zip_code, [company['id'] for company in companies_data])
+
         return JsonResponse({
             'ok': True,
             'companies': companies_data,
@@ -602,6 +777,232 @@ def quotes(request):
         })
 
 @never_cache
+def quotes_by_state(request, code):
+    """Companies available anywhere in a state, for state landing pages."""
+    try:
+        from .models import InsuranceCompany, US_STATES
+
+        code = code.upper()
+        state_name = dict(US_STATES).get(code)
+        if state_name is None:
+            return JsonResponse({'ok': False, 'error': 'Unknown state'}, status=404)
+
+        companies_qs = InsuranceCompany.objects.filter(published=True).order_by('-rating', 'name')
+        index = get_coverage_index()
+        if index is not None:
+            company_ids, statewide_ids = index.lookup_state(code)
+            companies = list(companies_qs.filter(id__in=company_ids)) if company_ids else []
+        else:
+            companies = list(companies_qs.filter(
+                Q(coverages__state_code=code) | Q(coverages__isnull=True)
+            ).distinct())
+            statewide_ids = set(companies_qs.filter(
+                Q(coverages__state_code=code, coverages__covers_entire_state=True) | Q(coverages__isnull=True)
+            ).values_list('id', flat=True))
+
+        companies_data = [
+            {**_company_data(request, company), 'covers_entire_state': company.id in statewide_ids}
+            for company in companies
+        ]
+        return JsonResponse({
+            'ok': True,
+            'state': code,
+            'state_name': state_name,
+            'companies': companies_data,
+            'count': len(companies_data),
+        })
+    except Exception as e:
+        return JsonResponse({'ok': False, 'error': str(e)}, status=500)
+
+@never_cache
+def quote_click(request, company_id):
+    """Record a click on a quote result and redirect to the company's landing page."""
+    from .models import InsuranceCompany
+
+    company = InsuranceCompany.objects.filter(id=company_id, published=True).only('landing_url', 'domain_url').first()
+    target = company and (company.landing_url or company.domain_url)
+    if not target:
+        return JsonResponse({'error': 'Company not found'}, status=404)
+
+    zip_code = ''.join(ch for ch in str(request.GET.get('zip', '')) if ch.isdigit())[:5]
+    record_click(zip_code, company.id)
+    return HttpResponseRedirect(target)
+
+@never_cache
+def company_detail(request, slug):
+    """Company card plus its materialized coverage summary."""
+    try:
+        from .models import InsuranceCompany
+
+        company = InsuranceCompany.objects.select_related('coverage_summary').filter(slug=slug, published=True).first()
+        if company is None:
+            return JsonResponse({'error': 'Company not found'}, status=404)
+
+        summary = getattr(company, 'coverage_summary', None)
+        return JsonResponse({
+            'ok': True,
+            'company': _company_data(request, company),
+            'coverage': {
+                'states': summary.states if summary else [],
+                'statewide_states': summary.statewide_states if summary else [],
+                'states_count': summary.states_count if summary else 0,
+                'zip_count': summary.zip_count if summary else 0,
+                'zip_ranges': [
+                    f"{start:05d}" if start == end else f"{start:05d}-{end:05d}"
+                    for start, end in (summary.zip_ranges if summary else [])
+                ],
+                'updated_at': summary.updated_at.isoformat() if summary else None,
+            },
+        })
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@never_cache
+def quotes_cache_stats(request):
+    """Hit/miss counters of the per-ZIP quotes result cache."""
+    try:
+        return JsonResponse({'ok': True, **quote_cache.stats()})
+    except Exception as e:
+        return JsonResponse({'ok': False, 'error': str(e)}, status=500)
+
+# Upper bound on ZIPs accepted by one bulk quotes request
+MAX_BULK_QUOTE_ZIPS = 10000
+
+@csrf_exempt
+@never_cache
+def quotes_bulk(request):
+    """Match many ZIPs at once for partner lead feeds.
+
+    POST {"zips": ["10001", "75001", ...]} and receive the matching company
+    IDs per ZIP plus one de-duplicated company table. Unlike `quotes`, a ZIP
+    with no coverage returns an empty list (no show-all fallback).
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+    raw_zips = data.get('zips') if isinstance(data, dict) else None
+    if not isinstance(raw_zips, list):
+        return JsonResponse({'error': 'Expected a "zips" list'}, status=400)
+    if len(raw_zips) > MAX_BULK_QUOTE_ZIPS:
+        return JsonResponse({'error': f'At most {MAX_BULK_QUOTE_ZIPS} ZIPs per request'}, status=400)
+
+    try:
+        from .models import InsuranceCompany
+
+        zips, invalid = [], []
+        for raw in raw_zips:
+            zip_code = ''.join(ch for ch in str(raw) if ch.isdigit())[:5]
+            if len(zip_code) == 5:
+                zips.append(zip_code)
+            else:
+                invalid.append(raw)
+        zips = list(dict.fromkeys(zips))
+
+        index = get_coverage_index()
+        if index is None:
+            return JsonResponse({'ok': False, 'error': 'Coverage index unavailable'}, status=503)
+        matches = index.lookup_many([int(z) for z in zips])
+
+        matched_ids = set().union(*matches) if matches else set()
+        companies = list(
+            InsuranceCompany.objects.filter(published=True, id__in=matched_ids).order_by('-rating', 'name')
+        )
+        rank = {company.id: i for i, company in enumerate(companies)}
+
+        # ZIPs in the same segment share one set object; order each set once
+        ordered = {}
+        results = {}
+        for zip_code, company_ids in zip(zips, matches):
+            key = id(company_ids)
+            if key not in ordered:
+                ordered[key] = sorted((cid for cid in company_ids if cid in rank), key=rank.__getitem__)
+            results[zip_code] = ordered[key]
+
+        return JsonResponse({
+            'ok': True,
+            'results': results,
+            'companies': [_company_data(request, company) for company in companies],
+            'invalid': invalid,
+            'count': len(results),
+        })
+    except Exception as e:
+        return JsonResponse({'ok': False, 'error': str(e)}, status=500)
+
+def _company_data(request, company, zip_code=''):
+    logo_url = None
+    if company.logo:
+        try:
+            logo_url = request.build_absolute_uri(company.logo.url)
+        except Exception:
+            pass
+
+    # Outbound links go through quote_click so the click is logged
+    click_url = request.build_absolute_uri(reverse('quote_click', args=[company.id]))
+    if zip_code:
+        click_url += f'?zip={zip_code}'
+
+    return {
+        'id': company.id,
+        'name': company.name,
+        'slug': company.slug,
+        'logo': logo_url,
+        'headline': company.headline,
+        'features': company.features,
+        'cta_text': company.cta_text,
+        'short_description': company.short_description,
+        'rating': float(company.rating) if company.rating else None,
+        'domain_url': company.domain_url,
+        'landing_url': company.landing_url,
+        'short_url': company.short_url,
+        'contact_url': company.contact_url,
+        'click_url': click_url,
+    }
+
+def _match_companies_by_zip_ranges(companies_qs, zip_code):
+    """Resolve covering companies in one query using the normalized ZIP-range table."""
+    from .models import InsuranceCoverage, InsuranceCoverageZipRange
+
+    z = int(zip_code)
+    in_range = InsuranceCoverageZipRange.objects.filter(company=OuterRef('pk'), start__lte=z, end__gte=z)
+    # Companies without any coverage rows are treated as "National"
+    has_rules = InsuranceCoverage.objects.filter(company=OuterRef('pk'))
+    return list(companies_qs.filter(Exists(in_range) | ~Exists(has_rules)))
+
+def _match_companies_by_loop(companies_qs, zip_code):
+    """Slow path: evaluate every coverage row with InsuranceCoverage.matches_zip."""
+    filtered_companies = []
+    # Optimize query with prefetch_related to avoid N+1 problem
+    for company in companies_qs.prefetch_related('coverages'):
+        try:
+            covs = list(getattr(company, 'coverages').all())
+        except Exception:
+            covs = []
+
+        # Fallback: If company has NO specific coverage rules (no InsuranceCoverage objects),
+        # treat it as "National" and show it for all ZIPs.
+        if not covs:
+            filtered_companies.append(company)
+            continue
+
+        matches = False
+        for cov in covs:
+            try:
+                if cov.matches_zip(zip_code):
+                    matches = True
+                    break
+            except Exception:
+                continue
+        if matches:
+            filtered_companies.append(company)
+    return filtered_companies
+
+@never_cache
+@cached_response(MainPage)
 def main_page_detail(request, slug):
     try:
         page = MainPage.objects.get(slug=slug)
@@ -622,6 +1023,7 @@ def main_page_detail(request, slug):
         return JsonResponse({'error': str(e)}, status=500)
 
 @never_cache
+@cached_response(TeamMember, Page)
 def team_member_detail(request, slug):
     try:
         member = TeamMember.objects.get(slug=slug, published=True)
@@ -659,6 +1061,7 @@ def team_member_detail(request, slug):
         return JsonResponse({'error': str(e)}, status=500)
 
 @never_cache
+@cached_response(Page, PageSection, TeamMember, PressItem)
 def page_detail(request, slug):
     try:
         page = Page.objects.get(slug=slug, published=True)
@@ -696,39 +1099,10 @@ def page_detail(request, slug):
                 'date': item.date,
             })
         
-        sections_data = []
-        for section in page.sections.all().order_by('order'):
-            sections_data.append({
-                'id': section.id,
-                'title': section.title,
-                'subtitle': section.subtitle,
-                'anchor_id': section.anchor_id,
-                'order': section.order,
-                'collapsible': section.collapsible,
-                'background_color': section.background_color,
-                'text_color': section.text_color,
-                'type': section.type,
-                'layout': section.layout,
-                'columns_count': section.columns_count,
-                'body': section.body,
-                'col1_title': section.col1_title,
-                'col1_subtitle': section.col1_subtitle,
-                'col1_rich': section.col1_rich,
-                'col2_title': section.col2_title,
-                'col2_subtitle': section.col2_subtitle,
-                'col2_rich': section.col2_rich,
-                'col3_title': section.col3_title,
-                'col3_subtitle': section.col3_subtitle,
-                'col3_rich': section.col3_rich,
-                'col4_title': section.col4_title,
-                'col4_subtitle': section.col4_subtitle,
-                'col4_rich': section.col4_rich,
-                'col5_title': section.col5_title,
-                'col5_subtitle': section.col5_subtitle,
-                'col5_rich': section.col5_rich,
-                'image': get_absolute_url(section.image.url) if section.image else None,
-                'video_url': section.video_url,
-            })
+        serializer = SectionSerializer.from_request(request, get_absolute_url)
+        sections_data = serializer.serialize_many(
+            serializer.only(PageSection.objects.filter(page=page).order_by('order'))
+        )
 
         return JsonResponse({
             'meta': {
@@ -756,3 +1130,29 @@ def demo_page(request):
     """Demo page to showcase the blue footer form design"""
     html_content = render_to_string('demo.html', {'title': 'Blue Footer Form Demo'})
     return HttpResponse(html_content)
+
+
+SITEMAP_CONTENT_TYPE = 'application/xml; charset=utf-8'
+
+
+def sitemap_index(request):
+    """/sitemap.xml: index of the per-section sitemap chunks (see content/sitemaps.py)."""
+    def chunk_url(section, chunk):
+        return request.build_absolute_uri(reverse('sitemap_chunk', args=[section, chunk]))
+
+    origin = f"{request.scheme}://{request.get_host()}"
+    return HttpResponse(sitemaps.index_xml(chunk_url, origin), content_type=SITEMAP_CONTENT_TYPE)
+
+
+def sitemap_chunk(request, section, chunk):
+    """/sitemap-<section>-<chunk>.xml: one chunk's urlset, cached or streamed."""
+    if section not in sitemaps.SECTIONS:
+        return HttpResponse(status=404)
+    chunk = int(chunk)
+    body = sitemaps.cached_chunk(section, chunk)
+    if body is not None:
+        return HttpResponse(body, content_type=SITEMAP_CONTENT_TYPE)
+    if not sitemaps.chunk_exists(section, chunk):
+        # Past the end of the section (or emptied since the index was read)
+        return HttpResponse(status=404)
+    return StreamingHttpResponse(sitemaps.stream_chunk(section, chunk), content_type=SITEMAP_CONTENT_TYPE)
@@ -0,0 +1,25 @@
+import { getApiBase } from '../../lib/config.js';
+
+export const dynamic = 'force-dynamic';
+
+export async function POST(req) {
+  const API_BASE = getApiBase();
+  try {
+    const body = await req.text();
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), 15000);
+    const res = await fetch(`${API_BASE}/api/batch/`, {
+      method: 'POST',
+      cache: 'no-store',
+      signal: controller.signal,
+      headers: { 'Content-Type': 'application/json' },
+      body,
+    });
+    clearTimeout(timer);
+    const json = await res.json();
+    return Response.json(json, { status: res.status });
+  } catch (e) {
+    console.error('batch upstream error:', e?.message || e);
+    return Response.json({ error: 'Error', responses: {} }, { status: 502 });
+  }
+}
@@ -0,0 +1,20 @@
+import { getApiBase } from '../../../lib/config.js';
+
+export const dynamic = 'force-dynamic';
+
+export async function GET(req) {
+  const API_BASE = getApiBase();
+  const inParams = req?.nextUrl?.searchParams || new URLSearchParams();
+  const slugs = inParams.getAll('slugs').join(',');
+  if (!slugs.trim()) {
+    return Response.json({ results: [], missing: [] }, { status: 200 });
+  }
+  try {
+    const res = await fetch(`${API_BASE}/api/blogs/batch/?slugs=${encodeURIComponent(slugs)}`, { cache: 'no-store' });
+    const json = await res.json();
+    return Response.json(json, { status: res.status });
+  } catch (e) {
+    console.error('blogs batch upstream error:', e?.message || e);
+    return Response.json({ results: [], missing: [] }, { status: 200 });
+  }
+}
@@ -0,0 +1,64 @@
+import { createHash } from 'crypto';
+import { getApiBase, getMediaUrl } from '../../lib/config.js';
+
+export const dynamic = 'force-dynamic';
+
+// Same shape the individual endpoints fall back to
+const FALLBACK = {
+  site_config: { brand_name: 'Site', favicon_url: null, updated_at: null },
+  menu_footer: { company: [], legal: [] },
+  footer_address: { address: '', source: 'none', article_title: '' },
+  main_pages: { pages: [] },
+  pages_with_categories: { pages: [] },
+};
+
+function etagMatches(ifNoneMatch, etag) {
+  if (!ifNoneMatch) return false;
+  return ifNoneMatch.split(',').some((tag) => {
+    const value = tag.trim();
+    return value === '*' || value.replace(/^W\//, '') === etag;
+  });
+}
+
+export async function GET(req) {
+  const API_BASE = getApiBase();
+  const ifNoneMatch = req?.headers?.get('if-none-match');
+  try {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), 10000);
+    // The body is rewritten below, so the backend's ETag does not describe
+    // what the browser gets; always take the full (server-cached) layout
+    const res = await fetch(`${API_BASE}/api/layout/`, {
+      cache: 'no-store',
+      signal: controller.signal,
+    });
+    clearTimeout(timer);
+    if (!res.ok) {
+      return Response.json(FALLBACK, { status: 200 });
+    }
+    const json = await res.json();
+    // Normalize media fields like /api/site-config does
+    const config = json.site_config || {};
+    const favRaw = config.favicon || config.favicon_url || config.faviconUrl || null;
+    const logoRaw = config.logo_url || config.logoUrl || config.logo || null;
+    const body = JSON.stringify({
+      ...FALLBACK,
+      ...json,
+      site_config: {
+        ...config,
+        favicon_url: favRaw ? getMediaUrl(favRaw) : null,
+        logo_url: logoRaw ? getMediaUrl(logoRaw) : null,
+      },
+    });
+    // ETag of the body actually sent, so an unchanged layout costs a 304
+    const etag = `"${createHash('sha1').update(body).digest('hex')}"`;
+    const headers = { 'Cache-Control': 'no-cache', ETag: etag };
+    if (etagMatches(ifNoneMatch, etag)) {
+      return new Response(null, { status: 304, headers });
+    }
+    return new Response(body, { headers: { ...headers, 'Content-Type': 'application/json' } });
+  } catch (e) {
+    console.error('layout upstream error:', e?.message || e);
+    return Response.json(FALLBACK, { status: 200 });
+  }
+}
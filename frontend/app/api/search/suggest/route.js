@@ -0,0 +1,28 @@
+import { getApiBase } from '../../../lib/config.js';
+
+export const dynamic = 'force-dynamic';
+
+export async function GET(req) {
+  const API_BASE = getApiBase();
+  try {
+    const inParams = req?.nextUrl?.searchParams || new URLSearchParams();
+    const outParams = new URLSearchParams();
+    const q = inParams.get('q') || inParams.get('search');
+    if (q) outParams.set('q', String(q));
+    const limit = inParams.get('limit');
+    if (limit && /^\d+$/.test(String(limit))) outParams.set('limit', String(limit));
+
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), 5000);
+    const res = await fetch(`${API_BASE}/api/search/suggest/?${outParams.toString()}`, { cache: 'no-store', signal: controller.signal });
+    clearTimeout(timer);
+    if (!res.ok) {
+      return Response.json({ suggestions: [] }, { status: 200 });
+    }
+    const json = await res.json();
+    return Response.json({ suggestions: Array.isArray(json?.suggestions) ? json.suggestions : [] });
+  } catch (e) {
+    console.error('suggest upstream error:', e?.message || e);
+    return Response.json({ suggestions: [] }, { status: 200 });
+  }
+}
@@ -180,6 +180,16 @@ export default function ArticleClient({ slug }) {
       wrapper.appendChild(clone);
     });
 
+    // Headings already carry ids when the backend rendered the article on save
+    if (Array.isArray(blog.toc)) {
+      blog.toc.forEach((item) => {
+        const el = document.getElementById(item.id);
+        if (el) el.style.scrollMarginTop = "140px";
+      });
+      setToc(blog.toc);
+      return;
+    }
+
     // Function to process headings and generate TOC
     const processHeadings = () => {
       const headings = Array.from(root.querySelectorAll("h2, h3"));
@@ -5,7 +5,8 @@ import gsap from 'gsap';
 import { Twitter, Youtube, Facebook, Instagram, Linkedin, Globe, Shield, Star } from "lucide-react";
 import SmartLink from './SmartLink.jsx';
 import SmartImage from './SmartImage.jsx';
-import { getMediaUrl, getApiBase } from '../lib/config.js';
+import { getMediaUrl } from '../lib/config.js';
+import { getLayout } from '../lib/layout.js';
 
 // Helper functions (resolveHref and FooterCopyright) remain the same.
 
@@ -44,9 +45,8 @@ const Footer = () => {
             const sep = url.includes('?') ? '&' : '?';
             return v ? `${url}${sep}v=${encodeURIComponent(v)}` : url;
         };
-        fetch('/api/site-config/', { cache: 'no-store' })
-            .then(r => r.json())
-            .then(data => {
+        getLayout()
+            .then(({ site_config: data }) => {
                 const bn = (data.brand_name || data.site_name || '').trim();
                 if (bn) setBrandName(bn);
                 if (data.logo_url) setLogoUrl(versioned(getMediaUrl(data.logo_url), data.updated_at));
@@ -81,9 +81,8 @@ const Footer = () => {
 
     // Fetch footer address from articles dynamically
     useEffect(() => {
-        fetch('/api/footer-address/', { cache: 'no-store' })
-            .then(r => r.json())
-            .then(data => {
+        getLayout()
+            .then(({ footer_address: data }) => {
                 if (data.address) {
                     setAddress(data.address);
                     setAddressSource(data.source || '');
@@ -96,9 +95,8 @@ const Footer = () => {
 
     // Fetch footer links (Company, Legal) from admin
     useEffect(() => {
-        fetch(`${getApiBase()}/api/menu/footer/`, { cache: 'no-store' })
-            .then(r => r.json())
-            .then(data => {
+        getLayout()
+            .then(({ menu_footer: data }) => {
                 const company = Array.isArray(data.company) ? data.company : [];
                 const legal = Array.isArray(data.legal) ? data.legal : [];
                 setCompanyLinks(company);
@@ -253,9 +251,8 @@ function resolveHref(item) {
 function FooterCopyright({ brandName }) {
     const [copyright, setCopyright] = React.useState("");
     React.useEffect(() => {
-        fetch('/api/site-config/', { cache: 'no-store' })
-            .then(r => r.json())
-            .then(data => {
+        getLayout()
+            .then(({ site_config: data }) => {
                 const txt = (data.copyright_text || '').trim();
                 if (txt) {
                     setCopyright(txt);
@@ -1,6 +1,7 @@
 "use client";
 
 import React from "react";
+import { getLayout } from "../lib/layout.js";
 // Use native <img> to avoid Next Image private-IP restrictions in dev
 
 const HeroSection = () => {
@@ -9,7 +10,7 @@ const HeroSection = () => {
   const [heroImage, setHeroImage] = React.useState(null);
   React.useEffect(() => {
     Promise.all([
-      fetch('/api/site-config/', { cache: 'no-store' }).then(r => r.json()).catch(() => ({})),
+      getLayout().then(layout => layout.site_config || {}).catch(() => ({})),
       fetch('/api/homepage/', { cache: 'no-store' }).then(r => r.json()).catch(() => ({})),
     ]).then(([cfg, home]) => {
       setTagline(cfg.tagline || "");
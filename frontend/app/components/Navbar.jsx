@@ -7,6 +7,18 @@ import SmartImage from './SmartImage.jsx';
 import SkeletonLoader from './SkeletonLoader.jsx';
 import { gsap } from 'gsap';
 import HardcodedLogo from './HardcodedLogo.jsx';
+import { getLayout } from '../lib/layout.js';
+
+// getLayout() with a short backoff between attempts
+const getLayoutWithRetry = async (retries = 2) => {
+    for (let attempt = 0; attempt < retries; attempt++) {
+        try {
+            return await getLayout();
+        } catch {}
+        await new Promise(r => setTimeout(r, 500 * (attempt + 1)));
+    }
+    return getLayout();
+};
 
 export default function Navbar() {
     const router = useRouter();
@@ -66,17 +78,6 @@ export default function Navbar() {
             return v ? `${url}${sep}v=${encodeURIComponent(v)}` : url;
         };
 
-        const fetchWithRetry = async (url, options = {}, retries = 2) => {
-            for (let attempt = 0; attempt <= retries; attempt++) {
-                try {
-                    const res = await fetch(url, options);
-                    if (res.ok) return res;
-                } catch {}
-                await new Promise(r => setTimeout(r, 500 * (attempt + 1)));
-            }
-            return fetch(url, options).catch(() => ({ ok: false }));
-        };
-
         const updateSiteConfig = (data) => {
             setSiteConfig(data);
             if (data.phone_number) setPhone(data.phone_number);
@@ -93,12 +94,9 @@ export default function Navbar() {
         const fetchSiteConfig = async () => {
             try {
                 if (!cachedConfig) setIsFetching(true);
-                const response = await fetchWithRetry('/api/site-config/', { cache: 'no-store' }, 2);
-                if (response.ok) {
-                    const data = await response.json();
-                    updateSiteConfig(data);
-                    saveCache('navbar_site_config', data);
-                }
+                const data = (await getLayoutWithRetry()).site_config;
+                updateSiteConfig(data);
+                saveCache('navbar_site_config', data);
             } catch (error) {
                 console.error('Error fetching site config:', error);
             } finally {
@@ -125,60 +123,54 @@ export default function Navbar() {
                     setIsFetching(true);
                 }
                 
-                const response = await fetchWithRetry('/api/pages-with-categories/?include_blogs=0', { cache: 'no-store' }, 2);
-                if (response.ok) {
-                    const data = await response.json();
-                    // Transform ALL pages data from database
-                    const rawPages = (data.pages || [])
-                      .map(page => ({
-                        slug: String(page.slug || '').toLowerCase(),
-                        name: page.name,
-                        has_dropdown: !!page.has_dropdown,
-                        dropdownItems: (page.categories || []).map(category => ({
-                          name: category.name,
-                          slug: category.slug,
-                          blogs: []
-                        }))
-                      }));
-
-                    // Desired tabs and order
-                    const orderMap = {
-                      companies: 0,
-                      state: 1,
-                      vehicle: 2,
-                      shopping: 3,
-                      resources: 4,
+                const data = (await getLayoutWithRetry()).pages_with_categories;
+                // Transform ALL pages data from database
+                const rawPages = (data.pages || [])
+                  .map(page => ({
+                    slug: String(page.slug || '').toLowerCase(),
+                    name: page.name,
+                    has_dropdown: !!page.has_dropdown,
+                    dropdownItems: (page.categories || []).map(category => ({
+                      name: category.name,
+                      slug: category.slug,
+                      blogs: []
+                    }))
+                  }));
+
+                // Desired tabs and order
+                const orderMap = {
+                  companies: 0,
+                  state: 1,
+                  vehicle: 2,
+                  shopping: 3,
+                  resources: 4,
+                };
+
+                // Sort pages: known categories first, then others
+                const filtered = rawPages
+                  .sort((a, b) => {
+                    const getOrder = (slug) => {
+                         const key = Object.keys(orderMap).find(k => slug.includes(k));
+                         return key !== undefined ? orderMap[key] : 999;
                     };
-
-                    // Sort pages: known categories first, then others
-                    const filtered = rawPages
-                      .sort((a, b) => {
-                        const getOrder = (slug) => {
-                             const key = Object.keys(orderMap).find(k => slug.includes(k));
-                             return key !== undefined ? orderMap[key] : 999;
-                        };
-                        return getOrder(a.slug) - getOrder(b.slug);
-                      });
-
-                    // Fallback: enforce display labels
-                    const displayName = (p) => {
-                      if (p.slug.includes('companies')) return 'Companies';
-                      if (p.slug.includes('state')) return 'States';
-                      if (p.slug.includes('vehicle')) return 'Vehicles';
-                      if (p.slug.includes('shopping')) return 'Shopping';
-                      if (p.slug.includes('resources')) return 'Resources';
-                      return p.name || '';
-                    };
-
-                    const pages = filtered.map(p => ({ ...p, displayName: displayName(p) }));
-                    
-                    if (pages.length > 0) {
-                        setPagesData(pages);
-                        saveCache('navbar_pages_data', pages);
-                    }
-                } else {
-                    // Only clear if we don't have cache
-                    if (!cachedPages) setPagesData([]);
+                    return getOrder(a.slug) - getOrder(b.slug);
+                  });
+
+                // Fallback: enforce display labels
+                const displayName = (p) => {
+                  if (p.slug.includes('companies')) return 'Companies';
+                  if (p.slug.includes('state')) return 'States';
+                  if (p.slug.includes('vehicle')) return 'Vehicles';
+                  if (p.slug.includes('shopping')) return 'Shopping';
+                  if (p.slug.includes('resources')) return 'Resources';
+                  return p.name || '';
+                };
+
+                const pages = filtered.map(p => ({ ...p, displayName: displayName(p) }));
+                
+                if (pages.length > 0) {
+                    setPagesData(pages);
+                    saveCache('navbar_pages_data', pages);
                 }
             } catch (error) {
                 // Only clear if we don't have cache
@@ -7,6 +7,7 @@ import HelpfulLinks from './HelpfulLinks.jsx';
 import TeamGrid from './TeamGrid.jsx';
 import PressBox from './PressBox.jsx';
 import { getMediaBase } from '../lib/config.js';
+import { batchGet, fetchEach } from '../lib/batch.js';
 
 import SkeletonLoader from './SkeletonLoader.jsx';
 
@@ -23,38 +24,51 @@ export default function PageClient({ slug }) {
         const controller = new AbortController();
         const timer = setTimeout(() => controller.abort(), 15000);
         
-        // Try fetching Page first
-        let res = await fetch(`/api/page/${encodeURIComponent(slug)}`, { cache: 'no-store', signal: controller.signal });
-        
+        // Page, its MainPage fallback and the footer menu in one round trip
+        const pagePath = `/api/page/${encodeURIComponent(slug)}/`;
+        const mainPath = `/api/main-page/${encodeURIComponent(slug)}/`;
+        const menuPath = '/api/menu/footer/';
+        let responses;
+        try {
+          responses = await batchGet([pagePath, mainPath, menuPath], { signal: controller.signal });
+        } catch (err) {
+          if (controller.signal.aborted) throw err;
+          // The batch is only a shortcut; fall back to one request per resource
+          responses = await fetchEach({
+            [pagePath]: `/api/page/${encodeURIComponent(slug)}`,
+            [mainPath]: `/api/main-page/${encodeURIComponent(slug)}`,
+            [menuPath]: '/api/menu/footer/',
+          }, { signal: controller.signal });
+        }
+        const ok = (path) => (responses[path]?.status === 200 ? responses[path].body : null);
+
+        if (!cancelled && ok(menuPath)) setFooterMenu(ok(menuPath));
+
+        // Try the Page first
         let found = false;
-        if (res.ok) {
-          const json = await res.json();
-          // Check if we got a valid page (usually has sections or meta)
-          if (json && (json.sections?.length > 0 || json.meta?.title)) {
-             if (!cancelled) setData(json);
-             found = true;
-          }
+        const json = ok(pagePath);
+        // Check if we got a valid page (usually has sections or meta)
+        if (json && (json.sections?.length > 0 || json.meta?.title)) {
+           if (!cancelled) setData(json);
+           found = true;
         }
         
-        // If not found, try fetching MainPage
+        // If not found, fall back to the MainPage
         if (!found) {
-            const resMain = await fetch(`/api/main-page/${encodeURIComponent(slug)}`, { cache: 'no-store', signal: controller.signal });
-            if (resMain.ok) {
-                const jsonMain = await resMain.json();
-                if (jsonMain && jsonMain.page) {
-                    // Map MainPage to Page structure
-                    const mappedData = {
-                        meta: {
-                            title: jsonMain.page.name,
-                            meta_title: jsonMain.page.meta_title,
-                            meta_description: jsonMain.page.meta_description,
-                            meta_keywords: jsonMain.page.meta_keywords,
-                        },
-                        sections: []
-                    };
-                    if (!cancelled) setData(mappedData);
-                    found = true;
-                }
+            const jsonMain = ok(mainPath);
+            if (jsonMain && jsonMain.page) {
+                // Map MainPage to Page structure
+                const mappedData = {
+                    meta: {
+                        title: jsonMain.page.name,
+                        meta_title: jsonMain.page.meta_title,
+                        meta_description: jsonMain.page.meta_description,
+                        meta_keywords: jsonMain.page.meta_keywords,
+                    },
+                    sections: []
+                };
+                if (!cancelled) setData(mappedData);
+                found = true;
             }
         }
 
@@ -98,20 +112,6 @@ export default function PageClient({ slug }) {
     }
   }, [data?.meta?.meta_title, data?.meta?.title, data?.meta?.meta_description, data?.meta?.description, slug]);
 
-  React.useEffect(() => {
-    let cancelled = false;
-    async function loadMenu() {
-      try {
-        const res = await fetch('/api/menu/footer/', { cache: 'no-store' });
-        if (!res.ok) return;
-        const json = await res.json();
-        if (!cancelled) setFooterMenu(json);
-      } catch {}
-    }
-    loadMenu();
-    return () => { cancelled = true; };
-  }, []);
-
   if (loading) {
     return (
       <main className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-10">
@@ -29,11 +29,11 @@ export default function SearchBar() {
     const controller = new AbortController();
     const t = setTimeout(async () => {
       try {
-        const qs = new URLSearchParams({ search: searchQuery.trim(), limit: '5' }).toString();
-        const res = await fetch(`/api/blogs?${qs}`, { cache: 'no-store', signal: controller.signal });
+        const qs = new URLSearchParams({ q: searchQuery.trim(), limit: '5' }).toString();
+        const res = await fetch(`/api/search/suggest?${qs}`, { cache: 'no-store', signal: controller.signal });
         if (res.ok) {
           const data = await res.json();
-          const list = Array.isArray(data) ? data : data.blogs || [];
+          const list = Array.isArray(data?.suggestions) ? data.suggestions : [];
           setSuggestions(list.slice(0, 5));
           setShowSuggestions(true);
         } else {
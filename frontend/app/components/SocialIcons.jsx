@@ -2,6 +2,7 @@
 
 import { useEffect, useState } from 'react';
 import { FaFacebook, FaTwitter, FaInstagram, FaYoutube, FaLinkedin, FaLink } from 'react-icons/fa';
+import { getLayout } from '../lib/layout.js';
 
 function iconFor(url) {
   try {
@@ -23,9 +24,7 @@ export default function SocialIcons({ className = '', showTitle = true }) {
     let cancelled = false;
     async function load() {
       try {
-        const res = await fetch('/api/site-config/', { cache: 'no-store' });
-        if (!res.ok) return;
-        const json = await res.json();
+        const json = (await getLayout()).site_config;
         const arr = Array.isArray(json?.social_links) ? json.social_links : [];
         if (!cancelled) setLinks(arr);
       } catch {}
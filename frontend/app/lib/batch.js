@@ -0,0 +1,34 @@
+/**
+ * batchGet(['/api/page/about/', '/api/menu/footer/']) runs several backend
+ * GETs through /api/batch/ in one round trip and resolves to
+ * { [path]: { status, body } }.
+ */
+export async function batchGet(paths, { signal, parallel = false } = {}) {
+  const res = await fetch('/api/batch/', {
+    method: 'POST',
+    cache: 'no-store',
+    signal,
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ paths, parallel }),
+  });
+  if (!res.ok) throw new Error(`batch ${res.status}`);
+  const json = await res.json();
+  return json.responses || {};
+}
+
+/**
+ * Fallback for when /api/batch/ fails: fetch each URL on its own and resolve
+ * to the same { [key]: { status, body } } shape. ``urls`` maps the batch
+ * path used as the key to the frontend URL to fetch.
+ */
+export async function fetchEach(urls, { signal } = {}) {
+  const entries = await Promise.all(Object.entries(urls).map(async ([key, url]) => {
+    try {
+      const res = await fetch(url, { cache: 'no-store', signal });
+      return [key, { status: res.status, body: res.ok ? await res.json() : null }];
+    } catch (_) {
+      return [key, { status: 0, body: null }];
+    }
+  }));
+  return Object.fromEntries(entries);
+}
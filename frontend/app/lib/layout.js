@@ -0,0 +1,27 @@
+/**
+ * Shared site-chrome data (navbar, footer, hero).
+ *
+ * Every layout component used to fetch site-config, menu/footer,
+ * footer-address and pages-with-categories on its own. getLayout() loads
+ * them all from /api/layout/ once per page load and shares the result; the
+ * browser revalidates with the response's ETag, so a repeat visit usually
+ * costs a 304.
+ */
+
+let pending = null;
+
+export function getLayout() {
+  if (!pending) {
+    pending = fetch('/api/layout/', { cache: 'no-cache' })
+      .then((res) => {
+        if (!res.ok) throw new Error(`layout ${res.status}`);
+        return res.json();
+      })
+      .catch((err) => {
+        // Let the next caller try again
+        pending = null;
+        throw err;
+      });
+  }
+  return pending;
+}
@@ -212,7 +212,7 @@ export default async function QuotesPage({ searchParams }) {
                   {/* CTA Column */}
                   <div className="w-full md:w-1/4 flex flex-col items-center justify-center space-y-2">
                     <a 
-                        href={company.landing_url || company.domain_url || '#'} 
+                        href={company.click_url || company.landing_url || company.domain_url || '#'} 
                         target="_blank"
                         rel="noopener noreferrer"
                         className="w-full bg-blue-600 hover:bg-blue-700 text-white font-bold py-3 px-4 rounded shadow-sm text-center transition-colors text-lg"